@@ -0,0 +1,280 @@
+# Usage:
+#   CFG_APP__MODE=TEST python -m benchmarks.api_load --resources 10000 --statuses 5000000 --seed-only
+#   CFG_APP__MODE=TEST python -m benchmarks.api_load --skip-seed --concurrency 64
+#   CFG_APP__MODE=TEST python -m benchmarks.api_load --skip-seed --base-url http://127.0.0.1:8888 \
+#       --server-pid $(pgrep -o gunicorn)
+import argparse
+import asyncio
+import os
+import random
+import resource
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Iterator
+
+import asyncpg
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event
+
+from benchmarks.common import (
+    ensure_test_mode,
+    peak_rss_mb,
+    percentile,
+    recreate_tables,
+    write_results,
+)
+from src.config import settings
+from src.db import engine
+from src.schemas.enums import ResourceState
+from src.utils.partitions import get_partition_ddl, get_partition_name, iter_partition_ranges
+
+API_PREFIX = "/api/v1/resources"
+STATUS_COLUMNS = ("resource_id", "response_time", "status_code", "created_at", "updated_at")
+COPY_CHUNK_SIZE = 100_000
+CLOCK_TICKS = os.sysconf("SC_CLK_TCK")
+
+
+def _get_dsn() -> str:
+    return settings.db.DB_URL.replace("postgresql+asyncpg://", "postgresql://")
+
+
+def _iter_status_records(
+    resources: int,
+    statuses: int,
+    history: timedelta,
+    seed: int,
+) -> Iterator[list[tuple]]:
+    rnd = random.Random(seed)
+    now = datetime.now(timezone.utc)
+    step = history / max(statuses // max(resources, 1), 1)
+    chunk: list[tuple] = []
+    for idx in range(statuses):
+        resource_id = idx % resources + 1
+        created_at = now - step * (idx // resources + 1)
+        status_code = 200 if rnd.random() > 0.05 else 500
+        chunk.append(
+            (resource_id, rnd.lognormvariate(-2, 0.5), status_code, created_at, created_at)
+        )
+        if len(chunk) >= COPY_CHUNK_SIZE:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+async def seed(resources: int, statuses: int, history: timedelta, seed: int) -> dict[str, Any]:
+    await recreate_tables()
+
+    start = time.perf_counter()
+    conn = await asyncpg.connect(_get_dsn())
+    try:
+        interval = settings.status_partitions.INTERVAL
+        now = datetime.now(timezone.utc)
+        for part_start, part_end in iter_partition_ranges(now - history, now, interval):
+            name = get_partition_name("resource_status", part_start, interval)
+            await conn.execute(get_partition_ddl("resource_status", name, part_start, part_end))
+
+        await conn.copy_records_to_table(
+            "resource",
+            records=(
+                (f"https://bench-{idx}.example.com/", ResourceState.UP.name)
+                for idx in range(resources)
+            ),
+            columns=("url", "state"),
+        )
+        for chunk in _iter_status_records(resources, statuses, history, seed):
+            await conn.copy_records_to_table(
+                "resource_status",
+                records=chunk,
+                columns=STATUS_COLUMNS,
+            )
+        await conn.execute("ANALYZE resource")
+        await conn.execute("ANALYZE resource_status")
+    finally:
+        await conn.close()
+
+    return {
+        "seeded_resources": resources,
+        "seeded_statuses": statuses,
+        "seed_sec": round(time.perf_counter() - start, 3),
+    }
+
+
+class QueryCounter:
+    def __init__(self) -> None:
+        self.count = 0
+
+    def __call__(self, *args) -> None:
+        self.count += 1
+
+
+def _read_cpu_seconds(pid: int) -> float:
+    # utime and stime are the 14th and 15th fields; the command name may contain spaces.
+    stat = Path(f"/proc/{pid}/stat").read_text()
+    fields = stat.rsplit(")", 1)[1].split()
+    return (int(fields[11]) + int(fields[12])) / CLOCK_TICKS
+
+
+def _iter_process_tree(pid: int) -> Iterator[int]:
+    yield pid
+    for task in Path(f"/proc/{pid}/task").iterdir():
+        children = (task / "children").read_text().split()
+        for child in children:
+            yield from _iter_process_tree(int(child))
+
+
+def get_server_cpu_seconds(server_pid: int | None) -> float:
+    if server_pid is None:
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+        return usage.ru_utime + usage.ru_stime
+
+    total = 0.0
+    for pid in _iter_process_tree(server_pid):
+        try:
+            total += _read_cpu_seconds(pid)
+        except FileNotFoundError:
+            continue
+    return total
+
+
+def get_scenario_path(name: str, resources: int, page_limit: int, rnd: random.Random) -> str:
+    if name == "list":
+        return f"{API_PREFIX}/"
+    resource_id = rnd.randint(1, resources)
+    if name == "detail":
+        return f"{API_PREFIX}/{resource_id}"
+    return f"{API_PREFIX}/{resource_id}/statuses?limit={page_limit}"
+
+
+async def run_scenario(
+    client: AsyncClient,
+    name: str,
+    args: argparse.Namespace,
+    query_counter: QueryCounter | None,
+) -> dict[str, Any]:
+    rnd = random.Random(args.seed)
+    latencies: list[float] = []
+    errors = 0
+    queue: asyncio.Queue[str] = asyncio.Queue()
+    for _ in range(args.requests):
+        queue.put_nowait(get_scenario_path(name, args.resources, args.page_limit, rnd))
+
+    async def worker() -> None:
+        nonlocal errors
+        while not queue.empty():
+            path = queue.get_nowait()
+            start = time.perf_counter()
+            response = await client.get(path)
+            latencies.append(time.perf_counter() - start)
+            if response.status_code != 200:
+                errors += 1
+
+    queries_before = query_counter.count if query_counter else 0
+    cpu_before = get_server_cpu_seconds(args.server_pid)
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+    elapsed = time.perf_counter() - start
+    cpu_used = get_server_cpu_seconds(args.server_pid) - cpu_before
+
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "elapsed_sec": round(elapsed, 3),
+        "rps": round(len(latencies) / elapsed, 2) if elapsed else None,
+        "latency_p50_ms": _ms(percentile(latencies, 50)),
+        "latency_p95_ms": _ms(percentile(latencies, 95)),
+        "latency_p99_ms": _ms(percentile(latencies, 99)),
+        "queries_per_request": (
+            round((query_counter.count - queries_before) / len(latencies), 2)
+            if query_counter and latencies
+            else None
+        ),
+        "server_cpu_sec": round(cpu_used, 3),
+        "server_cpu_per_request_ms": (
+            round(cpu_used * 1000 / len(latencies), 3) if latencies else None
+        ),
+    }
+
+
+def _ms(value: float | None) -> float | None:
+    return round(value * 1000, 3) if value is not None else None
+
+
+async def run_load(args: argparse.Namespace) -> dict[str, Any]:
+    query_counter: QueryCounter | None = None
+    if args.base_url:
+        client = AsyncClient(base_url=args.base_url, timeout=args.timeout)
+    else:
+        # Imported lazily so that a run against gunicorn does not build the app in-process.
+        from src.main import app
+        from src.services.resources import resource_cache
+
+        # The cache is built at import time and always off in TEST mode,
+        # so the flag is applied to the instance.
+        resource_cache.enabled = args.cache
+
+        # The client and the app share a process here, so CPU includes the load generator.
+        query_counter = QueryCounter()
+        event.listen(engine.sync_engine, "before_cursor_execute", query_counter)
+        client = AsyncClient(
+            transport=ASGITransport(app=app),
+            base_url="http://test",
+            timeout=args.timeout,
+        )
+
+    results: dict[str, Any] = {}
+    try:
+        async with client:
+            for name in args.scenarios:
+                results[name] = await run_scenario(client, name, args, query_counter)
+    finally:
+        if query_counter is not None:
+            event.remove(engine.sync_engine, "before_cursor_execute", query_counter)
+    results["peak_rss_mb"] = peak_rss_mb()
+    return results
+
+
+async def main(args: argparse.Namespace) -> None:
+    ensure_test_mode()
+
+    results: dict[str, Any] = {}
+    if not args.skip_seed:
+        history = timedelta(hours=args.history_hours)
+        results.update(await seed(args.resources, args.statuses, history, args.seed))
+    if not args.seed_only:
+        results.update(await run_load(args))
+    write_results("api_load", vars(args), results, args.output)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Read API load test over a seeded status table")
+    parser.add_argument("--resources", type=int, default=10_000)
+    parser.add_argument("--statuses", type=int, default=1_000_000)
+    parser.add_argument("--history-hours", type=int, default=settings.taskiq.UNRELEVANT_STATUS_HOURS)
+    parser.add_argument("--skip-seed", action="store_true", help="reuse previously seeded data")
+    parser.add_argument("--seed-only", action="store_true")
+    parser.add_argument(
+        "--scenarios",
+        nargs="+",
+        choices=("list", "detail", "statuses"),
+        default=["list", "detail", "statuses"],
+    )
+    parser.add_argument("--requests", type=int, default=2000, help="requests per scenario")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--page-limit", type=int, default=settings.app.STATUSES_PAGE_LIMIT)
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="serve in-process reads through Redis cache",
+    )
+    parser.add_argument("--base-url", help="running server, e.g. http://127.0.0.1:8888")
+    parser.add_argument("--server-pid", type=int, help="server pid to sample CPU from /proc")
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="also write the JSON report to this file")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(parse_args()))
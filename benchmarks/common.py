@@ -0,0 +1,67 @@
+import json
+import platform
+import resource
+import subprocess
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Sequence
+
+from src.config import BASE_DIR, settings
+from src.db import engine_null_pool
+from src.models import *  # noqa: F403
+from src.models.base import Base
+
+
+def ensure_test_mode() -> None:
+    # Benchmarks recreate every table, so they must never point at a real database.
+    if settings.app.MODE != "TEST" or settings.db.DB_NAME != settings.db.DB_NAME_TEST:
+        raise SystemExit("Benchmarks run only with CFG_APP__MODE=TEST against a throwaway database")
+
+
+async def recreate_tables() -> None:
+    async with engine_null_pool.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+
+
+def percentile(values: Sequence[float], q: float) -> float | None:
+    if not values:
+        return None
+    ordered = sorted(values)
+    idx = min(len(ordered) - 1, max(0, round(q / 100 * (len(ordered) - 1))))
+    return ordered[idx]
+
+
+def peak_rss_mb() -> float:
+    # ru_maxrss is reported in kilobytes on Linux and in bytes on macOS.
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    divider = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return round(rss / divider, 2)
+
+
+def get_revision() -> str | None:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=BASE_DIR,
+            text=True,
+            stderr=subprocess.DEVNULL,
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def write_results(name: str, params: dict[str, Any], results: dict[str, Any], output: str | None):
+    report = {
+        "benchmark": name,
+        "revision": get_revision(),
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "params": params,
+        "results": results,
+    }
+    payload = json.dumps(report, indent=2)
+    if output:
+        Path(output).write_text(payload + "\n")
+    print(payload)
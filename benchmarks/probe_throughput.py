@@ -0,0 +1,234 @@
+# Usage: CFG_APP__MODE=TEST python -m benchmarks.probe_throughput --resources 2000 --output probe.json
+import argparse
+import asyncio
+import random
+import time
+from typing import Any, AsyncGenerator
+
+from aiohttp import web
+from sqlalchemy import func, select
+
+from benchmarks.common import (
+    ensure_test_mode,
+    peak_rss_mb,
+    percentile,
+    recreate_tables,
+    write_results,
+)
+from src.api.v1.dependencies.db import get_db, get_db_with_null_pool
+from src.config import settings
+from src.db import sessionmaker_null_pool
+from src.models.resoures import ResourceStatus
+from src.schemas.resoures import ResourceAddDTO, ResourceCheckDTO
+from src.services.resources import ResourceService, host_rate_limiter
+from src.tasks.broker import broker
+from src.tasks.dependencies import get_client
+from src.tasks.schedule import check_resources
+from src.utils.db_tools import DBManager
+from src.utils.http_client import create_probe_client
+
+
+class StubBehaviour:
+    def __init__(
+        self,
+        seed: int,
+        latency_ms: float,
+        latency_sigma: float,
+        error_rate: float,
+        hang_rate: float,
+        redirect_rate: float,
+    ) -> None:
+        self.seed = seed
+        self.latency_ms = latency_ms
+        self.latency_sigma = latency_sigma
+        self.error_rate = error_rate
+        self.hang_rate = hang_rate
+        self.redirect_rate = redirect_rate
+
+    def for_endpoint(self, endpoint_id: int) -> tuple[float, str]:
+        # Deterministic per endpoint, so the expected delay is known when results are read.
+        rnd = random.Random(self.seed * 1_000_003 + endpoint_id)
+        delay = rnd.lognormvariate(0, self.latency_sigma) * self.latency_ms / 1000
+        roll = rnd.random()
+        if roll < self.hang_rate:
+            return delay, "hang"
+        if roll < self.hang_rate + self.error_rate:
+            return delay, "error"
+        if roll < self.hang_rate + self.error_rate + self.redirect_rate:
+            return delay, "redirect"
+        return delay, "ok"
+
+
+def create_stub_app(behaviour: StubBehaviour) -> web.Application:
+    async def handle(request: web.Request) -> web.StreamResponse:
+        endpoint_id = int(request.match_info["endpoint_id"])
+        delay, kind = behaviour.for_endpoint(endpoint_id)
+        if kind == "hang":
+            await asyncio.sleep(settings.probe_client.TOTAL_TIMEOUT * 2)
+        await asyncio.sleep(delay)
+        if kind == "error":
+            return web.Response(status=500)
+        if kind == "redirect":
+            raise web.HTTPFound(f"/final/{endpoint_id}")
+        return web.Response(text="ok")
+
+    async def handle_final(request: web.Request) -> web.StreamResponse:
+        return web.Response(text="ok")
+
+    app = web.Application()
+    app.router.add_route("*", "/r/{endpoint_id}", handle)
+    app.router.add_route("*", "/final/{endpoint_id}", handle_final)
+    return app
+
+
+async def seed_resources(base_url: str, count: int) -> None:
+    async with DBManager(session_factory=sessionmaker_null_pool) as db:
+        await db.resources.add_bulk(
+            [ResourceAddDTO(url=f"{base_url}/r/{idx}") for idx in range(count)],
+            returning=False,
+        )
+        await db.commit()
+
+
+async def run_broker_path() -> None:
+    await check_resources.kiq()  # type: ignore[call-arg]
+
+
+async def run_service_path(client, workers: int) -> None:
+    async with DBManager(session_factory=sessionmaker_null_pool) as db:
+        resources = await db.resources.get_all()
+
+    batch_size = max(settings.taskiq.CHECK_BATCH_SIZE, 1)
+    batches = [
+        [
+            ResourceCheckDTO(
+                resource_id=resource.id,
+                url=str(resource.url),
+                state=resource.state,
+                probe_method=resource.probe_method,
+            )
+            for resource in resources[idx : idx + batch_size]
+        ]
+        for idx in range(0, len(resources), batch_size)
+    ]
+    queue: asyncio.Queue = asyncio.Queue()
+    for batch in batches:
+        queue.put_nowait(batch)
+
+    async def worker() -> None:
+        while not queue.empty():
+            batch = queue.get_nowait()
+            async with DBManager(session_factory=sessionmaker_null_pool) as db:
+                await ResourceService(db).check_resource_batch(batch=batch, client=client)
+
+    await asyncio.gather(*(worker() for _ in range(workers)))
+
+
+async def count_status_rows() -> int:
+    async with DBManager(session_factory=sessionmaker_null_pool) as db:
+        result = await db.session.execute(select(func.count()).select_from(ResourceStatus))
+        return result.scalar_one()
+
+
+async def collect_results(
+    behaviour: StubBehaviour,
+    elapsed: float,
+    rows_written: int,
+) -> dict[str, Any]:
+    async with DBManager(session_factory=sessionmaker_null_pool) as db:
+        statuses = await db.statuses.get_all()
+        resources = {resource.id: str(resource.url) for resource in await db.resources.get_all()}
+
+    overheads = []
+    for st in statuses:
+        endpoint_id = int(resources[st.resource_id].rsplit("/", 1)[-1])
+        delay, kind = behaviour.for_endpoint(endpoint_id)
+        if kind != "hang":
+            overheads.append(st.response_time - delay)
+
+    # With run-length storage one row holds several checks, so rows and checks differ.
+    checks = sum(st.repeat_count for st in statuses)
+    return {
+        "elapsed_sec": round(elapsed, 3),
+        "checks": checks,
+        "checks_per_sec": round(checks / elapsed, 2) if elapsed else None,
+        "db_rows": rows_written,
+        "db_rows_per_sec": round(rows_written / elapsed, 2) if elapsed else None,
+        "run_length_enabled": settings.status_storage.RUN_LENGTH_ENABLED,
+        "probe_overhead_p50_ms": _ms(percentile(overheads, 50)),
+        "probe_overhead_p99_ms": _ms(percentile(overheads, 99)),
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def _ms(value: float | None) -> float | None:
+    return round(value * 1000, 3) if value is not None else None
+
+
+async def main(args: argparse.Namespace) -> None:
+    ensure_test_mode()
+    settings.taskiq.DISPATCH_WINDOW_SECONDS = 0
+    # The limiter is built at import time, so it is switched off on the instance.
+    # No worker startup runs here, so statuses are written without the buffer.
+    host_rate_limiter.enabled = False
+
+    behaviour = StubBehaviour(
+        seed=args.seed,
+        latency_ms=args.latency_ms,
+        latency_sigma=args.latency_sigma,
+        error_rate=args.error_rate,
+        hang_rate=args.hang_rate,
+        redirect_rate=args.redirect_rate,
+    )
+    runner = web.AppRunner(create_stub_app(behaviour), access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", args.port)
+    await site.start()
+    base_url = f"http://127.0.0.1:{args.port}"
+
+    await recreate_tables()
+    await seed_resources(base_url, args.resources)
+
+    client = create_probe_client()
+
+    async def get_benchmark_client() -> AsyncGenerator[Any, None]:
+        yield client
+
+    broker.dependency_overrides[get_db] = get_db_with_null_pool
+    broker.dependency_overrides[get_client] = get_benchmark_client
+    try:
+        rows_before = await count_status_rows()
+        start = time.perf_counter()
+        if args.path == "broker":
+            await run_broker_path()
+        else:
+            await run_service_path(client, args.workers)
+        elapsed = time.perf_counter() - start
+        rows_written = await count_status_rows() - rows_before
+        results = await collect_results(behaviour, elapsed, rows_written)
+    finally:
+        broker.dependency_overrides.clear()
+        await client.close()
+        await runner.cleanup()
+
+    write_results("probe_throughput", vars(args), results, args.output)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="End-to-end probe throughput benchmark")
+    parser.add_argument("--resources", type=int, default=1000)
+    parser.add_argument("--path", choices=("broker", "service"), default="service")
+    parser.add_argument("--workers", type=int, default=3, help="concurrent batches (service path)")
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--latency-sigma", type=float, default=0.5)
+    parser.add_argument("--error-rate", type=float, default=0.05)
+    parser.add_argument("--hang-rate", type=float, default=0.0)
+    parser.add_argument("--redirect-rate", type=float, default=0.05)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--port", type=int, default=18080)
+    parser.add_argument("--output", help="also write the JSON report to this file")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(parse_args()))
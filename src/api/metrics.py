@@ -0,0 +1,11 @@
+from fastapi import APIRouter, Response
+
+from src.utils.metrics import render_metrics
+
+router = APIRouter()
+
+
+@router.get("/metrics", include_in_schema=False)
+def get_metrics():
+    content, media_type = render_metrics()
+    return Response(content=content, media_type=media_type)
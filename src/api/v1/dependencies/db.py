@@ -1,6 +1,7 @@
 from typing import Annotated, Any, AsyncGenerator
 
 from fastapi import Depends
+from sqlalchemy.ext.asyncio import async_sessionmaker
 
 from src.db import sessionmaker, sessionmaker_null_pool
 from src.utils.db_tools import DBManager
@@ -16,4 +17,13 @@ async def get_db_with_null_pool() -> AsyncGenerator[DBManager, None]:
         yield db
 
 
+def get_session_factory() -> async_sessionmaker:
+    return sessionmaker
+
+
+def get_session_factory_null_pool() -> async_sessionmaker:
+    return sessionmaker_null_pool
+
+
 DBDep = Annotated[DBManager, Depends(get_db)]
+SessionFactoryDep = Annotated[async_sessionmaker, Depends(get_session_factory)]
@@ -1,31 +1,71 @@
-from fastapi import APIRouter, Request
+from datetime import datetime
 
-from src.api.v1.dependencies.db import DBDep
+from fastapi import APIRouter, Header, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+
+from src.api.v1.dependencies.db import DBDep, SessionFactoryDep
 from src.api.v1.responses.resources import (
     RESP_CREATE_RESOURCE,
     RESP_DELETE_RESOURCE,
+    RESP_EXPORT_RESOURCE_STATUSES,
     RESP_GET_RESOURCE,
+    RESP_GET_RESOURCE_ROLLUPS,
+    RESP_GET_RESOURCE_SLA,
     RESP_GET_RESOURCE_STATUSES,
+    RESP_GET_RESOURCE_VERIFICATION,
     RESP_GET_RESOURCES,
+    RESP_GET_RESOURCES_SLA,
+    RESP_IMPORT_RESOURCES,
+    RESP_STREAM_RESOURCE_STATUSES,
+)
+from src.config import settings
+from src.schemas.enums import (
+    CreationMode,
+    ExportFormat,
+    ResourceState,
+    RollupResolution,
+    SLAWindow,
 )
 from src.schemas.resoures import ResourceAddDTO
 from src.schemas.responses.resourses import (
     CreateResourceResponse,
     DeleteResourceResponse,
     GetResourceResponse,
-    GetResourcesResponse,
+    GetResourceSLAResponse,
+    GetResourcesSLAResponse,
+    GetRollupsResponse,
     GetStatusesResponse,
+    ImportResourcesResponse,
+)
+from src.services.resources import (
+    ResourceService,
+    ResourceStatusesService,
+    status_feed_hub,
 )
-from src.services.resources import ResourceService, ResourceStatusesService
+from src.services.rollups import ResourceStatusRollupService
+from src.services.sla import ResourceSLAService
+from src.utils.bulk_import import is_ndjson, parse_json_items, read_ndjson_items
+from src.utils.etag import etag_matches
+from src.utils.export import EXPORT_MEDIA_TYPES
 from src.utils.exceptions import (
+    ImportTooLargeError,
+    ImportTooLargeHTTPError,
+    InvalidImportPayloadError,
+    InvalidImportPayloadHTTPError,
+    InvalidCursorError,
+    InvalidCursorHTTPError,
     ResourceAlreadyExistsError,
     ResourceAlreadyExistsHTTPError,
     ResourceNotFoundError,
     ResourceNotFoundHTTPError,
     ResourceUnavailableError,
     ResourceUnavailableHTTPError,
+    SLANotFoundError,
+    SLANotFoundHTTPError,
     ValueOutOfRangeError,
     ValueOutOfRangeHTTPError,
+    VerificationNotQueuedError,
+    VerificationNotQueuedHTTPError,
 )
 
 router = APIRouter(prefix="/resources")
@@ -37,10 +77,18 @@ router = APIRouter(prefix="/resources")
 )
 async def get_resources(
     db: DBDep,
+    if_none_match: str | None = Header(default=None),
 ):
-    resources = await ResourceService(db).get_resources()
-    return GetResourcesResponse(
-        data=resources,
+    service = ResourceService(db)
+    etag = await service.get_resources_etag()
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+    payload = await service.get_resources_payload(etag=etag)
+    return Response(
+        content=payload,
+        media_type="application/json",
+        headers={"ETag": etag},
     )
 
 
@@ -50,20 +98,90 @@ async def get_resources(
 )
 async def create_resource(
     request: Request,
+    response: Response,
     data: ResourceAddDTO,
     db: DBDep,
+    mode: CreationMode = CreationMode.SYNC,
 ):
+    service = ResourceService(db)
     try:
-        resource = await ResourceService(db).create_resource(request=request, data=data)
+        if mode == CreationMode.ASYNC:
+            resource = await service.create_resource_async(data=data)
+        else:
+            resource = await service.create_resource(request=request, data=data)
     except ResourceUnavailableError as exc:
         raise ResourceUnavailableHTTPError from exc
     except ResourceAlreadyExistsError as exc:
         raise ResourceAlreadyExistsHTTPError from exc
+    except VerificationNotQueuedError as exc:
+        raise VerificationNotQueuedHTTPError from exc
+
+    if mode == CreationMode.ASYNC:
+        response.status_code = status.HTTP_202_ACCEPTED
+        response.headers["Location"] = str(
+            request.url_for("get_resource_verification", resource_id=resource.id)
+        )
     return CreateResourceResponse(
         data=resource,
     )
 
 
+@router.post(
+    path="/bulk",
+    responses=RESP_IMPORT_RESOURCES,
+)
+async def import_resources(
+    request: Request,
+    db: DBDep,
+):
+    max_items = settings.app.IMPORT_MAX_ITEMS
+    try:
+        if is_ndjson(request.headers.get("content-type")):
+            items = await read_ndjson_items(request.stream(), max_items=max_items)
+        else:
+            items = parse_json_items(await request.body(), max_items=max_items)
+    except InvalidImportPayloadError as exc:
+        raise InvalidImportPayloadHTTPError from exc
+    except ImportTooLargeError as exc:
+        raise ImportTooLargeHTTPError from exc
+
+    results = await ResourceService(db).import_resources(
+        items=items,
+        client=request.app.state.aiohttp_client,
+    )
+    return ImportResourcesResponse(
+        data=results,
+    )
+
+
+@router.get(
+    path="/sla",
+    responses=RESP_GET_RESOURCES_SLA,
+)
+async def get_resources_sla(
+    db: DBDep,
+    window: SLAWindow = SLAWindow.DAY,
+):
+    summaries = await ResourceSLAService(db).get_sla(window=window)
+    return GetResourcesSLAResponse(
+        data=summaries,
+    )
+
+
+@router.get(
+    path="/stream",
+    responses=RESP_STREAM_RESOURCE_STATUSES,
+    response_class=StreamingResponse,
+)
+async def stream_statuses():
+    queue = status_feed_hub.subscribe()
+    return StreamingResponse(
+        content=status_feed_hub.iter_events(queue),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.get(
     path="/{resource_id}",
     responses=RESP_GET_RESOURCE,
@@ -71,13 +189,47 @@ async def create_resource(
 async def get_resource(
     resource_id: int,
     db: DBDep,
+    if_none_match: str | None = Header(default=None),
+):
+    service = ResourceService(db)
+    try:
+        etag = await service.get_resource_etag(resource_id=resource_id)
+        if etag_matches(if_none_match, etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+        payload = await service.get_resource_payload(resource_id=resource_id, etag=etag)
+    except ValueOutOfRangeError as exc:
+        raise ValueOutOfRangeHTTPError from exc
+    except ResourceNotFoundError as exc:
+        raise ResourceNotFoundHTTPError from exc
+    return Response(
+        content=payload,
+        media_type="application/json",
+        headers={"ETag": etag},
+    )
+
+
+@router.get(
+    path="/{resource_id}/verification",
+    responses=RESP_GET_RESOURCE_VERIFICATION,
+)
+async def get_resource_verification(
+    resource_id: int,
+    response: Response,
+    db: DBDep,
+    wait: float = Query(default=0, ge=0, le=settings.app.VERIFICATION_MAX_WAIT),
 ):
     try:
-        resource = await ResourceService(db).get_resource(resource_id=resource_id)
+        resource = await ResourceService(db).wait_for_verification(
+            resource_id=resource_id,
+            timeout=wait,
+        )
     except ValueOutOfRangeError as exc:
         raise ValueOutOfRangeHTTPError from exc
     except ResourceNotFoundError as exc:
         raise ResourceNotFoundHTTPError from exc
+
+    if resource.state == ResourceState.PENDING:
+        response.status_code = status.HTTP_202_ACCEPTED
     return GetResourceResponse(
         data=resource,
     )
@@ -109,15 +261,132 @@ async def delete_resource(
 async def get_statuses_by_resource(
     resource_id: int,
     db: DBDep,
+    response: Response,
+    date_from: datetime | None = Query(default=None, alias="from"),
+    date_to: datetime | None = Query(default=None, alias="to"),
+    limit: int = Query(
+        default=settings.app.STATUSES_PAGE_LIMIT,
+        ge=1,
+        le=settings.app.STATUSES_MAX_PAGE_LIMIT,
+    ),
+    cursor: str | None = None,
+    expand: bool = False,
+    if_none_match: str | None = Header(default=None),
 ):
+    service = ResourceStatusesService(db)
     try:
-        statuses = await ResourceStatusesService(db).get_statuses_by_resource(
-            resource_id=resource_id
+        etag = await service.get_statuses_etag(
+            resource_id=resource_id,
+            limit=limit,
+            date_from=date_from,
+            date_to=date_to,
+            cursor=cursor,
+            expand=expand,
         )
+        if etag_matches(if_none_match, etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+        statuses, next_cursor = await service.get_statuses_by_resource(
+            resource_id=resource_id,
+            limit=limit,
+            date_from=date_from,
+            date_to=date_to,
+            cursor=cursor,
+            expand=expand,
+        )
+    except InvalidCursorError as exc:
+        raise InvalidCursorHTTPError from exc
     except ValueOutOfRangeError as exc:
         raise ValueOutOfRangeHTTPError from exc
     except ResourceNotFoundError as exc:
         raise ResourceNotFoundHTTPError from exc
+    response.headers["ETag"] = etag
     return GetStatusesResponse(
         data=statuses,
+        next_cursor=next_cursor,
+    )
+
+
+@router.get(
+    path="/{resource_id}/statuses/export",
+    responses=RESP_EXPORT_RESOURCE_STATUSES,
+    response_class=StreamingResponse,
+)
+async def export_statuses_by_resource(
+    resource_id: int,
+    db: DBDep,
+    session_factory: SessionFactoryDep,
+    export_format: ExportFormat = Query(default=ExportFormat.NDJSON, alias="format"),
+    date_from: datetime | None = Query(default=None, alias="from"),
+    date_to: datetime | None = Query(default=None, alias="to"),
+):
+    try:
+        content = await ResourceStatusesService(db).export_statuses(
+            resource_id=resource_id,
+            export_format=export_format,
+            session_factory=session_factory,
+            date_from=date_from,
+            date_to=date_to,
+        )
+    except ValueOutOfRangeError as exc:
+        raise ValueOutOfRangeHTTPError from exc
+    except ResourceNotFoundError as exc:
+        raise ResourceNotFoundHTTPError from exc
+
+    filename = f"resource_{resource_id}_statuses.{export_format.value}"
+    return StreamingResponse(
+        content=content,
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+@router.get(
+    path="/{resource_id}/rollups",
+    responses=RESP_GET_RESOURCE_ROLLUPS,
+)
+async def get_rollups_by_resource(
+    resource_id: int,
+    db: DBDep,
+    resolution: RollupResolution = RollupResolution.FIVE_MINUTES,
+    date_from: datetime | None = Query(default=None, alias="from"),
+    date_to: datetime | None = Query(default=None, alias="to"),
+):
+    try:
+        rollups = await ResourceStatusRollupService(db).get_rollups(
+            resource_id=resource_id,
+            resolution=resolution,
+            date_from=date_from,
+            date_to=date_to,
+        )
+    except ValueOutOfRangeError as exc:
+        raise ValueOutOfRangeHTTPError from exc
+    except ResourceNotFoundError as exc:
+        raise ResourceNotFoundHTTPError from exc
+    return GetRollupsResponse(
+        data=rollups,
+    )
+
+
+@router.get(
+    path="/{resource_id}/sla",
+    responses=RESP_GET_RESOURCE_SLA,
+)
+async def get_resource_sla(
+    resource_id: int,
+    db: DBDep,
+    window: SLAWindow = SLAWindow.DAY,
+):
+    try:
+        summary = await ResourceSLAService(db).get_resource_sla(
+            resource_id=resource_id,
+            window=window,
+        )
+    except ValueOutOfRangeError as exc:
+        raise ValueOutOfRangeHTTPError from exc
+    except ResourceNotFoundError as exc:
+        raise ResourceNotFoundHTTPError from exc
+    except SLANotFoundError as exc:
+        raise SLANotFoundHTTPError from exc
+    return GetResourceSLAResponse(
+        data=summary,
     )
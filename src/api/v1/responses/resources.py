@@ -3,23 +3,37 @@ from typing import Any, Dict
 
 from fastapi import status
 
-from src.schemas.enums import ResourceState
-from src.schemas.resoures import ResourceDTO, ResourceStatusDTO
+from src.schemas.enums import ImportOutcome, ResourceState, RollupResolution, SLAWindow
+from src.schemas.resoures import ResourceDTO, ResourceImportResultDTO, ResourceStatusDTO
+from src.schemas.rollups import ResourceStatusRollupDTO
+from src.schemas.sla import ResourceSLADTO
 from src.schemas.responses.resourses import (
     CreateResourceResponse,
     DeleteResourceResponse,
     GetResourceResponse,
+    GetResourceSLAResponse,
     GetResourcesResponse,
+    GetResourcesSLAResponse,
+    GetRollupsResponse,
     GetStatusesResponse,
+    ImportResourcesResponse,
 )
 from src.utils.exceptions import (
+    ImportTooLargeHTTPError,
+    InvalidImportPayloadHTTPError,
+    InvalidCursorHTTPError,
     ResourceAlreadyExistsHTTPError,
     ResourceNotFoundHTTPError,
     ResourceUnavailableHTTPError,
+    SLANotFoundHTTPError,
     ValueOutOfRangeHTTPError,
+    VerificationNotQueuedHTTPError,
 )
 
 RESP_GET_RESOURCES: Dict[int | str, Dict[str, Any]] | None = {
+    status.HTTP_304_NOT_MODIFIED: {
+        "description": "Ресурсы не изменились с прошлого запроса",
+    },
     status.HTTP_200_OK: {
         "description": "Ресурсы успешно полуяены",
         "model": GetResourcesResponse,
@@ -38,6 +52,9 @@ RESP_GET_RESOURCES: Dict[int | str, Dict[str, Any]] | None = {
 }
 
 RESP_GET_RESOURCE: Dict[int | str, Dict[str, Any]] | None = {
+    status.HTTP_304_NOT_MODIFIED: {
+        "description": "Ресурс не изменился с прошлого запроса",
+    },
     status.HTTP_200_OK: {
         "description": "Ресурс успешно полуяен",
         "model": GetResourceResponse,
@@ -93,6 +110,19 @@ RESP_CREATE_RESOURCE: Dict[int | str, Dict[str, Any]] | None = {
             )
         ),
     },
+    status.HTTP_202_ACCEPTED: {
+        "description": "Ресурс принят в режиме async и ожидает проверки",
+        "model": CreateResourceResponse,
+        "example": CreateResourceResponse(
+            data=ResourceDTO(
+                resource_id=1,
+                url="https://example.com",
+                state=ResourceState.PENDING,
+                created_at=datetime.now(timezone.utc),
+                updated_at=datetime.now(timezone.utc),
+            )
+        ),
+    },
     status.HTTP_409_CONFLICT: {
         "description": "Ресурс с таким URL уже существует",
         "content": {
@@ -105,9 +135,18 @@ RESP_CREATE_RESOURCE: Dict[int | str, Dict[str, Any]] | None = {
             "application/json": {"example": {"detail": ResourceUnavailableHTTPError.detail}}
         },
     },
+    status.HTTP_503_SERVICE_UNAVAILABLE: {
+        "description": "Не удалось поставить проверку ресурса в очередь в режиме async",
+        "content": {
+            "application/json": {"example": {"detail": VerificationNotQueuedHTTPError.detail}}
+        },
+    },
 }
 
 RESP_GET_RESOURCE_STATUSES: Dict[int | str, Dict[str, Any]] | None = {
+    status.HTTP_304_NOT_MODIFIED: {
+        "description": "Статусы не изменились с прошлого запроса",
+    },
     status.HTTP_200_OK: {
         "description": "Статусы для ресурсов успешно получены",
         "model": GetResourcesResponse,
@@ -121,13 +160,195 @@ RESP_GET_RESOURCE_STATUSES: Dict[int | str, Dict[str, Any]] | None = {
                     created_at=datetime.now(timezone.utc),
                     updated_at=datetime.now(timezone.utc),
                 )
-            ]
+            ],
+            next_cursor="WyIyMDI2LTAxLTA0VDA5OjQwOjI5KzAwOjAwIiwxXQ",
         ),
     },
     status.HTTP_404_NOT_FOUND: {
         "description": "Ресурс не найден",
         "content": {"application/json": {"example": {"detail": ResourceNotFoundHTTPError.detail}}},
     },
+    status.HTTP_422_UNPROCESSABLE_CONTENT: {
+        "description": "Некорректные данные для id ресурса или курсора пагинации",
+        "content": {
+            "application/json": {
+                "examples": {
+                    "resource_id": {"value": {"detail": ValueOutOfRangeHTTPError.detail}},
+                    "cursor": {"value": {"detail": InvalidCursorHTTPError.detail}},
+                }
+            }
+        },
+    },
+}
+
+RESP_EXPORT_RESOURCE_STATUSES: Dict[int | str, Dict[str, Any]] | None = {
+    status.HTTP_200_OK: {
+        "description": "История статусов ресурса выгружается потоком",
+        "content": {
+            "application/x-ndjson": {
+                "example": (
+                    '{"resource_status_id":1,"resource_id":1,"status_code":200,'
+                    '"response_time":0.6503,"dns_time":0.0121,"connect_time":0.1184,'
+                    '"ttfb":0.6377,"created_at":"2026-01-04T09:40:29+00:00"}\n'
+                )
+            },
+            "text/csv": {
+                "example": (
+                    "resource_status_id,resource_id,status_code,response_time,"
+                    "dns_time,connect_time,ttfb,created_at\r\n"
+                    "1,1,200,0.6503,0.0121,0.1184,0.6377,2026-01-04T09:40:29+00:00\r\n"
+                )
+            },
+        },
+    },
+    status.HTTP_404_NOT_FOUND: {
+        "description": "Ресурс не найден",
+        "content": {"application/json": {"example": {"detail": ResourceNotFoundHTTPError.detail}}},
+    },
+    status.HTTP_422_UNPROCESSABLE_CONTENT: {
+        "description": "Некорректные данные для id ресурса",
+        "content": {"application/json": {"example": {"detail": ValueOutOfRangeHTTPError.detail}}},
+    },
+}
+
+RESP_GET_RESOURCE_ROLLUPS: Dict[int | str, Dict[str, Any]] | None = {
+    status.HTTP_200_OK: {
+        "description": "Агрегаты статусов для ресурса успешно получены",
+        "model": GetRollupsResponse,
+        "example": GetRollupsResponse(
+            data=[
+                ResourceStatusRollupDTO(
+                    resource_id=1,
+                    resolution=RollupResolution.FIVE_MINUTES,
+                    bucket_start=datetime.now(timezone.utc),
+                    count=5,
+                    failure_count=0,
+                    response_time_min=0.4102,
+                    response_time_avg=0.6503,
+                    response_time_max=0.9871,
+                    response_time_p50=0.6127,
+                    response_time_p95=0.9512,
+                    response_time_p99=0.9799,
+                )
+            ]
+        ),
+    },
+    status.HTTP_404_NOT_FOUND: {
+        "description": "Ресурс не найден",
+        "content": {"application/json": {"example": {"detail": ResourceNotFoundHTTPError.detail}}},
+    },
+    status.HTTP_422_UNPROCESSABLE_CONTENT: {
+        "description": "Некорректные данные для id ресурса",
+        "content": {"application/json": {"example": {"detail": ValueOutOfRangeHTTPError.detail}}},
+    },
+}
+
+SLA_EXAMPLE = ResourceSLADTO(
+    resource_id=1,
+    window=SLAWindow.DAY,
+    checks=288,
+    uptime_percent=99.65,
+    downtime_minutes=5.0,
+    incident_count=1,
+    response_time_p50=0.6127,
+    response_time_p95=0.9512,
+    response_time_p99=0.9799,
+    created_at=datetime.now(timezone.utc),
+    updated_at=datetime.now(timezone.utc),
+)
+
+RESP_GET_RESOURCES_SLA: Dict[int | str, Dict[str, Any]] | None = {
+    status.HTTP_200_OK: {
+        "description": "SLA ресурсов успешно получены",
+        "model": GetResourcesSLAResponse,
+        "example": GetResourcesSLAResponse(data=[SLA_EXAMPLE]),
+    },
+}
+
+RESP_GET_RESOURCE_SLA: Dict[int | str, Dict[str, Any]] | None = {
+    status.HTTP_200_OK: {
+        "description": "SLA ресурса успешно получен",
+        "model": GetResourceSLAResponse,
+        "example": GetResourceSLAResponse(data=SLA_EXAMPLE),
+    },
+    status.HTTP_404_NOT_FOUND: {
+        "description": "Ресурс не найден или SLA для него ещё не рассчитан",
+        "content": {
+            "application/json": {
+                "examples": {
+                    "resource": {"value": {"detail": ResourceNotFoundHTTPError.detail}},
+                    "sla": {"value": {"detail": SLANotFoundHTTPError.detail}},
+                }
+            }
+        },
+    },
+    status.HTTP_422_UNPROCESSABLE_CONTENT: {
+        "description": "Некорректные данные для id ресурса",
+        "content": {"application/json": {"example": {"detail": ValueOutOfRangeHTTPError.detail}}},
+    },
+}
+
+RESP_STREAM_RESOURCE_STATUSES: Dict[int | str, Dict[str, Any]] | None = {
+    status.HTTP_200_OK: {
+        "description": "Поток результатов проверок ресурсов (Server-Sent Events)",
+        "content": {
+            "text/event-stream": {
+                "example": (
+                    "event: statuses\n"
+                    'data: [{"resource_id":1,"state":"DOWN","status_code":500,'
+                    '"response_time":0.4211,"changed":true,'
+                    '"checked_at":"2026-01-04T09:40:29+00:00"}]\n\n'
+                )
+            },
+        },
+    },
+}
+
+RESP_IMPORT_RESOURCES: Dict[int | str, Dict[str, Any]] | None = {
+    status.HTTP_200_OK: {
+        "description": "Импорт ресурсов выполнен, результат указан для каждого URL",
+        "model": ImportResourcesResponse,
+        "example": ImportResourcesResponse(
+            data=[
+                ResourceImportResultDTO(
+                    url="https://example.com",
+                    outcome=ImportOutcome.CREATED,
+                    resource_id=1,
+                    status_code=200,
+                ),
+                ResourceImportResultDTO(
+                    url="https://example.com/missing",
+                    outcome=ImportOutcome.UNAVAILABLE,
+                    status_code=404,
+                ),
+            ]
+        ),
+    },
+    status.HTTP_413_CONTENT_TOO_LARGE: {
+        "description": "Слишком много ресурсов в одном запросе",
+        "content": {"application/json": {"example": {"detail": ImportTooLargeHTTPError.detail}}},
+    },
+    status.HTTP_422_UNPROCESSABLE_CONTENT: {
+        "description": "Тело запроса не является JSON-массивом или NDJSON",
+        "content": {
+            "application/json": {"example": {"detail": InvalidImportPayloadHTTPError.detail}}
+        },
+    },
+}
+
+RESP_GET_RESOURCE_VERIFICATION: Dict[int | str, Dict[str, Any]] | None = {
+    status.HTTP_200_OK: {
+        "description": "Проверка ресурса завершена: UP или REJECTED",
+        "model": GetResourceResponse,
+    },
+    status.HTTP_202_ACCEPTED: {
+        "description": "Ресурс все еще ожидает проверки",
+        "model": GetResourceResponse,
+    },
+    status.HTTP_404_NOT_FOUND: {
+        "description": "Ресурс не найден",
+        "content": {"application/json": {"example": {"detail": ResourceNotFoundHTTPError.detail}}},
+    },
     status.HTTP_422_UNPROCESSABLE_CONTENT: {
         "description": "Некорректные данные для id ресурса",
         "content": {"application/json": {"example": {"detail": ValueOutOfRangeHTTPError.detail}}},
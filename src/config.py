@@ -15,9 +15,101 @@ class TaskiqConfig(BaseModel):
     USE_DELAY_EXPONENT: bool = True
     MAX_DELAY_EXPONENT: int = 120
 
+    CHECK_BATCH_SIZE: int = 50
+    CHECK_BATCH_CONCURRENCY: int = 20
+    CHECK_CLAIM_LIMIT: int = 5000
+    CHECK_INTERVAL_MIN: int = 60
+    CHECK_INTERVAL_MAX: int = 900
+    CHECK_INTERVAL_BACKOFF: float = 2.0
+    DISPATCH_WINDOW_SECONDS: float = 50.0
+    PENDING_REQUEUE_MINUTES: int = 5
+    PENDING_REJECT_MINUTES: int = 30
+
     UNRELEVANT_STATUS_HOURS: int = 12
-    CRON_CHECK_RESOURCES: CronStr = CronStr("*/5 * * * *")
+    RETENTION_BATCH_SIZE: int = 5000
+    RETENTION_BATCH_PAUSE: float = 0.1
+    CRON_CHECK_RESOURCES: CronStr = CronStr("* * * * *")
     CRON_CHECK_UNRELEVANT_STATUSES: CronStr = CronStr("*/10 * * * *")
+    CRON_MAINTAIN_STATUS_PARTITIONS: CronStr = CronStr("*/15 * * * *")
+    CRON_REFRESH_STATUS_ROLLUPS: CronStr = CronStr("* * * * *")
+    CRON_REFRESH_SLA: CronStr = CronStr("*/5 * * * *")
+    CRON_RECOVER_PENDING_RESOURCES: CronStr = CronStr("*/5 * * * *")
+
+
+class StatusPartitionConfig(BaseModel):
+    INTERVAL: Literal["hourly", "daily"] = "hourly"
+    PREMAKE: int = 3
+
+
+class StatusBufferConfig(BaseModel):
+    ENABLED: bool = True
+    MAX_SIZE: int = 500
+    MAX_PENDING: int = 10_000
+    FLUSH_INTERVAL: float = 2.0
+
+
+class StatusStorageConfig(BaseModel):
+    RUN_LENGTH_ENABLED: bool = False
+    RUN_MAX_SECONDS: int = 3600
+    LATENCY_BUCKETS: list[float] = [0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0]
+
+
+class StatusArchiveConfig(BaseModel):
+    ENABLED: bool = False
+    DIRECTORY: Path = BASE_DIR / "archive" / "resource_status"
+    COMPRESSION: Literal["zstd", "snappy", "gzip", "none"] = "zstd"
+    ROW_GROUP_SIZE: int = 50_000
+
+
+class RollupConfig(BaseModel):
+    LAG_SECONDS: int = 30
+    MINUTE_RETENTION_HOURS: int = 48
+    FIVE_MINUTES_RETENTION_DAYS: int = 14
+    HOUR_RETENTION_DAYS: int = 400
+    DEFAULT_RANGE_HOURS: int = 24
+
+
+class SLAConfig(BaseModel):
+    CACHE_TTL: float = 30.0
+
+
+class ProbeClientConfig(BaseModel):
+    LIMIT: int = 200
+    LIMIT_PER_HOST: int = 4
+    TTL_DNS_CACHE: int = 300
+    KEEPALIVE_TIMEOUT: float = 15.0
+    TOTAL_TIMEOUT: float = 20.0
+    CONNECT_TIMEOUT: float = 5.0
+    SOCK_READ_TIMEOUT: float = 10.0
+    MAX_REDIRECTS: int = 5
+    MAX_BODY_BYTES: int = 64 * 1024
+    READ_CHUNK_SIZE: int = 16 * 1024
+    TRACE_TIMINGS: bool = True
+
+
+class RateLimitConfig(BaseModel):
+    ENABLED: bool = True
+    MODE: Literal["wait", "skip"] = "wait"
+    DEFAULT_RATE: float = 2.0
+    DEFAULT_BURST: int = 5
+    HOST_RATES: dict[str, float] = {}
+    MAX_WAIT: float = 10.0
+    NAMESPACE: str = "ratelimit"
+
+
+class ResourceCacheConfig(BaseModel):
+    ENABLED: bool = True
+    TTL: int = 60
+    NAMESPACE: str = "resources"
+
+
+class StatusFeedConfig(BaseModel):
+    ENABLED: bool = True
+    CHANNEL: str = "resource_statuses"
+    QUEUE_SIZE: int = 100
+    HEARTBEAT_INTERVAL: float = 15.0
+    RECONNECT_DELAY: float = 1.0
+    RETRY_MS: int = 3000
 
 
 class RedisConfig(BaseModel):
@@ -79,6 +171,13 @@ class GeneralAppConfig(BaseModel):
     MODE: Literal["TEST", "DEV"]
     API_PREFIX: str = "/api"
     V1_PREFIX: str = "/v1"
+    STATUSES_PAGE_LIMIT: int = 100
+    STATUSES_MAX_PAGE_LIMIT: int = 1000
+    STATUSES_EXPORT_CHUNK_SIZE: int = 1000
+    IMPORT_MAX_ITEMS: int = 10000
+    IMPORT_PROBE_CONCURRENCY: int = 50
+    VERIFICATION_MAX_WAIT: float = 30.0
+    VERIFICATION_POLL_INTERVAL: float = 2.0
 
 
 class Settings(BaseSettings):
@@ -86,6 +185,16 @@ class Settings(BaseSettings):
     redis: RedisConfig
     app: GeneralAppConfig
     taskiq: TaskiqConfig = TaskiqConfig()
+    status_buffer: StatusBufferConfig = StatusBufferConfig()
+    status_storage: StatusStorageConfig = StatusStorageConfig()
+    status_archive: StatusArchiveConfig = StatusArchiveConfig()
+    status_partitions: StatusPartitionConfig = StatusPartitionConfig()
+    rollups: RollupConfig = RollupConfig()
+    sla: SLAConfig = SLAConfig()
+    resource_cache: ResourceCacheConfig = ResourceCacheConfig()
+    probe_client: ProbeClientConfig = ProbeClientConfig()
+    rate_limit: RateLimitConfig = RateLimitConfig()
+    status_feed: StatusFeedConfig = StatusFeedConfig()
     gunicorn: GunicornConfig = GunicornConfig()
     uvicorn: UvicornConfig = UvicornConfig()
 
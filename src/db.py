@@ -2,11 +2,14 @@ from sqlalchemy import NullPool
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from src.config import settings
+from src.utils.db_metrics import InstrumentedQueuePool, instrument_engine
 
 engine = create_async_engine(
     url=settings.db.DB_URL,
     echo=settings.db.DB_ECHO,
+    poolclass=InstrumentedQueuePool,
 )
+instrument_engine(engine)
 
 sessionmaker = async_sessionmaker(
     bind=engine,
@@ -1,8 +1,10 @@
 from fastapi import FastAPI
 from gunicorn.app.base import BaseApplication
 from gunicorn.config import Config
+from prometheus_client import multiprocess
 
 from src.utils.logconfig import get_logging_config
+from src.utils.metrics import MULTIPROC_DIR
 
 
 class GunicornApp(BaseApplication):
@@ -32,6 +34,11 @@ class GunicornApp(BaseApplication):
             self.cfg.set(k.lower(), v)
 
 
+def mark_worker_dead(server, worker) -> None:
+    if MULTIPROC_DIR:
+        multiprocess.mark_process_dead(worker.pid, MULTIPROC_DIR)
+
+
 def get_app_options(
     host: str,
     port: int,
@@ -51,4 +58,5 @@ def get_app_options(
         "timeout": timeout,
         "reload": reload,
         "logconfig_dict": get_logging_config(),
+        "child_exit": mark_worker_dead,
     }
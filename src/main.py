@@ -3,8 +3,6 @@ from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import AsyncGenerator
 
-import aiohttp
-
 sys.path.append(str(Path(__file__).parent.parent))
 
 import uvicorn
@@ -15,12 +13,17 @@ from fastapi.staticfiles import StaticFiles
 
 from src.api import router as main_router
 from src.api.docs import router as docs_router
+from src.api.metrics import router as metrics_router
+from src.api.middlewares import MetricsMiddleware
 from src.config import BASE_DIR, settings
 from src.db import engine
+from src.services.resources import status_feed_hub
 
 # from src.tasks.broker import broker, scheduler
 from src.utils.db_tools import DBHealthChecker
+from src.utils.http_client import create_probe_client
 from src.utils.logconfig import configurate_logging, get_logger
+from src.utils.redis import close_redis
 
 
 @asynccontextmanager
@@ -36,7 +39,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     #     await broker.startup()
     #     logger.info("Broker and scheduler started")
 
-    async with aiohttp.ClientSession() as session:
+    async with create_probe_client() as session:
         app.state.aiohttp_client = session
         yield
 
@@ -45,6 +48,8 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     #     await broker.shutdown()
     #     logger.info("Broker and scheduler has been shut down")
 
+    await status_feed_hub.stop()
+    await close_redis()
     await helper.dispose()
     logger.info("Shutting down...")
 
@@ -59,6 +64,7 @@ app = FastAPI(
 )
 app.include_router(main_router)
 app.include_router(docs_router)
+app.include_router(metrics_router)
 
 app.add_middleware(
     CORSMiddleware,
@@ -67,6 +73,7 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(MetricsMiddleware)
 
 static_path = BASE_DIR / "src" / "static"
 app.mount("/static", StaticFiles(directory=static_path), name="static")
@@ -0,0 +1,119 @@
+"""partitioned resource_status by created_at
+
+Revision ID: 3c1a2b7d9e40
+Revises: 905ec29261a7
+Create Date: 2026-10-18 12:00:41.118203
+
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+from src.config import settings
+from src.utils.partitions import (
+    get_partition_ddl,
+    get_partition_name,
+    get_partition_step,
+    iter_partition_ranges,
+)
+
+# revision identifiers, used by Alembic.
+revision: str = "3c1a2b7d9e40"
+down_revision: Union[str, Sequence[str], None] = "905ec29261a7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COLUMNS = "resource_status_id, response_time, status_code, resource_id, created_at, updated_at"
+
+
+def _create_resource_status_table(partitioned: bool) -> None:
+    primary_key = ("resource_status_id", "created_at") if partitioned else ("resource_status_id",)
+    partition_options = {"postgresql_partition_by": "RANGE (created_at)"} if partitioned else {}
+    op.create_table(
+        "resource_status",
+        sa.Column(
+            "resource_status_id",
+            sa.Integer(),
+            autoincrement=True,
+            nullable=False,
+        ),
+        sa.Column("response_time", sa.Float(), nullable=False),
+        sa.Column("status_code", sa.Integer(), nullable=False),
+        sa.Column("resource_id", sa.Integer(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(
+            ["resource_id"],
+            ["resource.resource_id"],
+            name=op.f("fk_resource_status_resource_id_resource"),
+        ),
+        sa.PrimaryKeyConstraint(*primary_key, name=op.f("pk_resource_status")),
+        **partition_options,
+    )
+
+
+def _rename_old_table() -> None:
+    op.execute("ALTER TABLE resource_status RENAME TO resource_status_old")
+    op.execute(
+        "ALTER TABLE resource_status_old "
+        "RENAME CONSTRAINT pk_resource_status TO pk_resource_status_old"
+    )
+    op.execute(
+        "ALTER TABLE resource_status_old "
+        "RENAME CONSTRAINT fk_resource_status_resource_id_resource "
+        "TO fk_resource_status_old_resource_id_resource"
+    )
+    op.execute(
+        "ALTER SEQUENCE resource_status_resource_status_id_seq "
+        "RENAME TO resource_status_old_resource_status_id_seq"
+    )
+
+
+def _copy_rows_from_old_table() -> None:
+    op.execute(f"INSERT INTO resource_status ({COLUMNS}) SELECT {COLUMNS} FROM resource_status_old")
+    op.execute(
+        "SELECT setval(pg_get_serial_sequence('resource_status', 'resource_status_id'), "
+        "coalesce(max(resource_status_id), 0) + 1, false) FROM resource_status"
+    )
+    op.drop_table("resource_status_old")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    _rename_old_table()
+    _create_resource_status_table(partitioned=True)
+    op.execute("CREATE TABLE resource_status_default PARTITION OF resource_status DEFAULT")
+
+    interval = settings.status_partitions.INTERVAL
+    now = datetime.now(timezone.utc)
+    retention_start = now - timedelta(hours=settings.taskiq.UNRELEVANT_STATUS_HOURS)
+    oldest = op.get_bind().execute(sa.text("SELECT min(created_at) FROM resource_status_old"))
+    oldest_created_at = oldest.scalar()
+
+    start = max(oldest_created_at or now, retention_start)
+    end = now + get_partition_step(interval) * (settings.status_partitions.PREMAKE + 1)
+    for part_start, part_end in iter_partition_ranges(start, end, interval):
+        name = get_partition_name("resource_status", part_start, interval)
+        op.execute(get_partition_ddl("resource_status", name, part_start, part_end))
+
+    _copy_rows_from_old_table()
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _rename_old_table()
+    _create_resource_status_table(partitioned=False)
+    _copy_rows_from_old_table()
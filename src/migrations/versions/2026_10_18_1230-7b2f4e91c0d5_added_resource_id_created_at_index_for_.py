@@ -0,0 +1,33 @@
+"""added resource_id created_at index for resource_status
+
+Revision ID: 7b2f4e91c0d5
+Revises: 3c1a2b7d9e40
+Create Date: 2026-10-18 12:30:12.504117
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7b2f4e91c0d5"
+down_revision: Union[str, Sequence[str], None] = "3c1a2b7d9e40"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_resource_status_resource_id_created_at",
+        "resource_status",
+        ["resource_id", sa.text("created_at DESC")],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_resource_status_resource_id_created_at", table_name="resource_status")
@@ -0,0 +1,99 @@
+"""added resource_status_rollup and watermark tables
+
+Revision ID: a4d8c2f61b37
+Revises: 7b2f4e91c0d5
+Create Date: 2026-10-18 13:00:47.261945
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "a4d8c2f61b37"
+down_revision: Union[str, Sequence[str], None] = "7b2f4e91c0d5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("DROP TYPE IF EXISTS rollup_resolution")
+    rollup_resolution_enum = postgresql.ENUM(
+        "MINUTE",
+        "FIVE_MINUTES",
+        "HOUR",
+        name="rollup_resolution",
+    )
+    rollup_resolution_enum.create(op.get_bind())
+
+    op.create_table(
+        "resource_status_rollup",
+        sa.Column("resource_id", sa.Integer(), nullable=False),
+        sa.Column(
+            "resolution",
+            postgresql.ENUM(name="rollup_resolution", create_type=False),
+            nullable=False,
+        ),
+        sa.Column("bucket_start", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("count", sa.Integer(), nullable=False),
+        sa.Column("failure_count", sa.Integer(), nullable=False),
+        sa.Column("response_time_min", sa.Float(), nullable=False),
+        sa.Column("response_time_avg", sa.Float(), nullable=False),
+        sa.Column("response_time_max", sa.Float(), nullable=False),
+        sa.Column("response_time_p50", sa.Float(), nullable=False),
+        sa.Column("response_time_p95", sa.Float(), nullable=False),
+        sa.Column("response_time_p99", sa.Float(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(
+            ["resource_id"],
+            ["resource.resource_id"],
+            name=op.f("fk_resource_status_rollup_resource_id_resource"),
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint(
+            "resource_id",
+            "resolution",
+            "bucket_start",
+            name=op.f("pk_resource_status_rollup"),
+        ),
+    )
+    op.create_table(
+        "watermark",
+        sa.Column("name", sa.String(length=64), nullable=False),
+        sa.Column("value", sa.DateTime(timezone=True), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("name", name=op.f("pk_watermark")),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("watermark")
+    op.drop_table("resource_status_rollup")
+    op.execute("DROP TYPE IF EXISTS rollup_resolution")
@@ -0,0 +1,77 @@
+"""added resource_sla table
+
+Revision ID: c58e0f3a9d12
+Revises: a4d8c2f61b37
+Create Date: 2026-10-18 13:30:12.604711
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "c58e0f3a9d12"
+down_revision: Union[str, Sequence[str], None] = "a4d8c2f61b37"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("DROP TYPE IF EXISTS sla_window")
+    sla_window_enum = postgresql.ENUM(
+        "DAY",
+        "WEEK",
+        "MONTH",
+        name="sla_window",
+    )
+    sla_window_enum.create(op.get_bind())
+
+    op.create_table(
+        "resource_sla",
+        sa.Column("resource_id", sa.Integer(), nullable=False),
+        sa.Column(
+            "sla_window",
+            postgresql.ENUM(name="sla_window", create_type=False),
+            nullable=False,
+        ),
+        sa.Column("checks", sa.Integer(), nullable=False),
+        sa.Column("uptime_percent", sa.Float(), nullable=False),
+        sa.Column("downtime_minutes", sa.Float(), nullable=False),
+        sa.Column("incident_count", sa.Integer(), nullable=False),
+        sa.Column("response_time_p50", sa.Float(), nullable=False),
+        sa.Column("response_time_p95", sa.Float(), nullable=False),
+        sa.Column("response_time_p99", sa.Float(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(
+            ["resource_id"],
+            ["resource.resource_id"],
+            name=op.f("fk_resource_sla_resource_id_resource"),
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint(
+            "resource_id",
+            "sla_window",
+            name=op.f("pk_resource_sla"),
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("resource_sla")
+    op.execute("DROP TYPE IF EXISTS sla_window")
@@ -0,0 +1,42 @@
+"""added probe_method field for resource model
+
+Revision ID: d2b97a4e1f63
+Revises: c58e0f3a9d12
+Create Date: 2026-10-18 14:00:26.381044
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "d2b97a4e1f63"
+down_revision: Union[str, Sequence[str], None] = "c58e0f3a9d12"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("DROP TYPE IF EXISTS probe_method")
+    probe_method_enum = postgresql.ENUM("HEAD", "GET", "GET_RANGE", name="probe_method")
+    probe_method_enum.create(op.get_bind())
+
+    op.add_column(
+        "resource",
+        sa.Column(
+            "probe_method",
+            probe_method_enum,
+            server_default="HEAD",
+            nullable=False,
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("resource", "probe_method")
+    op.execute("DROP TYPE IF EXISTS probe_method")
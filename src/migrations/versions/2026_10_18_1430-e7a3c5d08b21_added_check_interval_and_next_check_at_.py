@@ -0,0 +1,53 @@
+"""added check_interval and next_check_at fields for resource model
+
+Revision ID: e7a3c5d08b21
+Revises: d2b97a4e1f63
+Create Date: 2026-10-18 14:30:52.907316
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e7a3c5d08b21"
+down_revision: Union[str, Sequence[str], None] = "d2b97a4e1f63"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "resource",
+        sa.Column(
+            "check_interval",
+            sa.Integer(),
+            server_default="60",
+            nullable=False,
+        ),
+    )
+    op.add_column(
+        "resource",
+        sa.Column(
+            "next_check_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+    )
+    op.create_index(
+        op.f("ix_resource_next_check_at"),
+        "resource",
+        ["next_check_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f("ix_resource_next_check_at"), table_name="resource")
+    op.drop_column("resource", "next_check_at")
+    op.drop_column("resource", "check_interval")
@@ -0,0 +1,32 @@
+"""added phase timings for resource_status model
+
+Revision ID: f4c81d2e6a90
+Revises: e7a3c5d08b21
+Create Date: 2026-10-18 15:00:09.553872
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f4c81d2e6a90"
+down_revision: Union[str, Sequence[str], None] = "e7a3c5d08b21"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("resource_status", sa.Column("dns_time", sa.Float(), nullable=True))
+    op.add_column("resource_status", sa.Column("connect_time", sa.Float(), nullable=True))
+    op.add_column("resource_status", sa.Column("ttfb", sa.Float(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("resource_status", "ttfb")
+    op.drop_column("resource_status", "connect_time")
+    op.drop_column("resource_status", "dns_time")
@@ -0,0 +1,31 @@
+"""added version for resource model
+
+Revision ID: 0b6e2f9c4d17
+Revises: f4c81d2e6a90
+Create Date: 2026-10-18 15:30:27.190544
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0b6e2f9c4d17"
+down_revision: Union[str, Sequence[str], None] = "f4c81d2e6a90"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "resource",
+        sa.Column("version", sa.Integer(), server_default="1", nullable=False),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("resource", "version")
@@ -0,0 +1,38 @@
+"""added pending and rejected resource states
+
+Revision ID: 7d3f1a8c2e55
+Revises: 0b6e2f9c4d17
+Create Date: 2026-10-18 16:00:12.730415
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7d3f1a8c2e55"
+down_revision: Union[str, Sequence[str], None] = "0b6e2f9c4d17"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # New enum values cannot be used in the transaction that adds them.
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TYPE resource_state ADD VALUE IF NOT EXISTS 'PENDING'")
+        op.execute("ALTER TYPE resource_state ADD VALUE IF NOT EXISTS 'REJECTED'")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Postgres cannot drop enum values, so the type is rebuilt without them.
+    op.execute("DELETE FROM resource WHERE state IN ('PENDING', 'REJECTED')")
+    op.execute("ALTER TYPE resource_state RENAME TO resource_state_old")
+    op.execute("CREATE TYPE resource_state AS ENUM ('UP', 'DOWN', 'UNKNOWN')")
+    op.execute(
+        "ALTER TABLE resource ALTER COLUMN state TYPE resource_state "
+        "USING state::text::resource_state"
+    )
+    op.execute("DROP TYPE resource_state_old")
@@ -0,0 +1,42 @@
+"""added run-length fields for resource_status model
+
+Revision ID: a81c5e3b7f02
+Revises: 7d3f1a8c2e55
+Create Date: 2026-10-18 16:30:44.018273
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a81c5e3b7f02"
+down_revision: Union[str, Sequence[str], None] = "7d3f1a8c2e55"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("resource_status", sa.Column("latency_bucket", sa.SmallInteger(), nullable=True))
+    op.add_column(
+        "resource_status",
+        sa.Column("repeat_count", sa.Integer(), server_default="1", nullable=False),
+    )
+    op.add_column(
+        "resource_status",
+        sa.Column("last_seen_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.add_column("resource_status", sa.Column("response_time_min", sa.Float(), nullable=True))
+    op.add_column("resource_status", sa.Column("response_time_max", sa.Float(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("resource_status", "response_time_max")
+    op.drop_column("resource_status", "response_time_min")
+    op.drop_column("resource_status", "last_seen_at")
+    op.drop_column("resource_status", "repeat_count")
+    op.drop_column("resource_status", "latency_bucket")
@@ -1,2 +1,5 @@
 # ruff: noqa: F401
 from src.models.resoures import Resource, ResourceStatus
+from src.models.rollups import ResourceStatusRollup
+from src.models.watermarks import Watermark
+from src.models.sla import ResourceSLA
@@ -1,10 +1,24 @@
-from sqlalchemy import ForeignKey, Integer, String
+from datetime import datetime
+
+from sqlalchemy import (
+    DDL,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    SmallInteger,
+    String,
+    event,
+    func,
+    literal_column,
+)
 from sqlalchemy.dialects.postgresql import ENUM
 from sqlalchemy.orm import Mapped, mapped_column
 
+from src.config import settings
 from src.models.base import Base
 from src.models.mixins.timing import TimingMixin
-from src.schemas.enums import ResourceState
+from src.schemas.enums import ProbeMethod, ResourceState
 
 
 class Resource(Base, TimingMixin):
@@ -24,10 +38,38 @@ class Resource(Base, TimingMixin):
         ),
         default=ResourceState.UP,
     )
+    probe_method: Mapped[ProbeMethod] = mapped_column(
+        ENUM(
+            ProbeMethod,
+            name="probe_method",
+        ),
+        default=ProbeMethod.HEAD,
+        server_default=ProbeMethod.HEAD.name,
+    )
+    check_interval: Mapped[int] = mapped_column(
+        Integer,
+        default=settings.taskiq.CHECK_INTERVAL_MIN,
+        server_default=str(settings.taskiq.CHECK_INTERVAL_MIN),
+    )
+    next_check_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        index=True,
+    )
+    # Bumped by every UPDATE of the row, so listings can tell cheaply whether they changed.
+    version: Mapped[int] = mapped_column(
+        Integer,
+        default=1,
+        server_default="1",
+        onupdate=literal_column("version") + 1,
+    )
 
 
 class ResourceStatus(Base, TimingMixin):
     __tablename__ = "resource_status"
+    __table_args__ = {
+        "postgresql_partition_by": "RANGE (created_at)",
+    }
 
     resource_status_id: Mapped[int] = mapped_column(
         Integer,
@@ -37,4 +79,35 @@ class ResourceStatus(Base, TimingMixin):
     )
     response_time: Mapped[float]
     status_code: Mapped[int]
+    dns_time: Mapped[float | None]
+    connect_time: Mapped[float | None]
+    ttfb: Mapped[float | None]
+    latency_bucket: Mapped[int | None] = mapped_column(SmallInteger)
+    # A row is a run of identical outcomes when run-length storage is enabled:
+    # response_time is the mean of the run and last_seen_at its latest check.
+    repeat_count: Mapped[int] = mapped_column(Integer, default=1, server_default="1")
+    last_seen_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+    response_time_min: Mapped[float | None]
+    response_time_max: Mapped[float | None]
     resource_id: Mapped[int] = mapped_column(ForeignKey(f"{Resource.__tablename__}.resource_id"))
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        primary_key=True,
+    )
+
+
+Index(
+    "ix_resource_status_resource_id_created_at",
+    ResourceStatus.resource_id,
+    ResourceStatus.created_at.desc(),
+)
+
+
+event.listen(
+    ResourceStatus.__table__,
+    "after_create",
+    DDL("CREATE TABLE IF NOT EXISTS %(table)s_default PARTITION OF %(table)s DEFAULT").execute_if(
+        dialect="postgresql"
+    ),
+)
@@ -0,0 +1,41 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, ForeignKey, Integer
+from sqlalchemy.dialects.postgresql import ENUM
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.models.base import Base
+from src.models.mixins.timing import TimingMixin
+from src.models.resoures import Resource
+from src.schemas.enums import RollupResolution
+
+
+class ResourceStatusRollup(Base, TimingMixin):
+    __tablename__ = "resource_status_rollup"
+
+    resource_id: Mapped[int] = mapped_column(
+        ForeignKey(f"{Resource.__tablename__}.resource_id", ondelete="CASCADE"),
+        primary_key=True,
+        sort_order=-1,
+    )
+    resolution: Mapped[RollupResolution] = mapped_column(
+        ENUM(
+            RollupResolution,
+            name="rollup_resolution",
+        ),
+        primary_key=True,
+        sort_order=-1,
+    )
+    bucket_start: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        primary_key=True,
+        sort_order=-1,
+    )
+    count: Mapped[int] = mapped_column(Integer)
+    failure_count: Mapped[int] = mapped_column(Integer)
+    response_time_min: Mapped[float]
+    response_time_avg: Mapped[float]
+    response_time_max: Mapped[float]
+    response_time_p50: Mapped[float]
+    response_time_p95: Mapped[float]
+    response_time_p99: Mapped[float]
@@ -0,0 +1,34 @@
+from sqlalchemy import ForeignKey, Integer
+from sqlalchemy.dialects.postgresql import ENUM
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.models.base import Base
+from src.models.mixins.timing import TimingMixin
+from src.models.resoures import Resource
+from src.schemas.enums import SLAWindow
+
+
+class ResourceSLA(Base, TimingMixin):
+    __tablename__ = "resource_sla"
+
+    resource_id: Mapped[int] = mapped_column(
+        ForeignKey(f"{Resource.__tablename__}.resource_id", ondelete="CASCADE"),
+        primary_key=True,
+        sort_order=-1,
+    )
+    window: Mapped[SLAWindow] = mapped_column(
+        "sla_window",
+        ENUM(
+            SLAWindow,
+            name="sla_window",
+        ),
+        primary_key=True,
+        sort_order=-1,
+    )
+    checks: Mapped[int] = mapped_column(Integer)
+    uptime_percent: Mapped[float]
+    downtime_minutes: Mapped[float]
+    incident_count: Mapped[int] = mapped_column(Integer)
+    response_time_p50: Mapped[float]
+    response_time_p95: Mapped[float]
+    response_time_p99: Mapped[float]
@@ -0,0 +1,14 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.models.base import Base
+from src.models.mixins.timing import TimingMixin
+
+
+class Watermark(Base, TimingMixin):
+    __tablename__ = "watermark"
+
+    name: Mapped[str] = mapped_column(String(64), primary_key=True, sort_order=-1)
+    value: Mapped[datetime] = mapped_column(DateTime(timezone=True))
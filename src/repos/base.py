@@ -1,4 +1,4 @@
-from typing import Generic, Sequence
+from typing import AsyncIterator, Generic, Sequence
 
 from asyncpg import (
     CheckViolationError,
@@ -6,7 +6,8 @@ from asyncpg import (
     ForeignKeyViolationError,
     UniqueViolationError,
 )
-from sqlalchemy import delete, insert, select, update
+from sqlalchemy import delete, insert, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import DBAPIError, IntegrityError, NoResultFound
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -47,6 +48,29 @@ class BaseRepo(Generic[ModelType, SchemaType, SchemaUpdateType]):
             raise exc
         return [self.mapper.map_to_domain_entity(item) for item in result.scalars().all()]
 
+    async def stream_all_filtered(
+        self,
+        *filter,
+        order_by: Sequence = (),
+        chunk_size: int = 1000,
+        **filter_by,
+    ) -> AsyncIterator[list[SchemaType]]:
+        query = (
+            select(self.model)
+            .filter(*filter)
+            .filter_by(**filter_by)
+            .order_by(*order_by)
+            .execution_options(yield_per=chunk_size)
+        )
+        try:
+            result = await self.session.stream(query)
+        except DBAPIError as exc:
+            if exc.orig and isinstance(exc.orig.__cause__, DataError):
+                raise ValueOutOfRangeError(detail=exc.orig.__cause__.args[0]) from exc
+            raise exc
+        async for partition in result.scalars().partitions():
+            yield [self.mapper.map_to_domain_entity(item) for item in partition]
+
     async def get_all(self) -> list[SchemaType]:
         return await self.get_all_filtered()
 
@@ -78,12 +102,24 @@ class BaseRepo(Generic[ModelType, SchemaType, SchemaUpdateType]):
 
         return self.mapper.map_to_domain_entity(obj)
 
-    async def add_bulk(self, data: Sequence[BaseDTO]) -> list[SchemaType]:
-        add_obj_stmt = (
-            insert(self.model).values([item.model_dump() for item in data]).returning(self.model)
-        )
+    async def add_bulk(
+        self,
+        data: Sequence[BaseDTO],
+        returning: bool = True,
+        ignore_conflicts: bool = False,
+    ) -> list[SchemaType]:
+        if not data:
+            return []
+
+        values = [item.model_dump() for item in data]
+        add_stmt = insert(self.model)
+        if ignore_conflicts:
+            add_stmt = pg_insert(self.model).on_conflict_do_nothing()
         try:
-            result = await self.session.execute(add_obj_stmt)
+            if not returning:
+                await self.session.execute(add_stmt, values)
+                return []
+            result = await self.session.execute(add_stmt.values(values).returning(self.model))
         except IntegrityError as exc:
             self.__handle_integrity_error(exc)
             raise exc
@@ -154,5 +190,17 @@ class BaseRepo(Generic[ModelType, SchemaType, SchemaUpdateType]):
             raise exc
         return True
 
+    async def delete_batch(self, *filter, batch_size: int) -> int:
+        pk_columns = tuple(self.model.__table__.primary_key.columns)
+        to_delete = select(*pk_columns).filter(*filter).limit(batch_size)
+        delete_obj_stmt = delete(self.model).where(tuple_(*pk_columns).in_(to_delete))
+        try:
+            result = await self.session.execute(delete_obj_stmt)
+        except DBAPIError as exc:
+            if exc.orig and isinstance(exc.orig.__cause__, DataError):
+                raise ValueOutOfRangeError(detail=exc.orig.__cause__.args[0]) from exc
+            raise exc
+        return result.rowcount  # type: ignore[attr-defined]
+
     async def delete_all(self, ensure_existence=False) -> bool:
         return await self.delete(ensure_existence=ensure_existence)
@@ -1,6 +1,11 @@
 from src.models.resoures import Resource, ResourceStatus
+from src.models.rollups import ResourceStatusRollup
+from src.models.sla import ResourceSLA
+from src.models.watermarks import Watermark
 from src.repos.mappers.base import DataMapper
 from src.schemas.resoures import ResourceDTO, ResourceStatusDTO
+from src.schemas.rollups import ResourceStatusRollupDTO, WatermarkDTO
+from src.schemas.sla import ResourceSLADTO
 
 
 class ResourceMapper(DataMapper[Resource, ResourceDTO]):
@@ -11,3 +16,18 @@ class ResourceMapper(DataMapper[Resource, ResourceDTO]):
 class ResourceStatusMapper(DataMapper[ResourceStatus, ResourceStatusDTO]):
     model = ResourceStatus
     schema = ResourceStatusDTO
+
+
+class ResourceStatusRollupMapper(DataMapper[ResourceStatusRollup, ResourceStatusRollupDTO]):
+    model = ResourceStatusRollup
+    schema = ResourceStatusRollupDTO
+
+
+class WatermarkMapper(DataMapper[Watermark, WatermarkDTO]):
+    model = Watermark
+    schema = WatermarkDTO
+
+
+class ResourceSLAMapper(DataMapper[ResourceSLA, ResourceSLADTO]):
+    model = ResourceSLA
+    schema = ResourceSLADTO
@@ -1,12 +1,90 @@
+from datetime import datetime
+from typing import AsyncIterator, Sequence
+
+from asyncpg import DataError
+from sqlalchemy import (
+    ColumnElement,
+    Integer,
+    case,
+    cast,
+    func,
+    insert,
+    select,
+    text,
+    tuple_,
+    update,
+)
+from sqlalchemy.exc import DBAPIError
+
 from src.models.resoures import Resource, ResourceStatus
 from src.repos.base import BaseRepo
 from src.repos.mappers.mappers import ResourceMapper, ResourceStatusMapper
+from src.schemas.enums import ResourceState
 from src.schemas.resoures import (
     ResourceDTO,
+    ResourceStatusAddDTO,
     ResourceStatusDTO,
     ResourceStatusUpdateDTO,
     ResourceUpdateDTO,
 )
+from src.utils.exceptions import ValueOutOfRangeError
+from src.utils.partitions import get_partition_ddl
+
+
+# The latest row of a resource absorbs a new check when the status code and the
+# latency bucket are unchanged and the run is younger than max_run_seconds.
+# Everything else starts a new run.
+ADD_RUNS_SQL = """
+WITH incoming AS (
+    SELECT * FROM unnest(
+        CAST(:resource_ids AS integer[]),
+        CAST(:response_times AS double precision[]),
+        CAST(:status_codes AS integer[]),
+        CAST(:latency_buckets AS smallint[]),
+        CAST(:dns_times AS double precision[]),
+        CAST(:connect_times AS double precision[]),
+        CAST(:ttfbs AS double precision[])
+    ) AS i(resource_id, response_time, status_code, latency_bucket, dns_time, connect_time, ttfb)
+),
+latest AS (
+    SELECT DISTINCT ON (s.resource_id) s.resource_id, s.resource_status_id, s.created_at
+    FROM resource_status s
+    JOIN incoming i ON i.resource_id = s.resource_id
+    WHERE s.created_at >= now() - make_interval(secs => :max_run_seconds)
+    ORDER BY s.resource_id, s.created_at DESC, s.resource_status_id DESC
+),
+extended AS (
+    UPDATE resource_status s SET
+        response_time = (s.response_time * s.repeat_count + i.response_time)
+            / (s.repeat_count + 1),
+        response_time_min = least(coalesce(s.response_time_min, s.response_time), i.response_time),
+        response_time_max = greatest(
+            coalesce(s.response_time_max, s.response_time), i.response_time
+        ),
+        repeat_count = s.repeat_count + 1,
+        last_seen_at = now(),
+        updated_at = now()
+    FROM latest l
+    JOIN incoming i ON i.resource_id = l.resource_id
+    WHERE s.resource_status_id = l.resource_status_id
+        AND s.created_at = l.created_at
+        AND s.status_code = i.status_code
+        AND s.latency_bucket IS NOT DISTINCT FROM i.latency_bucket
+    RETURNING s.resource_id
+)
+INSERT INTO resource_status (
+    resource_id, response_time, status_code, latency_bucket, dns_time, connect_time, ttfb
+)
+SELECT
+    i.resource_id, i.response_time, i.status_code, i.latency_bucket,
+    i.dns_time, i.connect_time, i.ttfb
+FROM incoming i
+WHERE i.resource_id NOT IN (SELECT resource_id FROM extended)
+"""
+
+
+def _after_seconds(seconds: ColumnElement[int] | int) -> ColumnElement[datetime]:
+    return func.now() + func.make_interval(0, 0, 0, 0, 0, 0, seconds)
 
 
 class ResourceRepo(BaseRepo[Resource, ResourceDTO, ResourceUpdateDTO]):
@@ -14,8 +92,275 @@ class ResourceRepo(BaseRepo[Resource, ResourceDTO, ResourceUpdateDTO]):
     mapper = ResourceMapper
     model = Resource
 
+    async def claim_due(
+        self,
+        limit: int,
+        min_interval: int,
+        max_interval: int,
+        backoff: float,
+    ) -> list[ResourceDTO]:
+        due = (
+            select(self.model.resource_id)
+            .where(
+                self.model.next_check_at <= func.now(),
+                self.model.state.notin_((ResourceState.PENDING, ResourceState.REJECTED)),
+            )
+            .order_by(self.model.next_check_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        # Resources that are not UP are re-checked as often as allowed,
+        # stable ones back off a little more with every claim.
+        interval = case(
+            (
+                self.model.state == ResourceState.UP,
+                func.least(
+                    max_interval,
+                    cast(func.ceil(self.model.check_interval * backoff), Integer),
+                ),
+            ),
+            else_=min_interval,
+        )
+        claim_stmt = (
+            update(self.model)
+            .where(self.model.resource_id.in_(due.scalar_subquery()))
+            .values(
+                check_interval=interval,
+                next_check_at=_after_seconds(interval),
+                # A claim only moves scheduling columns, which are not part of
+                # the API payload, so it must not change the listing ETag.
+                updated_at=self.model.updated_at,
+                version=self.model.version,
+            )
+            .returning(self.model)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.session.execute(claim_stmt)
+        return [self.mapper.map_to_domain_entity(item) for item in result.scalars().all()]
+
+    async def postpone_check(self, resource_id: int, seconds: int) -> None:
+        postpone_stmt = (
+            update(self.model)
+            .where(self.model.resource_id == resource_id)
+            .values(
+                next_check_at=_after_seconds(seconds),
+                updated_at=self.model.updated_at,
+                version=self.model.version,
+            )
+        )
+        await self.session.execute(postpone_stmt)
+
+    async def reject_pending(self, created_before: datetime) -> list[int]:
+        reject_stmt = (
+            update(self.model)
+            .where(
+                self.model.state == ResourceState.PENDING,
+                self.model.created_at < created_before,
+            )
+            .values(state=ResourceState.REJECTED)
+            .returning(self.model.resource_id)
+        )
+        result = await self.session.execute(reject_stmt)
+        return list(result.scalars().all())
+
+    async def compare_and_set_state(
+        self,
+        resource_id: int,
+        expected: ResourceState,
+        new_state: ResourceState,
+        status: ResourceStatusAddDTO | None = None,
+        check_interval: int | None = None,
+    ) -> tuple[bool, ResourceState | None]:
+        values = {"state": new_state}
+        if check_interval is not None:
+            values |= {
+                "check_interval": check_interval,
+                "next_check_at": _after_seconds(check_interval),
+            }
+        transition = (
+            update(self.model)
+            .where(self.model.resource_id == resource_id, self.model.state == expected)
+            .values(**values)
+            .returning(self.model.state)
+            .cte("transition")
+        )
+        # Every CTE reads the same snapshot, so current_state is the state
+        # the row had before the conditional update above.
+        current = select(self.model.state).where(self.model.resource_id == resource_id)
+        query = select(
+            select(transition.c.state).scalar_subquery().label("applied_state"),
+            current.scalar_subquery().label("current_state"),
+        )
+        if status is not None:
+            inserted = (
+                insert(ResourceStatus)
+                .values(**status.model_dump())
+                .returning(ResourceStatus.resource_status_id)
+                .cte("inserted")
+            )
+            query = query.add_columns(
+                select(inserted.c.resource_status_id).scalar_subquery().label("status_id")
+            )
+
+        result = await self.session.execute(query)
+        row = result.one()
+        return row.applied_state is not None, row.current_state
+
+    async def get_version(self, resource_id: int) -> int | None:
+        query = select(self.model.version).filter_by(resource_id=resource_id)
+        try:
+            result = await self.session.execute(query)
+        except DBAPIError as exc:
+            if exc.orig and isinstance(exc.orig.__cause__, DataError):
+                raise ValueOutOfRangeError(detail=exc.orig.__cause__.args[0]) from exc
+            raise exc
+        return result.scalar_one_or_none()
+
+    async def get_listing_marker(self) -> tuple[int, int, int]:
+        # Deleting one row and inserting another keeps the count, but the max id grows.
+        query = select(
+            func.count(),
+            func.coalesce(func.max(self.model.resource_id), 0),
+            func.coalesce(func.sum(self.model.version), 0),
+        )
+        result = await self.session.execute(query)
+        count, max_id, versions = result.one()
+        return count, max_id, versions
+
 
 class ResourceStatusRepo(BaseRepo[ResourceStatus, ResourceStatusDTO, ResourceStatusUpdateDTO]):
     schema = ResourceStatusDTO
     mapper = ResourceStatusMapper
     model = ResourceStatus
+
+    def _get_range_filters(
+        self,
+        resource_id: int,
+        date_from: datetime | None = None,
+        date_to: datetime | None = None,
+        after: tuple[datetime, int] | None = None,
+    ) -> list[ColumnElement[bool]]:
+        filters = [self.model.resource_id == resource_id]
+        if date_from is not None:
+            filters.append(self.model.created_at >= date_from)
+        if date_to is not None:
+            filters.append(self.model.created_at < date_to)
+        if after is not None:
+            filters.append(
+                tuple_(self.model.created_at, self.model.resource_status_id) < tuple_(*after)
+            )
+        return filters
+
+    async def get_page(
+        self,
+        resource_id: int,
+        limit: int,
+        date_from: datetime | None = None,
+        date_to: datetime | None = None,
+        after: tuple[datetime, int] | None = None,
+    ) -> list[ResourceStatusDTO]:
+        filters = self._get_range_filters(resource_id, date_from, date_to, after)
+        query = (
+            select(self.model)
+            .filter(*filters)
+            .order_by(
+                self.model.created_at.desc(),
+                self.model.resource_status_id.desc(),
+            )
+            .limit(limit)
+        )
+
+        result = await self.session.execute(query)
+        return [self.mapper.map_to_domain_entity(item) for item in result.scalars().all()]
+
+    async def get_oldest_created_at(self) -> datetime | None:
+        result = await self.session.execute(select(func.min(self.model.created_at)))
+        return result.scalar_one_or_none()
+
+    async def get_range_marker(
+        self,
+        resource_id: int,
+        date_from: datetime | None = None,
+        date_to: datetime | None = None,
+        after: tuple[datetime, int] | None = None,
+    ) -> tuple[datetime | None, datetime | None]:
+        # Statuses are only ever appended, expired from the oldest end or extended
+        # as a run, so one of the ends of the range changes whenever a page of it does.
+        filters = self._get_range_filters(resource_id, date_from, date_to, after)
+        query = select(
+            func.min(self.model.created_at),
+            func.max(func.coalesce(self.model.last_seen_at, self.model.created_at)),
+        ).filter(*filters)
+        result = await self.session.execute(query)
+        oldest, newest = result.one()
+        return oldest, newest
+
+    async def stream_range(
+        self,
+        resource_id: int,
+        date_from: datetime | None = None,
+        date_to: datetime | None = None,
+        chunk_size: int = 1000,
+    ) -> AsyncIterator[list[ResourceStatusDTO]]:
+        filters = self._get_range_filters(resource_id, date_from, date_to)
+        async for chunk in self.stream_all_filtered(
+            *filters,
+            order_by=(self.model.created_at, self.model.resource_status_id),
+            chunk_size=chunk_size,
+        ):
+            yield chunk
+
+    async def add_runs(
+        self,
+        data: Sequence[ResourceStatusAddDTO],
+        max_run_seconds: int,
+    ) -> int:
+        # A resource may appear only once per statement, so repeated checks
+        # of the same resource are applied in later rounds.
+        rounds: list[dict[int, ResourceStatusAddDTO]] = []
+        for item in data:
+            for batch in rounds:
+                if item.resource_id not in batch:
+                    batch[item.resource_id] = item
+                    break
+            else:
+                rounds.append({item.resource_id: item})
+
+        inserted = 0
+        for batch in rounds:
+            items = list(batch.values())
+            params = {
+                "resource_ids": [item.resource_id for item in items],
+                "response_times": [item.response_time for item in items],
+                "status_codes": [item.status_code for item in items],
+                "latency_buckets": [item.latency_bucket for item in items],
+                "dns_times": [item.dns_time for item in items],
+                "connect_times": [item.connect_time for item in items],
+                "ttfbs": [item.ttfb for item in items],
+                "max_run_seconds": max_run_seconds,
+            }
+            result = await self.session.execute(text(ADD_RUNS_SQL), params)
+            inserted += result.rowcount  # type: ignore[attr-defined]
+        return inserted
+
+    async def get_partitions(self) -> list[str]:
+        query = text(
+            "SELECT child.relname FROM pg_inherits "
+            "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE parent.relname = :table"
+        )
+        result = await self.session.execute(query, {"table": self.model.__tablename__})
+        return list(result.scalars().all())
+
+    async def create_partition(self, name: str, start: datetime, end: datetime) -> None:
+        ddl = get_partition_ddl(
+            table=self.model.__tablename__,
+            name=name,
+            start=start,
+            end=end,
+        )
+        await self.session.execute(text(ddl))
+
+    async def drop_partition(self, name: str) -> None:
+        await self.session.execute(text(f'DROP TABLE IF EXISTS "{name}"'))
@@ -0,0 +1,154 @@
+from datetime import datetime, timedelta
+
+from sqlalchemy import ColumnElement, Float, cast, delete, func, literal_column, select, true
+from sqlalchemy.dialects.postgresql import insert
+
+from src.models.resoures import ResourceStatus
+from src.models.rollups import ResourceStatusRollup
+from src.repos.base import BaseRepo
+from src.repos.mappers.mappers import ResourceStatusRollupMapper
+from src.schemas.enums import RollupResolution
+from src.schemas.rollups import ResourceStatusRollupDTO
+from src.utils.statuses import valid_status_clause
+
+
+class ResourceStatusRollupRepo(
+    BaseRepo[ResourceStatusRollup, ResourceStatusRollupDTO, ResourceStatusRollupDTO]
+):
+    schema = ResourceStatusRollupDTO
+    mapper = ResourceStatusRollupMapper
+    model = ResourceStatusRollup
+
+    async def refresh(
+        self,
+        resolution: RollupResolution,
+        since: datetime,
+        until: datetime,
+        max_run_seconds: int = 0,
+    ) -> int:
+        status = ResourceStatus
+        last_seen_at = func.coalesce(status.last_seen_at, status.created_at)
+
+        def get_bucket_start(moment: ColumnElement[datetime]) -> ColumnElement[datetime]:
+            return func.date_bin(
+                literal_column(f"'{resolution.seconds} seconds'::interval"),
+                moment,
+                literal_column("'1970-01-01 00:00:00+00'::timestamptz"),
+            )
+
+        # A run that grew since the last refresh moves the interpolated times of
+        # all its samples, so every bucket from the start of its oldest touched
+        # run is recomputed from scratch for that resource.
+        horizon = since - timedelta(seconds=max_run_seconds)
+        touched = (
+            select(
+                status.resource_id,
+                get_bucket_start(func.min(status.created_at)).label("bucket_start"),
+            )
+            .filter(
+                status.created_at >= horizon,
+                status.created_at < until,
+                last_seen_at >= since,
+            )
+            .group_by(status.resource_id)
+            .cte("touched")
+        )
+
+        delete_stmt = (
+            delete(self.model)
+            .where(
+                self.model.resource_id == touched.c.resource_id,
+                self.model.resolution == resolution,
+                self.model.bucket_start >= touched.c.bucket_start,
+                self.model.bucket_start < until,
+            )
+            .add_cte(touched)
+        )
+        await self.session.execute(delete_stmt)
+
+        # A status row is a run of identical checks, so it is expanded back into
+        # repeat_count samples spread evenly between its first and last check.
+        sample = (
+            func.generate_series(1, status.repeat_count)
+            .table_valued("n")
+            .render_derived(name="sample")
+            .lateral()
+        )
+        sample_at = status.created_at + (last_seen_at - status.created_at) * (
+            cast(sample.c.n - 1, Float) / func.greatest(status.repeat_count - 1, 1)
+        )
+        response_time = status.response_time
+        bucket_start = get_bucket_start(sample_at)
+
+        aggregated = (
+            select(
+                status.resource_id,
+                literal_column(f"'{resolution.name}'::rollup_resolution"),
+                bucket_start,
+                func.count(),
+                func.count().filter(~valid_status_clause(status.status_code)),
+                func.min(func.coalesce(status.response_time_min, response_time)),
+                func.avg(response_time),
+                func.max(func.coalesce(status.response_time_max, response_time)),
+                func.percentile_cont(0.5).within_group(response_time),
+                func.percentile_cont(0.95).within_group(response_time),
+                func.percentile_cont(0.99).within_group(response_time),
+            )
+            .select_from(status)
+            .join(touched, touched.c.resource_id == status.resource_id)
+            .join(sample, true())
+            .filter(
+                # Runs overlapping the oldest recomputed bucket start at most one
+                # bucket and one run length before the horizon.
+                status.created_at
+                >= horizon - timedelta(seconds=resolution.seconds + max_run_seconds),
+                status.created_at < until,
+                last_seen_at >= touched.c.bucket_start,
+                sample_at >= touched.c.bucket_start,
+                sample_at < until,
+            )
+            .group_by(status.resource_id, bucket_start)
+        )
+
+        columns = [
+            "resource_id",
+            "resolution",
+            "bucket_start",
+            "count",
+            "failure_count",
+            "response_time_min",
+            "response_time_avg",
+            "response_time_max",
+            "response_time_p50",
+            "response_time_p95",
+            "response_time_p99",
+        ]
+        upsert_stmt = insert(self.model).from_select(columns, aggregated)
+        upsert_stmt = upsert_stmt.on_conflict_do_update(
+            index_elements=["resource_id", "resolution", "bucket_start"],
+            set_={
+                **{column: upsert_stmt.excluded[column] for column in columns[3:]},
+                "updated_at": func.now(),
+            },
+        )
+        result = await self.session.execute(upsert_stmt)
+        return result.rowcount  # type: ignore[attr-defined]
+
+    async def get_range(
+        self,
+        resource_id: int,
+        resolution: RollupResolution,
+        date_from: datetime,
+        date_to: datetime,
+    ) -> list[ResourceStatusRollupDTO]:
+        query = (
+            select(self.model)
+            .filter_by(resource_id=resource_id, resolution=resolution)
+            .filter(
+                self.model.bucket_start >= date_from,
+                self.model.bucket_start < date_to,
+            )
+            .order_by(self.model.bucket_start)
+        )
+        result = await self.session.execute(query)
+        return [self.mapper.map_to_domain_entity(item) for item in result.scalars().all()]
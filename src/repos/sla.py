@@ -0,0 +1,91 @@
+from sqlalchemy import Float, and_, cast, delete, func, literal_column, select
+from sqlalchemy.dialects.postgresql import insert
+
+from src.models.rollups import ResourceStatusRollup
+from src.models.sla import ResourceSLA
+from src.repos.base import BaseRepo
+from src.repos.mappers.mappers import ResourceSLAMapper
+from src.schemas.enums import SLAWindow
+from src.schemas.sla import ResourceSLADTO
+
+
+class ResourceSLARepo(BaseRepo[ResourceSLA, ResourceSLADTO, ResourceSLADTO]):
+    schema = ResourceSLADTO
+    mapper = ResourceSLAMapper
+    model = ResourceSLA
+
+    async def refresh(self, window: SLAWindow) -> int:
+        rollup = ResourceStatusRollup
+        resolution = window.resolution
+        is_failing = rollup.failure_count > 0
+
+        buckets = (
+            select(
+                rollup.resource_id,
+                rollup.count,
+                rollup.failure_count,
+                rollup.response_time_p50,
+                rollup.response_time_p95,
+                rollup.response_time_p99,
+                is_failing.label("is_failing"),
+                func.lag(is_failing, 1, False)
+                .over(partition_by=rollup.resource_id, order_by=rollup.bucket_start)
+                .label("was_failing"),
+            )
+            .filter(
+                rollup.resolution == resolution,
+                rollup.bucket_start >= func.now() - window.delta,
+            )
+            .subquery()
+        )
+
+        checks = func.sum(buckets.c.count)
+        failures = cast(func.sum(buckets.c.failure_count), Float)
+        # Percentiles of different buckets cannot be merged exactly,
+        # so they are approximated with a check-weighted mean.
+        aggregated = select(
+            buckets.c.resource_id,
+            literal_column(f"'{window.name}'::sla_window"),
+            checks,
+            100 * (1 - failures / checks),
+            func.sum(cast(buckets.c.failure_count, Float) / buckets.c.count)
+            * (resolution.seconds / 60),
+            func.count().filter(and_(buckets.c.is_failing, ~buckets.c.was_failing)),
+            func.sum(buckets.c.response_time_p50 * buckets.c.count) / checks,
+            func.sum(buckets.c.response_time_p95 * buckets.c.count) / checks,
+            func.sum(buckets.c.response_time_p99 * buckets.c.count) / checks,
+        ).group_by(buckets.c.resource_id)
+
+        columns = [
+            "resource_id",
+            "sla_window",
+            "checks",
+            "uptime_percent",
+            "downtime_minutes",
+            "incident_count",
+            "response_time_p50",
+            "response_time_p95",
+            "response_time_p99",
+        ]
+        upsert_stmt = insert(self.model).from_select(columns, aggregated)
+        upsert_stmt = upsert_stmt.on_conflict_do_update(
+            index_elements=[self.model.resource_id, self.model.window],
+            set_={
+                **{column: upsert_stmt.excluded[column] for column in columns[2:]},
+                "updated_at": func.now(),
+            },
+        )
+        result = await self.session.execute(upsert_stmt)
+
+        # now() is fixed for the whole transaction, so everything
+        # not touched by the upsert above belongs to an older refresh.
+        await self.session.execute(
+            delete(self.model).filter(
+                self.model.window == window,
+                self.model.updated_at < func.now(),
+            )
+        )
+        return result.rowcount  # type: ignore[attr-defined]
+
+    async def get_by_window(self, window: SLAWindow) -> list[ResourceSLADTO]:
+        return await self.get_all_filtered(self.model.window == window)
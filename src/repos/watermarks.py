@@ -0,0 +1,28 @@
+from datetime import datetime
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
+
+from src.models.watermarks import Watermark
+from src.repos.base import BaseRepo
+from src.repos.mappers.mappers import WatermarkMapper
+from src.schemas.rollups import WatermarkAddDTO, WatermarkDTO
+
+
+class WatermarkRepo(BaseRepo[Watermark, WatermarkDTO, WatermarkAddDTO]):
+    schema = WatermarkDTO
+    mapper = WatermarkMapper
+    model = Watermark
+
+    async def get_value(self, name: str) -> datetime | None:
+        query = select(self.model.value).filter_by(name=name)
+        result = await self.session.execute(query)
+        return result.scalar_one_or_none()
+
+    async def set_value(self, name: str, value: datetime) -> None:
+        upsert_stmt = insert(self.model).values(name=name, value=value)
+        upsert_stmt = upsert_stmt.on_conflict_do_update(
+            index_elements=["name"],
+            set_={"value": upsert_stmt.excluded.value, "updated_at": func.now()},
+        )
+        await self.session.execute(upsert_stmt)
@@ -1,3 +1,4 @@
+from datetime import timedelta
 from enum import Enum
 
 
@@ -5,3 +6,63 @@ class ResourceState(Enum):
     UP = "UP"
     DOWN = "DOWN"
     UNKNOWN = "UNKNOWN"
+    PENDING = "PENDING"
+    REJECTED = "REJECTED"
+
+
+class CreationMode(Enum):
+    SYNC = "sync"
+    ASYNC = "async"
+
+
+class ProbeMethod(Enum):
+    HEAD = "HEAD"
+    GET = "GET"
+    GET_RANGE = "GET_RANGE"
+
+
+class ImportOutcome(Enum):
+    CREATED = "created"
+    EXISTS = "exists"
+    DUPLICATE = "duplicate"
+    INVALID = "invalid"
+    UNAVAILABLE = "unavailable"
+
+
+class ExportFormat(Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+class RollupResolution(Enum):
+    MINUTE = "1m"
+    FIVE_MINUTES = "5m"
+    HOUR = "1h"
+
+    @property
+    def seconds(self) -> int:
+        return {
+            RollupResolution.MINUTE: 60,
+            RollupResolution.FIVE_MINUTES: 5 * 60,
+            RollupResolution.HOUR: 60 * 60,
+        }[self]
+
+
+class SLAWindow(Enum):
+    DAY = "24h"
+    WEEK = "7d"
+    MONTH = "30d"
+
+    @property
+    def delta(self) -> timedelta:
+        return {
+            SLAWindow.DAY: timedelta(hours=24),
+            SLAWindow.WEEK: timedelta(days=7),
+            SLAWindow.MONTH: timedelta(days=30),
+        }[self]
+
+    @property
+    def resolution(self) -> RollupResolution:
+        if self == SLAWindow.DAY:
+            return RollupResolution.FIVE_MINUTES
+        return RollupResolution.HOUR
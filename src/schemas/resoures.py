@@ -1,11 +1,14 @@
+from datetime import datetime
+
 from pydantic import HttpUrl, field_validator
 
 from src.schemas.base import BaseDTO, TimingDTO
-from src.schemas.enums import ResourceState
+from src.schemas.enums import ImportOutcome, ProbeMethod, ResourceState
 
 
 class ResourceAddDTO(BaseDTO):
     url: str
+    probe_method: ProbeMethod = ProbeMethod.HEAD
 
     @field_validator("url", mode="before")
     @classmethod
@@ -30,10 +33,37 @@ class ResourceDTO(ResourceAddDTO, TimingDTO):
         return self.resource_id
 
 
+class ResourceImportResultDTO(BaseDTO):
+    url: str
+    outcome: ImportOutcome
+    resource_id: int | None = None
+    status_code: int | None = None
+
+
+class ResourceCheckDTO(BaseDTO):
+    resource_id: int
+    url: str
+    state: ResourceState
+    probe_method: ProbeMethod = ProbeMethod.HEAD
+
+
 class ResourceStatusAddDTO(BaseDTO):
     resource_id: int
     response_time: float
     status_code: int
+    dns_time: float | None = None
+    connect_time: float | None = None
+    ttfb: float | None = None
+    latency_bucket: int | None = None
+
+
+class ResourceStatusEventDTO(BaseDTO):
+    resource_id: int
+    state: ResourceState
+    status_code: int
+    response_time: float
+    changed: bool
+    checked_at: datetime
 
 
 class ResourceStatusUpdateDTO(BaseDTO):
@@ -43,7 +73,18 @@ class ResourceStatusUpdateDTO(BaseDTO):
 
 class ResourceStatusDTO(ResourceStatusAddDTO, TimingDTO):
     resource_status_id: int
+    repeat_count: int = 1
+    last_seen_at: datetime | None = None
+    response_time_min: float | None = None
+    response_time_max: float | None = None
 
     @property
     def id(self) -> int:
         return self.resource_status_id
+
+
+class StatusRetentionReportDTO(BaseDTO):
+    archived: int = 0
+    deleted: int
+    dropped_partitions: int
+    elapsed: float
@@ -1,5 +1,7 @@
 from src.schemas.base import BaseDTO
-from src.schemas.resoures import ResourceDTO, ResourceStatusDTO
+from src.schemas.resoures import ResourceDTO, ResourceImportResultDTO, ResourceStatusDTO
+from src.schemas.rollups import ResourceStatusRollupDTO
+from src.schemas.sla import ResourceSLADTO
 
 
 class GetResourcesResponse(BaseDTO):
@@ -14,9 +16,26 @@ class CreateResourceResponse(BaseDTO):
     data: ResourceDTO
 
 
+class ImportResourcesResponse(BaseDTO):
+    data: list[ResourceImportResultDTO]
+
+
 class DeleteResourceResponse(BaseDTO):
     detail: str
 
 
 class GetStatusesResponse(BaseDTO):
     data: list[ResourceStatusDTO]
+    next_cursor: str | None = None
+
+
+class GetRollupsResponse(BaseDTO):
+    data: list[ResourceStatusRollupDTO]
+
+
+class GetResourceSLAResponse(BaseDTO):
+    data: ResourceSLADTO
+
+
+class GetResourcesSLAResponse(BaseDTO):
+    data: list[ResourceSLADTO]
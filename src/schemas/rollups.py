@@ -0,0 +1,27 @@
+from datetime import datetime
+
+from src.schemas.base import BaseDTO, TimingDTO
+from src.schemas.enums import RollupResolution
+
+
+class ResourceStatusRollupDTO(BaseDTO):
+    resource_id: int
+    resolution: RollupResolution
+    bucket_start: datetime
+    count: int
+    failure_count: int
+    response_time_min: float
+    response_time_avg: float
+    response_time_max: float
+    response_time_p50: float
+    response_time_p95: float
+    response_time_p99: float
+
+
+class WatermarkAddDTO(BaseDTO):
+    name: str
+    value: datetime
+
+
+class WatermarkDTO(WatermarkAddDTO, TimingDTO):
+    pass
@@ -0,0 +1,14 @@
+from src.schemas.base import TimingDTO
+from src.schemas.enums import SLAWindow
+
+
+class ResourceSLADTO(TimingDTO):
+    resource_id: int
+    window: SLAWindow
+    checks: int
+    uptime_percent: float
+    downtime_minutes: float
+    incident_count: int
+    response_time_p50: float
+    response_time_p95: float
+    response_time_p99: float
@@ -1,66 +1,396 @@
 import asyncio
+import math
 import time
 from datetime import datetime, timedelta, timezone
+from typing import Any, AsyncIterator
 
 import aiohttp
+import orjson
 from fastapi import Request, status
+from pydantic import ValidationError
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from taskiq.exceptions import SendTaskError
 
 from src.config import settings
-from src.models.resoures import ResourceStatus
-from src.schemas.enums import ResourceState
+from src.models.resoures import Resource, ResourceStatus
+from src.schemas.enums import ExportFormat, ImportOutcome, ProbeMethod, ResourceState
 from src.schemas.resoures import (
     ResourceAddDTO,
+    ResourceCheckDTO,
     ResourceDTO,
+    ResourceImportResultDTO,
     ResourceStatusAddDTO,
     ResourceStatusDTO,
-    ResourceUpdateDTO,
+    ResourceStatusEventDTO,
+    StatusRetentionReportDTO,
 )
+from src.schemas.responses.resourses import GetResourceResponse, GetResourcesResponse
 from src.services.base import BaseService
 from src.tasks import worker
+from src.tasks.broker import dispatch_source
 from src.utils.antibot import get_fake_random_headers
 from src.utils.exceptions import (
+    ObjectAlreadyExistsError,
     ObjectNotFoundError,
+    ProbeThrottledError,
     ResourceAlreadyExistsError,
     ResourceNotFoundError,
     ResourceUnavailableError,
+    VerificationNotQueuedError,
 )
+from src.utils.cursor import decode_cursor, encode_cursor
+from src.utils.db_tools import DBManager
+from src.utils.dispatch import get_phase_offset
+from src.utils.etag import make_etag
+from src.utils.export import get_export_header, get_serializer
+from src.utils.http_client import ProbeTimings
 from src.utils.logconfig import get_logger
+from src.utils.metrics import (
+    CHECK_BATCH_SECONDS,
+    CHECK_CYCLE_SECONDS,
+    CHECK_DISPATCH_OFFSET_SECONDS,
+    PROBE_SECONDS,
+    PROBE_TRACE_OVERHEAD_SECONDS,
+    STATUS_ROWS_WRITTEN,
+    STATUS_RUNS_EXTENDED,
+)
+from src.utils.partitions import (
+    get_partition_name,
+    get_partition_step,
+    iter_partition_ranges,
+    parse_partition_name,
+)
+from src.utils.rate_limiter import HostRateLimiter
+from src.utils.redis_cache import RedisCache
+from src.utils.status_archive import StatusArchive, iter_archive_days
+from src.utils.status_buffer import StatusWriteBuffer
+from src.utils.status_feed import StatusFeedHub, StatusFeedPublisher
+from src.utils.statuses import (
+    PROBE_CLIENT_ERROR,
+    PROBE_CONNECT_TIMEOUT,
+    PROBE_READ_TIMEOUT,
+    PROBE_TOTAL_TIMEOUT,
+    expand_runs,
+    get_latency_bucket,
+    get_probe_outcome,
+    is_valid_status,
+)
 
 logger = get_logger("resources")
 
+ARCHIVE_WATERMARK = "resource_status_archive"
+
+HEAD_FALLBACK_STATUSES = (
+    status.HTTP_405_METHOD_NOT_ALLOWED,
+    status.HTTP_501_NOT_IMPLEMENTED,
+)
+
+resource_cache = RedisCache(
+    namespace=settings.resource_cache.NAMESPACE,
+    ttl=settings.resource_cache.TTL,
+    enabled=settings.resource_cache.ENABLED and settings.app.MODE != "TEST",
+)
+host_rate_limiter = HostRateLimiter(
+    config=settings.rate_limit,
+    enabled=settings.app.MODE != "TEST",
+)
+status_feed_publisher = StatusFeedPublisher(
+    channel=settings.status_feed.CHANNEL,
+    enabled=settings.status_feed.ENABLED and settings.app.MODE != "TEST",
+)
+status_feed_hub = StatusFeedHub(config=settings.status_feed)
+status_archive = StatusArchive(config=settings.status_archive)
+
 
 class ResourceStatusesService(BaseService):
-    async def get_statuses_by_resource(self, resource_id: int) -> list[ResourceStatusDTO]:
+    async def get_statuses_by_resource(
+        self,
+        resource_id: int,
+        limit: int,
+        date_from: datetime | None = None,
+        date_to: datetime | None = None,
+        cursor: str | None = None,
+        expand: bool = False,
+    ) -> tuple[list[ResourceStatusDTO], str | None]:
+        after = decode_cursor(cursor) if cursor else None
         await ResourceService(self.db).get_resource(resource_id=resource_id)
-        return await self.db.statuses.get_all_filtered(resource_id=resource_id)
+        statuses = await self.db.statuses.get_page(
+            resource_id=resource_id,
+            limit=limit + 1,
+            date_from=date_from,
+            date_to=date_to,
+            after=after,
+        )
+        if len(statuses) <= limit and settings.status_archive.ENABLED:
+            # The page runs past the hot table, so it continues from the archive.
+            statuses += await self._get_archived_page(
+                resource_id=resource_id,
+                limit=limit + 1 - len(statuses),
+                date_from=date_from,
+                date_to=date_to,
+                after=(statuses[-1].created_at, statuses[-1].id) if statuses else after,
+                exclude={st.id for st in statuses},
+            )
+
+        next_cursor = None
+        if len(statuses) > limit:
+            statuses = statuses[:limit]
+            last = statuses[-1]
+            next_cursor = encode_cursor(last.created_at, last.id)
+        # Pages are cut by runs, so an expanded page may hold more than limit items.
+        if expand:
+            statuses = expand_runs(statuses)
+        return statuses, next_cursor
+
+    async def _get_archived_page(
+        self,
+        resource_id: int,
+        limit: int,
+        date_from: datetime | None = None,
+        date_to: datetime | None = None,
+        after: tuple[datetime, int] | None = None,
+        exclude: set[int] | None = None,
+    ) -> list[ResourceStatusDTO]:
+        archived_until = await self.db.watermarks.get_value(ARCHIVE_WATERMARK)
+        if archived_until is None:
+            return []
+        # Only statuses created up to the watermark are archived, so the archive is
+        # read only when the rest of the range reaches below it.
+        archived_to = archived_until + timedelta(microseconds=1)
+        date_to = min(date_to, archived_to) if date_to else archived_to
+        if date_from is not None and (
+            date_from >= date_to or (after is not None and date_from > after[0])
+        ):
+            return []
+
+        # Statuses archived but not deleted yet are still served from the hot table.
+        exclude = exclude or set()
+        statuses = await asyncio.to_thread(
+            status_archive.read_page,
+            resource_id=resource_id,
+            limit=limit + len(exclude),
+            date_from=date_from,
+            date_to=date_to,
+            after=after,
+        )
+        return [st for st in statuses if st.id not in exclude][:limit]
+
+    async def get_statuses_etag(
+        self,
+        resource_id: int,
+        limit: int,
+        date_from: datetime | None = None,
+        date_to: datetime | None = None,
+        cursor: str | None = None,
+        expand: bool = False,
+    ) -> str:
+        after = decode_cursor(cursor) if cursor else None
+        await ResourceService(self.db).get_resource_version(resource_id=resource_id)
+        oldest, newest = await self.db.statuses.get_range_marker(
+            resource_id=resource_id,
+            date_from=date_from,
+            date_to=date_to,
+            after=after,
+        )
+        archived_until = None
+        if settings.status_archive.ENABLED:
+            archived_until = await self.db.watermarks.get_value(ARCHIVE_WATERMARK)
+        return make_etag(
+            "statuses", resource_id, limit, cursor, expand, oldest, newest, archived_until
+        )
+
+    async def export_statuses(
+        self,
+        resource_id: int,
+        export_format: ExportFormat,
+        session_factory: async_sessionmaker,
+        date_from: datetime | None = None,
+        date_to: datetime | None = None,
+    ) -> AsyncIterator[bytes]:
+        await ResourceService(self.db).get_resource(resource_id=resource_id)
+        return self._iter_export(
+            resource_id=resource_id,
+            export_format=export_format,
+            session_factory=session_factory,
+            date_from=date_from,
+            date_to=date_to,
+        )
+
+    async def _iter_export(
+        self,
+        resource_id: int,
+        export_format: ExportFormat,
+        session_factory: async_sessionmaker,
+        date_from: datetime | None = None,
+        date_to: datetime | None = None,
+    ) -> AsyncIterator[bytes]:
+        # The request-scoped session is closed before the response body is sent,
+        # so the stream owns a session of its own for the whole export.
+        serialize = get_serializer(export_format)
+        header = get_export_header(export_format)
+        if header:
+            yield header
+
+        async with DBManager(session_factory=session_factory) as db:
+            async for chunk in db.statuses.stream_range(
+                resource_id=resource_id,
+                date_from=date_from,
+                date_to=date_to,
+                chunk_size=settings.app.STATUSES_EXPORT_CHUNK_SIZE,
+            ):
+                yield serialize(chunk)
+
+    async def maintain_partitions(self) -> None:
+        await self.create_future_partitions()
+        await self.drop_expired_partitions()
+
+    async def create_future_partitions(self) -> int:
+        interval = settings.status_partitions.INTERVAL
+        table = ResourceStatus.__tablename__
+        now = datetime.now(timezone.utc)
+        horizon = now + get_partition_step(interval) * (settings.status_partitions.PREMAKE + 1)
+
+        existing = await self._get_partition_ranges()
+        created = 0
+        for start, end in iter_partition_ranges(now, horizon, interval):
+            if any(start < ex_end and ex_start < end for ex_start, ex_end in existing.values()):
+                continue
+
+            name = get_partition_name(table, start, interval)
+            try:
+                await self.db.statuses.create_partition(name=name, start=start, end=end)
+                await self.db.commit()
+            except DBAPIError as exc:
+                await self.db.rollback()
+                logger.warning("Cannot create partition %s. Detail: %s", name, str(exc))
+                continue
+            created += 1
+
+        logger.info("Created %s new partitions for %s", created, table)
+        return created
+
+    async def archive_expired_statuses(self, threshold: datetime) -> int:
+        since = await self.db.watermarks.get_value(ARCHIVE_WATERMARK)
+        if since is None:
+            oldest = await self.db.statuses.get_oldest_created_at()
+            since = oldest - timedelta(microseconds=1) if oldest else threshold
+        if since >= threshold:
+            return 0
+
+        start = time.perf_counter()
+        archived = 0
+        closed_days = []
+        for day, day_start, day_end in iter_archive_days(since, threshold):
+            if day_end.date() > day:
+                closed_days.append(day)
+            writer = status_archive.open_writer(day, day_start)
+            try:
+                async for chunk in self.db.statuses.stream_all_filtered(
+                    ResourceStatus.created_at > day_start,
+                    ResourceStatus.created_at <= day_end,
+                    order_by=(ResourceStatus.resource_id, ResourceStatus.created_at),
+                    chunk_size=settings.status_archive.ROW_GROUP_SIZE,
+                ):
+                    await asyncio.to_thread(writer.write, chunk)
+                archived += await asyncio.to_thread(writer.close)
+            except BaseException:
+                await asyncio.to_thread(writer.abort)
+                raise
+
+        await self.db.watermarks.set_value(ARCHIVE_WATERMARK, threshold)
+        await self.db.commit()
+        # A rerun of an uncommitted slice rewrites its part, so days are only
+        # compacted once the watermark has moved past them.
+        for day in closed_days:
+            await asyncio.to_thread(status_archive.compact_day, day)
+        logger.info(
+            "Archived %s statuses up to %s in %.3f sec",
+            archived,
+            threshold,
+            time.perf_counter() - start,
+        )
+        return archived
+
+    async def drop_expired_partitions(self, threshold: datetime | None = None) -> int:
+        threshold = threshold or datetime.now(timezone.utc) - timedelta(
+            hours=settings.taskiq.UNRELEVANT_STATUS_HOURS
+        )
+        if settings.status_archive.ENABLED:
+            # Only partitions that are fully archived may go.
+            archived_until = await self.db.watermarks.get_value(ARCHIVE_WATERMARK)
+            if archived_until is None:
+                return 0
+            threshold = min(threshold, archived_until)
 
-    async def delete_unrelevant_statuses(self):
+        existing = await self._get_partition_ranges()
+        expired = [name for name, (_, end) in existing.items() if end <= threshold]
+        for name in expired:
+            await self.db.statuses.drop_partition(name)
+            await self.db.commit()
+
+        if expired:
+            logger.info("Dropped %s expired partitions: %s", len(expired), ", ".join(expired))
+        return len(expired)
+
+    async def _get_partition_ranges(self) -> dict[str, tuple[datetime, datetime]]:
+        table = ResourceStatus.__tablename__
+        ranges = {}
+        for name in await self.db.statuses.get_partitions():
+            bounds = parse_partition_name(table, name)
+            if bounds is not None:
+                ranges[name] = bounds
+        return ranges
+
+    async def delete_unrelevant_statuses(self) -> StatusRetentionReportDTO:
+        start = time.perf_counter()
         threshold = datetime.now(timezone.utc) - timedelta(
             hours=settings.taskiq.UNRELEVANT_STATUS_HOURS
         )
+        archived = 0
+        if settings.status_archive.ENABLED:
+            archived = await self.archive_expired_statuses(threshold=threshold)
+        dropped = await self.drop_expired_partitions(threshold=threshold)
+
+        batch_size = settings.taskiq.RETENTION_BATCH_SIZE
         expression = ResourceStatus.created_at <= threshold
-        statuses = await self.db.statuses.get_all_filtered(expression)
-        if not statuses:
-            logger.info(
-                "There is no unrelevant statuses <= %s hours. Skipping...",
-                settings.taskiq.UNRELEVANT_STATUS_HOURS,
-            )
-            return
+        deleted = 0
+        while True:
+            batch_deleted = await self.db.statuses.delete_batch(expression, batch_size=batch_size)
+            await self.db.commit()
+            deleted += batch_deleted
+            if batch_deleted < batch_size:
+                break
+            await asyncio.sleep(settings.taskiq.RETENTION_BATCH_PAUSE)
 
-        logger.debug("Found %s unrelevant statuses. Performing deletion", len(statuses))
-        statuses_ids = tuple(st.id for st in statuses)
-        await self.db.statuses.delete(ResourceStatus.resource_id.in_(statuses_ids))
-        await self.db.commit()
+        report = StatusRetentionReportDTO(
+            archived=archived,
+            deleted=deleted,
+            dropped_partitions=dropped,
+            elapsed=time.perf_counter() - start,
+        )
+        logger.info(
+            "Archived %s, deleted %s unrelevant statuses and dropped %s partitions "
+            "older than %s hours in %.3f sec",
+            report.archived,
+            report.deleted,
+            report.dropped_partitions,
+            settings.taskiq.UNRELEVANT_STATUS_HOURS,
+            report.elapsed,
+        )
+        return report
 
 
 class ResourceService(BaseService):
     def _is_valid_status(self, status_code: int) -> bool:
-        anti_bot_protection = status_code == status.HTTP_403_FORBIDDEN
-        success_status = status_code in range(status.HTTP_200_OK, status.HTTP_300_MULTIPLE_CHOICES)
-        return success_status or anti_bot_protection
+        return is_valid_status(status_code)
 
     async def create_resource(self, request: Request, data: ResourceAddDTO) -> ResourceDTO:
-        created, resource = await self.db.resources.get_one_or_add(data=data)
+        await self._discard_rejected(url=data.url)
+        try:
+            created, resource = await self.db.resources.get_one_or_add(data=data)
+        except ObjectAlreadyExistsError as exc:
+            raise ResourceAlreadyExistsError from exc
         if not created:
             raise ResourceAlreadyExistsError
 
@@ -69,6 +399,7 @@ class ResourceService(BaseService):
             resource_id=resource.id,
             client=request.app.state.aiohttp_client,
             save_to_db=False,
+            probe_method=data.probe_method,
         )
 
         status_code = response.status_code
@@ -78,6 +409,234 @@ class ResourceService(BaseService):
         await self.db.commit()
         return resource
 
+    async def create_resource_async(self, data: ResourceAddDTO) -> ResourceDTO:
+        await self._discard_rejected(url=data.url)
+        try:
+            created, resource = await self.db.resources.get_one_or_add(
+                data=data,
+                state=ResourceState.PENDING,
+            )
+        except ObjectAlreadyExistsError as exc:
+            raise ResourceAlreadyExistsError from exc
+        if not created:
+            raise ResourceAlreadyExistsError
+
+        await self.db.commit()
+        try:
+            await self._enqueue_verification(resource)
+        except SendTaskError as exc:
+            # Nothing would ever move the row out of PENDING, so it is dropped and
+            # the URL may be submitted again.
+            logger.error("Cannot queue verification of %s. Detail: %s", resource.url, str(exc))
+            await self.db.resources.delete(
+                resource_id=resource.id,
+                state=ResourceState.PENDING,
+                ensure_existence=False,
+            )
+            await self.db.commit()
+            raise VerificationNotQueuedError from exc
+        return resource
+
+    @staticmethod
+    async def _enqueue_verification(resource: ResourceDTO) -> None:
+        await worker.verify_resource.kiq(
+            resource_id=resource.id,
+            url=resource.url,
+            probe_method=resource.probe_method,
+        )  # type: ignore
+
+    async def recover_pending_resources(self) -> None:
+        # Rows stay PENDING when their verification message was lost or ran out
+        # of retries. Stale ones are queued again, hopeless ones are rejected.
+        now = datetime.now(timezone.utc)
+        rejected = await self.db.resources.reject_pending(
+            created_before=now - timedelta(minutes=settings.taskiq.PENDING_REJECT_MINUTES),
+        )
+        await self.db.commit()
+        if rejected:
+            logger.warning("Rejected %s resources stuck in verification", len(rejected))
+
+        stale = await self.db.resources.get_all_filtered(
+            Resource.state == ResourceState.PENDING,
+            Resource.created_at < now - timedelta(minutes=settings.taskiq.PENDING_REQUEUE_MINUTES),
+        )
+        await self.db.rollback()
+        for resource in stale:
+            try:
+                await self._enqueue_verification(resource)
+            except SendTaskError as exc:
+                logger.error("Cannot queue verification of %s. Detail: %s", resource.url, str(exc))
+                return
+        if stale:
+            logger.info("Queued verification of %s pending resources again", len(stale))
+
+    async def verify_resource(
+        self,
+        resource_id: int,
+        url: str,
+        client: aiohttp.ClientSession,
+        probe_method: ProbeMethod = ProbeMethod.HEAD,
+    ) -> ResourceState | None:
+        response = await self.probe_resource(
+            url=url,
+            resource_id=resource_id,
+            client=client,
+            method=probe_method,
+        )
+        new_state = ResourceState.UP
+        if not self._is_valid_status(response.status_code):
+            new_state = ResourceState.REJECTED
+
+        applied = await self._apply_state_transition(
+            url=url,
+            resource_id=resource_id,
+            state=ResourceState.PENDING,
+            new_state=new_state,
+        )
+        await self.db.commit()
+        if not applied:
+            return None
+
+        await status_feed_publisher.publish(
+            [self._make_status_event(new_state, response, changed=True)]
+        )
+        return new_state
+
+    async def wait_for_verification(self, resource_id: int, timeout: float) -> ResourceDTO:
+        resource = await self.get_resource(resource_id=resource_id)
+        if resource.state != ResourceState.PENDING or timeout <= 0:
+            return resource
+
+        # The connection goes back to the pool while the request waits.
+        await self.db.rollback()
+        deadline = time.monotonic() + timeout
+        queue = status_feed_hub.subscribe()
+        try:
+            while True:
+                resource = await self.get_resource(resource_id=resource_id)
+                await self.db.rollback()
+                remaining = deadline - time.monotonic()
+                if resource.state != ResourceState.PENDING or remaining <= 0:
+                    return resource
+                # The feed wakes the request up early, polling covers a lost subscription.
+                await self._wait_for_event(
+                    queue=queue,
+                    resource_id=resource_id,
+                    timeout=min(remaining, settings.app.VERIFICATION_POLL_INTERVAL),
+                )
+        finally:
+            status_feed_hub.unsubscribe(queue)
+
+    async def _wait_for_event(
+        self,
+        queue: asyncio.Queue[bytes | None],
+        resource_id: int,
+        timeout: float,
+    ) -> None:
+        deadline = time.monotonic() + timeout
+        while (remaining := deadline - time.monotonic()) > 0:
+            try:
+                payload = await asyncio.wait_for(queue.get(), timeout=remaining)
+            except asyncio.TimeoutError:
+                return
+            if payload is None:
+                return
+            if any(event["resource_id"] == resource_id for event in orjson.loads(payload)):
+                return
+
+    async def _discard_rejected(self, url: str) -> None:
+        # A rejected URL may be submitted again once it is fixed.
+        await self.db.resources.delete(
+            url=url,
+            state=ResourceState.REJECTED,
+            ensure_existence=False,
+        )
+
+    async def import_resources(
+        self,
+        items: list[Any],
+        client: aiohttp.ClientSession,
+    ) -> list[ResourceImportResultDTO]:
+        results: list[ResourceImportResultDTO | None] = [None] * len(items)
+        candidates: dict[str, tuple[int, ResourceAddDTO]] = {}
+        for idx, item in enumerate(items):
+            try:
+                data = ResourceAddDTO.model_validate(
+                    item if isinstance(item, dict) else {"url": item}
+                )
+            except ValidationError:
+                results[idx] = ResourceImportResultDTO(
+                    url=str(item.get("url") if isinstance(item, dict) else item),
+                    outcome=ImportOutcome.INVALID,
+                )
+                continue
+            if data.url in candidates:
+                results[idx] = ResourceImportResultDTO(
+                    url=data.url,
+                    outcome=ImportOutcome.DUPLICATE,
+                )
+                continue
+            candidates[data.url] = (idx, data)
+
+        existing = await self.db.resources.get_all_filtered(Resource.url.in_(list(candidates)))
+        for resource in existing:
+            idx, _ = candidates.pop(resource.url)
+            results[idx] = ResourceImportResultDTO(
+                url=resource.url,
+                outcome=ImportOutcome.EXISTS,
+                resource_id=resource.id,
+            )
+
+        semaphore = asyncio.Semaphore(settings.app.IMPORT_PROBE_CONCURRENCY)
+
+        async def probe(data: ResourceAddDTO) -> int:
+            async with semaphore:
+                # New URLs have no id yet and their validation probes are not stored.
+                try:
+                    response = await self.probe_resource(
+                        url=data.url,
+                        resource_id=0,
+                        client=client,
+                        method=data.probe_method,
+                    )
+                except aiohttp.ClientError as exc:
+                    # A single broken URL is reported as unavailable instead of
+                    # failing the whole import.
+                    logger.error("Probe of %s failed. Detail: %s", data.url, str(exc))
+                    return PROBE_CLIENT_ERROR
+                return response.status_code
+
+        pending = list(candidates.values())
+        status_codes = await asyncio.gather(*(probe(data) for _, data in pending))
+        accepted = []
+        for (idx, data), status_code in zip(pending, status_codes):
+            if self._is_valid_status(status_code):
+                accepted.append(data)
+                continue
+            results[idx] = ResourceImportResultDTO(
+                url=data.url,
+                outcome=ImportOutcome.UNAVAILABLE,
+                status_code=status_code,
+            )
+
+        # URLs inserted concurrently by another request are skipped by the insert.
+        created = await self.db.resources.add_bulk(accepted, ignore_conflicts=True)
+        await self.db.commit()
+
+        created_ids = {resource.url: resource.id for resource in created}
+        for (idx, data), status_code in zip(pending, status_codes):
+            if results[idx] is not None:
+                continue
+            resource_id = created_ids.get(data.url)
+            results[idx] = ResourceImportResultDTO(
+                url=data.url,
+                outcome=ImportOutcome.CREATED if resource_id else ImportOutcome.EXISTS,
+                resource_id=resource_id,
+                status_code=status_code,
+            )
+        logger.info("Imported %s of %s resources", len(created), len(items))
+        return [result for result in results if result is not None]
+
     async def get_resource(self, resource_id: int) -> ResourceDTO:
         try:
             return await self.db.resources.get_one(resource_id=resource_id)
@@ -87,6 +646,36 @@ class ResourceService(BaseService):
     async def get_resources(self) -> list[ResourceDTO]:
         return await self.db.resources.get_all()
 
+    async def get_resource_version(self, resource_id: int) -> int:
+        version = await self.db.resources.get_version(resource_id=resource_id)
+        if version is None:
+            raise ResourceNotFoundError
+        return version
+
+    async def get_resource_etag(self, resource_id: int) -> str:
+        version = await self.get_resource_version(resource_id=resource_id)
+        return make_etag("resource", resource_id, version)
+
+    async def get_resources_etag(self) -> str:
+        marker = await self.db.resources.get_listing_marker()
+        return make_etag("resources", *marker)
+
+    # Cached bodies are keyed by the ETag, which moves with every change of the
+    # resource or the listing, so there is nothing to invalidate on writes.
+    async def get_resource_payload(self, resource_id: int, etag: str) -> bytes:
+        async def load() -> bytes:
+            resource = await self.get_resource(resource_id=resource_id)
+            return orjson.dumps(GetResourceResponse(data=resource).model_dump(mode="json"))
+
+        return await resource_cache.get_or_set(f"resource:{resource_id}:{etag}", load)
+
+    async def get_resources_payload(self, etag: str) -> bytes:
+        async def load() -> bytes:
+            resources = await self.get_resources()
+            return orjson.dumps(GetResourcesResponse(data=resources).model_dump(mode="json"))
+
+        return await resource_cache.get_or_set(f"resources:{etag}", load)
+
     async def delete_resource(self, resource_id: int):
         await self.db.statuses.delete(resource_id=resource_id, ensure_existence=False)
         try:
@@ -96,71 +685,360 @@ class ResourceService(BaseService):
         await self.db.commit()
 
     async def check_resources(self):
-        resources = await self.db.resources.get_all()
+        with CHECK_CYCLE_SECONDS.time():
+            await self._dispatch_due_checks()
+
+    async def _dispatch_due_checks(self) -> None:
+        resources = await self.db.resources.claim_due(
+            limit=settings.taskiq.CHECK_CLAIM_LIMIT,
+            min_interval=settings.taskiq.CHECK_INTERVAL_MIN,
+            max_interval=settings.taskiq.CHECK_INTERVAL_MAX,
+            backoff=settings.taskiq.CHECK_INTERVAL_BACKOFF,
+        )
+        await self.db.commit()
         if not resources:
-            logger.info("There is no resources to check. Skipping...")
+            logger.info("There is no resources due for a check. Skipping...")
             return
+        logger.info("Claimed %s resources due for a check", len(resources))
 
-        tasks = []
-        for resource in resources:
-            tasks.append(
-                worker.check_single_resource.kiq(
-                    state=resource.state,
+        # Each resource keeps a stable phase inside the dispatch window, so checks
+        # are enqueued evenly over the window instead of all at the cron tick.
+        window = settings.taskiq.DISPATCH_WINDOW_SECONDS
+        phased = sorted(
+            ((get_phase_offset(resource.id, window), resource) for resource in resources),
+            key=lambda item: item[0],
+        )
+        batch_size = max(settings.taskiq.CHECK_BATCH_SIZE, 1)
+        now = datetime.now(timezone.utc)
+        for idx in range(0, len(phased), batch_size):
+            group = phased[idx : idx + batch_size]
+            offset = group[0][0]
+            for resource_offset, _ in group:
+                CHECK_DISPATCH_OFFSET_SECONDS.observe(resource_offset)
+            # Delayed batches are handed to the scheduler instead of sleeping here,
+            # so this task finishes right after the claim.
+            at = now + timedelta(seconds=offset) if offset > 0 else None
+            if batch_size > 1:
+                await self._dispatch_batch([resource for _, resource in group], at)
+            else:
+                await self._dispatch_single(group[0][1], at)
+
+    @staticmethod
+    async def _dispatch_batch(resources: list[ResourceDTO], at: datetime | None) -> None:
+        kwargs = {
+            "batch": [
+                ResourceCheckDTO(
                     resource_id=resource.id,
                     url=str(resource.url),
-                )  # type: ignore
+                    state=resource.state,
+                    probe_method=resource.probe_method,
+                )
+                for resource in resources
+            ],
+        }
+        if at is None:
+            await worker.check_resource_batch.kiq(**kwargs)  # type: ignore
+        else:
+            await worker.check_resource_batch.schedule_by_time(
+                dispatch_source, at, **kwargs
+            )  # type: ignore
+
+    @staticmethod
+    async def _dispatch_single(resource: ResourceDTO, at: datetime | None) -> None:
+        kwargs = {
+            "state": resource.state,
+            "resource_id": resource.id,
+            "url": str(resource.url),
+            "probe_method": resource.probe_method,
+        }
+        if at is None:
+            await worker.check_single_resource.kiq(**kwargs)  # type: ignore
+        else:
+            await worker.check_single_resource.schedule_by_time(
+                dispatch_source, at, **kwargs
+            )  # type: ignore
+
+    async def check_resource_batch(
+        self,
+        batch: list[ResourceCheckDTO],
+        client: aiohttp.ClientSession,
+        status_buffer: StatusWriteBuffer | None = None,
+    ) -> list[ResourceStatusAddDTO]:
+        with CHECK_BATCH_SECONDS.time():
+            return await self._check_resource_batch(batch, client, status_buffer)
+
+    async def _check_resource_batch(
+        self,
+        batch: list[ResourceCheckDTO],
+        client: aiohttp.ClientSession,
+        status_buffer: StatusWriteBuffer | None = None,
+    ) -> list[ResourceStatusAddDTO]:
+        semaphore = asyncio.Semaphore(settings.taskiq.CHECK_BATCH_CONCURRENCY)
+
+        async def probe(resource: ResourceCheckDTO) -> ResourceStatusAddDTO | None:
+            # The token is taken before the semaphore, so a probe waiting for its
+            # host bucket does not hold a slot other hosts could use.
+            if not await host_rate_limiter.acquire(resource.url):
+                logger.warning("Skipped check of %s: host rate limit exceeded", resource.url)
+                return None
+            async with semaphore:
+                start = time.perf_counter()
+                try:
+                    return await self.probe_resource(
+                        url=resource.url,
+                        resource_id=resource.resource_id,
+                        client=client,
+                        method=resource.probe_method,
+                    )
+                except aiohttp.ClientError as exc:
+                    # One broken resource must not fail the whole batch, which would
+                    # re-probe every other resource on retry.
+                    logger.error("Probe of %s failed. Detail: %s", resource.url, str(exc))
+                    return ResourceStatusAddDTO(
+                        resource_id=resource.resource_id,
+                        response_time=time.perf_counter() - start,
+                        status_code=PROBE_CLIENT_ERROR,
+                    )
+
+        probed = await asyncio.gather(*(probe(resource) for resource in batch))
+        checked = []
+        for resource, response in zip(batch, probed):
+            if response is None:
+                await self._postpone_throttled_check(resource.resource_id, resource.url)
+                continue
+            checked.append((resource, response))
+        responses = [response for _, response in checked]
+
+        events = []
+        for resource, response in checked:
+            self._observe_probe(resource.state, response)
+            new_state = self._get_target_state(resource.state, response.status_code)
+            if new_state is None:
+                events.append(self._make_status_event(resource.state, response))
+                continue
+            applied = await self._apply_state_transition(
+                url=resource.url,
+                resource_id=resource.resource_id,
+                state=resource.state,
+                new_state=new_state,
             )
-        await asyncio.gather(*tasks)
+            if applied:
+                events.append(self._make_status_event(new_state, response, changed=True))
 
-    async def toggle_resource_state(self, resource_id: int, state: ResourceState):
-        states = (ResourceState.UP, ResourceState.DOWN)
-        new_state_idx = int(state == ResourceState.UP)
-        new_state = states[new_state_idx]
+        written = 0
+        if status_buffer is not None:
+            for response in responses:
+                await status_buffer.put(response)
+        else:
+            written = await self._save_statuses(responses)
+        await self.db.commit()
+        if status_buffer is None:
+            STATUS_ROWS_WRITTEN.labels("bulk").inc(written)
+            STATUS_RUNS_EXTENDED.inc(len(responses) - written)
+        await status_feed_publisher.publish(events)
+        return responses
+
+    async def postpone_throttled_check(self, resource_id: int, url: str) -> None:
+        await self._postpone_throttled_check(resource_id, url)
+        await self.db.commit()
 
-        update_obj = ResourceUpdateDTO(state=new_state)
-        await self.db.resources.edit(
+    async def _postpone_throttled_check(self, resource_id: int, url: str) -> None:
+        # claim_due already moved next_check_at a whole interval ahead, so a skipped
+        # check is brought back to when the host bucket has a token again.
+        await self.db.resources.postpone_check(
             resource_id=resource_id,
-            data=update_obj,
-            ensure_existence=False,
+            seconds=math.ceil(host_rate_limiter.get_retry_after(url)),
         )
-        await self.db.commit()
-        return new_state
 
-    async def make_request_to_resource(
+    async def _save_statuses(self, responses: list[ResourceStatusAddDTO]) -> int:
+        if not settings.status_storage.RUN_LENGTH_ENABLED:
+            await self.db.statuses.add_bulk(responses, returning=False)
+            return len(responses)
+        return await self.db.statuses.add_runs(
+            responses, settings.status_storage.RUN_MAX_SECONDS
+        )
+
+    def _observe_probe(self, state: ResourceState, response: ResourceStatusAddDTO) -> None:
+        PROBE_SECONDS.labels(state.value, get_probe_outcome(response.status_code)).observe(
+            response.response_time
+        )
+
+    def _make_status_event(
+        self,
+        state: ResourceState,
+        response: ResourceStatusAddDTO,
+        changed: bool = False,
+    ) -> ResourceStatusEventDTO:
+        return ResourceStatusEventDTO(
+            resource_id=response.resource_id,
+            state=state,
+            status_code=response.status_code,
+            response_time=response.response_time,
+            changed=changed,
+            checked_at=datetime.now(timezone.utc),
+        )
+
+    def _get_target_state(self, state: ResourceState, status_code: int) -> ResourceState | None:
+        is_valid_status = self._is_valid_status(status_code)
+        if not is_valid_status and state == ResourceState.UP:
+            return ResourceState.DOWN
+        if is_valid_status and state == ResourceState.DOWN:
+            return ResourceState.UP
+        return None
+
+    async def _apply_state_transition(
+        self,
+        url: str,
+        resource_id: int,
+        state: ResourceState,
+        new_state: ResourceState,
+        status: ResourceStatusAddDTO | None = None,
+    ) -> bool:
+        applied, current_state = await self.db.resources.compare_and_set_state(
+            resource_id=resource_id,
+            expected=state,
+            new_state=new_state,
+            status=status,
+            check_interval=settings.taskiq.CHECK_INTERVAL_MIN,
+        )
+        if not applied:
+            logger.warning(
+                "Skipped stale %s state transition from %s to %s, current state is %s",
+                url,
+                state.value,
+                new_state.value,
+                current_state.value if current_state else None,
+            )
+            return False
+
+        logger.info(
+            "Toggled %s resource state from %s to %s",
+            url,
+            state.value,
+            new_state.value,
+        )
+        return True
+
+    async def probe_resource(
         self,
         url: str,
         resource_id: int,
         client: aiohttp.ClientSession,
-        save_to_db: bool = True,
-        *args,
-        **kwargs,
+        method: ProbeMethod = ProbeMethod.HEAD,
+        throttle: bool = False,
     ) -> ResourceStatusAddDTO:
+        if throttle and not await host_rate_limiter.acquire(url):
+            raise ProbeThrottledError
+
         start = time.perf_counter()
         status_code = status.HTTP_418_IM_A_TEAPOT
         headers = get_fake_random_headers()
+        timings = ProbeTimings() if settings.probe_client.TRACE_TIMINGS else None
 
         try:
-            async with client.get(
-                url=url,
-                headers=headers,
-                allow_redirects=True,
-            ) as response:
-                status_code = response.status
-                response.raise_for_status()
+            status_code = await self._send_probe(client, url, method, headers, timings)
+            if method == ProbeMethod.HEAD and status_code in HEAD_FALLBACK_STATUSES:
+                logger.debug("%s does not support HEAD requests. Falling back to GET", url)
+                status_code = await self._send_probe(
+                    client, url, ProbeMethod.GET, headers, timings
+                )
         except aiohttp.ClientResponseError as exc:
             logger.error("Exception during request to %s. Detail: %s", url, str(exc))
             status_code = exc.status
         except aiohttp.ClientConnectorError:
             logger.error("Cannot connect to %s", url)
             status_code = status.HTTP_408_REQUEST_TIMEOUT
+        except aiohttp.ConnectionTimeoutError:
+            logger.error("Connection to %s timed out", url)
+            status_code = PROBE_CONNECT_TIMEOUT
+        except aiohttp.SocketTimeoutError:
+            logger.error("Reading response from %s timed out", url)
+            status_code = PROBE_READ_TIMEOUT
+        except asyncio.TimeoutError:
+            logger.error("Request to %s exceeded total timeout", url)
+            status_code = PROBE_TOTAL_TIMEOUT
         finally:
             end = time.perf_counter()
             response_time = end - start
 
-        response = ResourceStatusAddDTO(
+        latency_bucket = get_latency_bucket(
+            response_time, settings.status_storage.LATENCY_BUCKETS
+        )
+        if timings is None:
+            return ResourceStatusAddDTO(
+                resource_id=resource_id,
+                response_time=response_time,
+                status_code=status_code,
+                latency_bucket=latency_bucket,
+            )
+
+        PROBE_TRACE_OVERHEAD_SECONDS.observe(timings.overhead)
+        return ResourceStatusAddDTO(
             resource_id=resource_id,
             response_time=response_time,
             status_code=status_code,
+            latency_bucket=latency_bucket,
+            dns_time=timings.dns_time,
+            connect_time=timings.connect_time,
+            ttfb=timings.ttfb,
+        )
+
+    async def _send_probe(
+        self,
+        client: aiohttp.ClientSession,
+        url: str,
+        method: ProbeMethod,
+        headers: dict[str, str],
+        timings: ProbeTimings | None = None,
+    ) -> int:
+        max_bytes = settings.probe_client.MAX_BODY_BYTES
+        if method == ProbeMethod.GET_RANGE:
+            headers = {**headers, "Range": f"bytes=0-{max_bytes - 1}"}
+
+        async with client.request(
+            method="HEAD" if method == ProbeMethod.HEAD else "GET",
+            url=url,
+            headers=headers,
+            allow_redirects=True,
+            max_redirects=settings.probe_client.MAX_REDIRECTS,
+            trace_request_ctx=timings,
+        ) as response:
+            status_code = response.status
+            if method != ProbeMethod.HEAD:
+                await self._read_bounded(response, max_bytes)
+            if not (method == ProbeMethod.HEAD and status_code in HEAD_FALLBACK_STATUSES):
+                response.raise_for_status()
+            return status_code
+
+    async def _read_bounded(self, response: aiohttp.ClientResponse, max_bytes: int) -> None:
+        # A fully read body lets the connection go back to the pool; bodies larger
+        # than the guard are abandoned and aiohttp closes the connection instead.
+        remaining = max_bytes
+        while remaining > 0:
+            chunk = await response.content.read(
+                min(remaining, settings.probe_client.READ_CHUNK_SIZE)
+            )
+            if not chunk:
+                break
+            remaining -= len(chunk)
+
+    async def make_request_to_resource(
+        self,
+        url: str,
+        resource_id: int,
+        client: aiohttp.ClientSession,
+        save_to_db: bool = True,
+        status_buffer: StatusWriteBuffer | None = None,
+        probe_method: ProbeMethod = ProbeMethod.HEAD,
+        *args,
+        **kwargs,
+    ) -> ResourceStatusAddDTO:
+        response = await self.probe_resource(
+            url=url,
+            resource_id=resource_id,
+            client=client,
+            method=probe_method,
+            throttle=save_to_db,
         )
 
         if save_to_db:
@@ -169,28 +1047,33 @@ class ResourceService(BaseService):
                 logger.error("Cannot find required 'state' key in kwargs")
                 raise KeyError("Missing 'state' key in kwargs")
 
-            is_valid_status = self._is_valid_status(status_code)
-
-            if (
-                not is_valid_status
-                and state == ResourceState.UP
-                or is_valid_status
-                and state == ResourceState.DOWN
-            ):
-                old_state = state
-                new_state = await self.toggle_resource_state(
+            self._observe_probe(state, response)
+            toggled = False
+            new_state = self._get_target_state(state, response.status_code)
+            if new_state is not None:
+                # Without a buffer the status row is written by the same statement
+                # as the state transition.
+                toggled = await self._apply_state_transition(
+                    url=url,
                     resource_id=resource_id,
                     state=state,
+                    new_state=new_state,
+                    status=response if status_buffer is None else None,
                 )
 
-                logger.info(
-                    "Toggled %s resource state from %s to %s",
-                    url,
-                    old_state.value,
-                    new_state.value,
-                )
-
-            await self.db.statuses.add(response)
+            written = 1
+            if status_buffer is not None:
+                await status_buffer.put(response)
+            elif new_state is None:
+                written = await self._save_statuses([response])
             await self.db.commit()
+            if status_buffer is None:
+                STATUS_ROWS_WRITTEN.labels("single").inc(written)
+                STATUS_RUNS_EXTENDED.inc(1 - written)
+            # A stale transition is skipped here and published by the check that won it.
+            if new_state is None or toggled:
+                await status_feed_publisher.publish(
+                    [self._make_status_event(new_state or state, response, changed=toggled)]
+                )
 
         return response
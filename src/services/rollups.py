@@ -0,0 +1,77 @@
+from datetime import datetime, timedelta, timezone
+
+from src.config import settings
+from src.models.rollups import ResourceStatusRollup
+from src.schemas.enums import RollupResolution
+from src.schemas.rollups import ResourceStatusRollupDTO
+from src.services.base import BaseService
+from src.services.resources import ResourceService
+from src.utils.logconfig import get_logger
+
+logger = get_logger("rollups")
+
+ROLLUPS_WATERMARK = "resource_status_rollup"
+
+
+def get_rollup_retention(resolution: RollupResolution) -> timedelta:
+    return {
+        RollupResolution.MINUTE: timedelta(hours=settings.rollups.MINUTE_RETENTION_HOURS),
+        RollupResolution.FIVE_MINUTES: timedelta(
+            days=settings.rollups.FIVE_MINUTES_RETENTION_DAYS
+        ),
+        RollupResolution.HOUR: timedelta(days=settings.rollups.HOUR_RETENTION_DAYS),
+    }[resolution]
+
+
+def floor_to_bucket(moment: datetime, resolution: RollupResolution) -> datetime:
+    timestamp = moment.timestamp()
+    return datetime.fromtimestamp(timestamp - timestamp % resolution.seconds, tz=timezone.utc)
+
+
+class ResourceStatusRollupService(BaseService):
+    async def refresh_rollups(self) -> int:
+        now = datetime.now(timezone.utc)
+        until = now - timedelta(seconds=settings.rollups.LAG_SECONDS)
+        since = await self.db.watermarks.get_value(ROLLUPS_WATERMARK)
+        if since is None:
+            since = until - timedelta(hours=settings.taskiq.UNRELEVANT_STATUS_HOURS)
+        if since >= until:
+            logger.info("Rollups are up to date. Skipping...")
+            return 0
+
+        refreshed = 0
+        for resolution in RollupResolution:
+            refreshed += await self.db.rollups.refresh(
+                resolution=resolution,
+                since=floor_to_bucket(since, resolution),
+                until=until,
+                max_run_seconds=settings.status_storage.RUN_MAX_SECONDS,
+            )
+            await self.db.rollups.delete(
+                ResourceStatusRollup.resolution == resolution,
+                ResourceStatusRollup.bucket_start < now - get_rollup_retention(resolution),
+                ensure_existence=False,
+            )
+
+        await self.db.watermarks.set_value(ROLLUPS_WATERMARK, until)
+        await self.db.commit()
+        logger.info("Refreshed %s rollup buckets for statuses up to %s", refreshed, until)
+        return refreshed
+
+    async def get_rollups(
+        self,
+        resource_id: int,
+        resolution: RollupResolution,
+        date_from: datetime | None = None,
+        date_to: datetime | None = None,
+    ) -> list[ResourceStatusRollupDTO]:
+        await ResourceService(self.db).get_resource(resource_id=resource_id)
+
+        date_to = date_to or datetime.now(timezone.utc)
+        date_from = date_from or date_to - timedelta(hours=settings.rollups.DEFAULT_RANGE_HOURS)
+        return await self.db.rollups.get_range(
+            resource_id=resource_id,
+            resolution=resolution,
+            date_from=date_from,
+            date_to=date_to,
+        )
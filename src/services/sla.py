@@ -0,0 +1,45 @@
+from src.config import settings
+from src.schemas.enums import SLAWindow
+from src.schemas.sla import ResourceSLADTO
+from src.services.base import BaseService
+from src.services.resources import ResourceService
+from src.utils.exceptions import SLANotFoundError
+from src.utils.logconfig import get_logger
+from src.utils.ttl_cache import TTLCache
+
+logger = get_logger("sla")
+
+# Summaries are refreshed by a worker process, which cannot reach this per-process
+# cache, so API responses may lag a refresh by up to CACHE_TTL seconds.
+sla_cache: TTLCache[dict[int, ResourceSLADTO]] = TTLCache(ttl=settings.sla.CACHE_TTL)
+
+
+class ResourceSLAService(BaseService):
+    async def refresh_sla(self) -> int:
+        refreshed = 0
+        for window in SLAWindow:
+            refreshed += await self.db.sla.refresh(window)
+        await self.db.commit()
+        logger.info("Refreshed %s SLA summaries", refreshed)
+        return refreshed
+
+    async def get_sla(self, window: SLAWindow) -> list[ResourceSLADTO]:
+        summaries = await self._get_window_summaries(window)
+        return list(summaries.values())
+
+    async def get_resource_sla(self, resource_id: int, window: SLAWindow) -> ResourceSLADTO:
+        summaries = await self._get_window_summaries(window)
+        summary = summaries.get(resource_id)
+        if summary is not None:
+            return summary
+
+        await ResourceService(self.db).get_resource(resource_id=resource_id)
+        raise SLANotFoundError
+
+    async def _get_window_summaries(self, window: SLAWindow) -> dict[int, ResourceSLADTO]:
+        summaries = sla_cache.get(window)
+        if summaries is None:
+            rows = await self.db.sla.get_by_window(window)
+            summaries = {row.resource_id: row for row in rows}
+            sla_cache.set(window, summaries)
+        return summaries
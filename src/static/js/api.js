@@ -63,7 +63,8 @@ class API {
     }
 
     async getResourceStatuses(id) {
-        return this.request(`/resources/${id}/statuses`);
+        // Runs of identical checks are expanded, so every check counts once in the stats.
+        return this.request(`/resources/${id}/statuses?expand=true`);
     }
 }
 
@@ -52,7 +52,8 @@ async function showResourceDetail(resourceId) {
         ]);
         
         const resource = resourceResponse.data;
-        const statuses = statusesResponse.data;
+        // API returns the newest statuses first
+        const statuses = [...statusesResponse.data].reverse();
         
         // Update UI
         document.getElementById('dashboardView').style.display = 'none';
@@ -155,11 +156,45 @@ async function confirmDelete() {
     }
 }
 
-// Auto-refresh
-setInterval(() => {
+function refreshCurrentView() {
     if (currentResourceId) {
         showResourceDetail(currentResourceId);
     } else {
         loadResources();
     }
-}, 30000); // Refresh every 30 seconds
+}
+
+// Live updates
+function handleStatusEvents(events) {
+    if (currentResourceId) {
+        if (events.some(event => event.resource_id === currentResourceId)) {
+            showResourceDetail(currentResourceId);
+        }
+    } else if (events.some(event => event.changed)) {
+        loadResources();
+    }
+}
+
+function connectStatusFeed() {
+    const source = new EventSource(`${API_BASE_URL}/resources/stream`);
+    let reconnecting = false;
+
+    source.addEventListener('statuses', (e) => handleStatusEvents(JSON.parse(e.data)));
+    source.addEventListener('error', () => {
+        reconnecting = true;
+    });
+    source.addEventListener('open', () => {
+        // Events sent while disconnected are lost, so reload the current view
+        if (reconnecting) {
+            reconnecting = false;
+            refreshCurrentView();
+        }
+    });
+}
+
+if (window.EventSource) {
+    connectStatusFeed();
+} else {
+    // Auto-refresh
+    setInterval(refreshCurrentView, 30000); // Refresh every 30 seconds
+}
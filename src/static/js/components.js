@@ -1,8 +1,21 @@
 // UI Components
 
+function getStatusClass(state) {
+    if (state === 'UP') return 'status-up';
+    if (state === 'PENDING') return 'status-pending';
+    return 'status-down';
+}
+
+function getStatusText(state) {
+    if (state === 'UP') return 'Доступен';
+    if (state === 'PENDING') return 'Проверяется';
+    if (state === 'REJECTED') return 'Отклонен';
+    return 'Недоступен';
+}
+
 function createResourceCard(resource) {
-    const statusClass = resource.state === 'UP' ? 'status-up' : 'status-down';
-    const statusText = resource.state === 'UP' ? 'Доступен' : 'Недоступен';
+    const statusClass = getStatusClass(resource.state);
+    const statusText = getStatusText(resource.state);
     
     const updatedDate = new Date(resource.updated_at);
     const formattedDate = formatDate(updatedDate);
@@ -38,8 +51,8 @@ function createResourceCard(resource) {
 }
 
 function createResourceDetail(resource, statuses) {
-    const statusClass = resource.state === 'UP' ? 'status-up' : 'status-down';
-    const statusText = resource.state === 'UP' ? 'Доступен' : 'Недоступен';
+    const statusClass = getStatusClass(resource.state);
+    const statusText = getStatusText(resource.state);
     
     // Calculate stats
     const totalChecks = statuses.length;
@@ -1,9 +1,19 @@
 import taskiq_fastapi
-from taskiq import InMemoryBroker, SmartRetryMiddleware, TaskiqScheduler
+from taskiq import (
+    InMemoryBroker,
+    SmartRetryMiddleware,
+    TaskiqEvents,
+    TaskiqScheduler,
+    TaskiqState,
+)
 from taskiq.schedule_sources import LabelScheduleSource
-from taskiq_redis import ListQueueBroker
+from taskiq_redis import ListQueueBroker, ListRedisScheduleSource
 
 from src.config import settings
+from src.db import sessionmaker
+from src.tasks.middlewares import MetricsMiddleware
+from src.utils.redis import close_redis
+from src.utils.status_buffer import StatusWriteBuffer
 
 middlewares = (
     SmartRetryMiddleware(
@@ -13,6 +23,7 @@ middlewares = (
         use_delay_exponent=settings.taskiq.USE_DELAY_EXPONENT,
         max_delay_exponent=settings.taskiq.MAX_DELAY_EXPONENT,
     ),
+    MetricsMiddleware(),
 )
 
 broker = ListQueueBroker(settings.redis.REDIS_URL).with_middlewares(*middlewares)
@@ -21,4 +32,40 @@ if settings.app.MODE == "TEST":
     broker = InMemoryBroker(await_inplace=True).with_middlewares(*middlewares)
 
 taskiq_fastapi.init(broker=broker, app_or_path="src.main:app")
-scheduler = TaskiqScheduler(broker=broker, sources=[LabelScheduleSource(broker)])
+# Holds the one-off schedules of check batches spread over the dispatch window.
+dispatch_source = ListRedisScheduleSource(settings.redis.REDIS_URL, prefix="dispatch")
+scheduler = TaskiqScheduler(
+    broker=broker,
+    sources=[LabelScheduleSource(broker), dispatch_source],
+)
+
+
+@broker.on_event(TaskiqEvents.WORKER_STARTUP)
+async def start_status_buffer(state: TaskiqState) -> None:
+    if not settings.status_buffer.ENABLED:
+        return
+
+    state.status_buffer = StatusWriteBuffer(
+        session_factory=sessionmaker,
+        max_size=settings.status_buffer.MAX_SIZE,
+        flush_interval=settings.status_buffer.FLUSH_INTERVAL,
+        max_pending=settings.status_buffer.MAX_PENDING,
+        max_run_seconds=(
+            settings.status_storage.RUN_MAX_SECONDS
+            if settings.status_storage.RUN_LENGTH_ENABLED
+            else None
+        ),
+    )
+    await state.status_buffer.start()
+
+
+@broker.on_event(TaskiqEvents.WORKER_SHUTDOWN)
+async def stop_status_buffer(state: TaskiqState) -> None:
+    status_buffer: StatusWriteBuffer | None = getattr(state, "status_buffer", None)
+    if status_buffer is not None:
+        await status_buffer.stop()
+
+
+@broker.on_event(TaskiqEvents.WORKER_SHUTDOWN)
+async def close_redis_client(state: TaskiqState) -> None:
+    await close_redis()
@@ -1,7 +1,13 @@
 import aiohttp
 from fastapi import Request
-from taskiq import TaskiqDepends
+from taskiq import TaskiqDepends, TaskiqState
+
+from src.utils.status_buffer import StatusWriteBuffer
 
 
 async def get_client(request: Request = TaskiqDepends()) -> aiohttp.ClientSession:
     return request.app.state.aiohttp_client
+
+
+async def get_status_buffer(state: TaskiqState = TaskiqDepends()) -> StatusWriteBuffer | None:
+    return getattr(state, "status_buffer", None)
@@ -0,0 +1,16 @@
+from typing import Any
+
+from taskiq import TaskiqMessage, TaskiqMiddleware, TaskiqResult
+
+from src.utils.metrics import TASK_EXECUTION_SECONDS, TASKS_EXECUTED, TASKS_SENT
+
+
+class MetricsMiddleware(TaskiqMiddleware):
+    def pre_send(self, message: TaskiqMessage) -> TaskiqMessage:
+        TASKS_SENT.labels(message.task_name).inc()
+        return message
+
+    def post_execute(self, message: TaskiqMessage, result: TaskiqResult[Any]) -> None:
+        outcome = "error" if result.is_err else "success"
+        TASKS_EXECUTED.labels(message.task_name, outcome).inc()
+        TASK_EXECUTION_SECONDS.labels(message.task_name).observe(result.execution_time)
@@ -4,7 +4,8 @@ from taskiq import TaskiqDepends
 
 from src.api.v1.dependencies.db import get_db
 from src.config import settings
-from src.services import resources
+from src.schemas.resoures import StatusRetentionReportDTO
+from src.services import resources, rollups, sla
 from src.tasks.broker import broker
 from src.utils.db_tools import DBManager
 
@@ -15,8 +16,18 @@ from src.utils.db_tools import DBManager
 )
 async def delete_unrelevant_statuses(
     db: Annotated[DBManager, TaskiqDepends(get_db)],
+) -> StatusRetentionReportDTO:
+    return await resources.ResourceStatusesService(db).delete_unrelevant_statuses()
+
+
+@broker.task(
+    name="maintain_status_partitions",
+    schedule=[{"cron": settings.taskiq.CRON_MAINTAIN_STATUS_PARTITIONS}],
+)
+async def maintain_status_partitions(
+    db: Annotated[DBManager, TaskiqDepends(get_db)],
 ) -> None:
-    await resources.ResourceStatusesService(db).delete_unrelevant_statuses()
+    await resources.ResourceStatusesService(db).maintain_partitions()
 
 
 @broker.task(
@@ -27,3 +38,33 @@ async def check_resources(
     db: Annotated[DBManager, TaskiqDepends(get_db)],
 ) -> None:
     await resources.ResourceService(db).check_resources()
+
+
+@broker.task(
+    name="recover_pending_resources",
+    schedule=[{"cron": settings.taskiq.CRON_RECOVER_PENDING_RESOURCES}],
+)
+async def recover_pending_resources(
+    db: Annotated[DBManager, TaskiqDepends(get_db)],
+) -> None:
+    await resources.ResourceService(db).recover_pending_resources()
+
+
+@broker.task(
+    name="refresh_status_rollups",
+    schedule=[{"cron": settings.taskiq.CRON_REFRESH_STATUS_ROLLUPS}],
+)
+async def refresh_status_rollups(
+    db: Annotated[DBManager, TaskiqDepends(get_db)],
+) -> None:
+    await rollups.ResourceStatusRollupService(db).refresh_rollups()
+
+
+@broker.task(
+    name="refresh_sla",
+    schedule=[{"cron": settings.taskiq.CRON_REFRESH_SLA}],
+)
+async def refresh_sla(
+    db: Annotated[DBManager, TaskiqDepends(get_db)],
+) -> None:
+    await sla.ResourceSLAService(db).refresh_sla()
@@ -4,11 +4,17 @@ import aiohttp
 from taskiq import TaskiqDepends
 
 from src.api.v1.dependencies.db import get_db
-from src.schemas.enums import ResourceState
+from src.schemas.enums import ProbeMethod, ResourceState
+from src.schemas.resoures import ResourceCheckDTO
 from src.services import resources
 from src.tasks.broker import broker
-from src.tasks.dependencies import get_client
+from src.tasks.dependencies import get_client, get_status_buffer
 from src.utils.db_tools import DBManager
+from src.utils.exceptions import ProbeThrottledError
+from src.utils.logconfig import get_logger
+from src.utils.status_buffer import StatusWriteBuffer
+
+logger = get_logger("worker")
 
 
 @broker.task(
@@ -23,10 +29,59 @@ async def check_single_resource(
     url: str,
     client: Annotated[aiohttp.ClientSession, TaskiqDepends(get_client)],
     db: Annotated[DBManager, TaskiqDepends(get_db)],
+    status_buffer: Annotated[StatusWriteBuffer | None, TaskiqDepends(get_status_buffer)],
+    probe_method: ProbeMethod = ProbeMethod.HEAD,
 ) -> None:
-    await resources.ResourceService(db).make_request_to_resource(
-        url=url,
+    service = resources.ResourceService(db)
+    try:
+        await service.make_request_to_resource(
+            url=url,
+            client=client,
+            resource_id=resource_id,
+            status_buffer=status_buffer,
+            probe_method=probe_method,
+            state=state,
+        )
+    except ProbeThrottledError:
+        logger.warning("Skipped check of %s: host rate limit exceeded", url)
+        await service.postpone_throttled_check(resource_id=resource_id, url=url)
+
+
+@broker.task(
+    name="check_resource_batch",
+    retry_on_error=True,
+    max_retries=3,
+    delay=10,
+)
+async def check_resource_batch(
+    batch: list[ResourceCheckDTO],
+    client: Annotated[aiohttp.ClientSession, TaskiqDepends(get_client)],
+    db: Annotated[DBManager, TaskiqDepends(get_db)],
+    status_buffer: Annotated[StatusWriteBuffer | None, TaskiqDepends(get_status_buffer)],
+) -> None:
+    await resources.ResourceService(db).check_resource_batch(
+        batch=batch,
         client=client,
+        status_buffer=status_buffer,
+    )
+
+
+@broker.task(
+    name="verify_resource",
+    retry_on_error=True,
+    max_retries=3,
+    delay=10,
+)
+async def verify_resource(
+    resource_id: int,
+    url: str,
+    client: Annotated[aiohttp.ClientSession, TaskiqDepends(get_client)],
+    db: Annotated[DBManager, TaskiqDepends(get_db)],
+    probe_method: ProbeMethod = ProbeMethod.HEAD,
+) -> None:
+    await resources.ResourceService(db).verify_resource(
         resource_id=resource_id,
-        state=state,
+        url=url,
+        client=client,
+        probe_method=probe_method,
     )
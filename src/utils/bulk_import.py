@@ -0,0 +1,52 @@
+from typing import Any, AsyncIterator
+
+import orjson
+
+from src.utils.exceptions import ImportTooLargeError, InvalidImportPayloadError
+
+NDJSON_MEDIA_TYPES = ("application/x-ndjson", "application/ndjson", "application/jsonl")
+
+
+def is_ndjson(content_type: str | None) -> bool:
+    if not content_type:
+        return False
+    return content_type.split(";", 1)[0].strip().lower() in NDJSON_MEDIA_TYPES
+
+
+def parse_json_items(body: bytes, max_items: int) -> list[Any]:
+    try:
+        items = orjson.loads(body)
+    except orjson.JSONDecodeError as exc:
+        raise InvalidImportPayloadError from exc
+    if not isinstance(items, list):
+        raise InvalidImportPayloadError
+    if len(items) > max_items:
+        raise ImportTooLargeError
+    return items
+
+
+def _parse_ndjson_line(line: bytes) -> Any:
+    try:
+        return orjson.loads(line)
+    except orjson.JSONDecodeError as exc:
+        raise InvalidImportPayloadError from exc
+
+
+async def read_ndjson_items(chunks: AsyncIterator[bytes], max_items: int) -> list[Any]:
+    # Lines are parsed as they arrive, so an oversized upload is rejected
+    # without reading the rest of the stream.
+    items: list[Any] = []
+    tail = b""
+    async for chunk in chunks:
+        *lines, tail = (tail + chunk).split(b"\n")
+        for line in lines:
+            if line.strip():
+                items.append(_parse_ndjson_line(line))
+        if len(items) > max_items:
+            raise ImportTooLargeError
+
+    if tail.strip():
+        items.append(_parse_ndjson_line(tail))
+    if len(items) > max_items:
+        raise ImportTooLargeError
+    return items
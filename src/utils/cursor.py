@@ -0,0 +1,21 @@
+import base64
+import binascii
+from datetime import datetime
+
+import orjson
+
+from src.utils.exceptions import InvalidCursorError
+
+
+def encode_cursor(created_at: datetime, object_id: int) -> str:
+    payload = orjson.dumps([created_at.isoformat(), object_id])
+    return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    padding = "=" * (-len(cursor) % 4)
+    try:
+        created_at, object_id = orjson.loads(base64.urlsafe_b64decode(cursor + padding))
+        return datetime.fromisoformat(created_at), int(object_id)
+    except (binascii.Error, orjson.JSONDecodeError, TypeError, ValueError) as exc:
+        raise InvalidCursorError from exc
@@ -0,0 +1,42 @@
+import time
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from src.utils.metrics import DB_POOL_CHECKOUT_SECONDS, DB_QUERY_SECONDS
+
+QUERY_START_KEY = "query_start"
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    # The pool has no event fired before a checkout starts waiting,
+    # so the wait is measured around the internal getter.
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            DB_POOL_CHECKOUT_SECONDS.observe(time.perf_counter() - start)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    conn.info.setdefault(QUERY_START_KEY, []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    starts = conn.info.get(QUERY_START_KEY)
+    if starts:
+        DB_QUERY_SECONDS.observe(time.perf_counter() - starts.pop())
+
+
+def _handle_error(exception_context) -> None:
+    conn = exception_context.connection
+    if conn is not None and conn.info.get(QUERY_START_KEY):
+        conn.info[QUERY_START_KEY].pop()
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    event.listen(engine.sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine.sync_engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine.sync_engine, "handle_error", _handle_error)
@@ -6,6 +6,9 @@ from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
 
 from src.models.base import Base
 from src.repos.resources import ResourceRepo, ResourceStatusRepo
+from src.repos.rollups import ResourceStatusRollupRepo
+from src.repos.sla import ResourceSLARepo
+from src.repos.watermarks import WatermarkRepo
 from src.utils.exceptions import MissingTablesError
 
 logger = logging.getLogger(__name__)
@@ -19,6 +22,9 @@ class DBManager:
         self.session: AsyncSession = self.session_factory()
         self.resources = ResourceRepo(self.session)
         self.statuses = ResourceStatusRepo(self.session)
+        self.rollups = ResourceStatusRollupRepo(self.session)
+        self.watermarks = WatermarkRepo(self.session)
+        self.sla = ResourceSLARepo(self.session)
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
@@ -0,0 +1,8 @@
+KNUTH_MULTIPLIER = 2654435761
+HASH_SPACE = 2**32
+
+
+def get_phase_offset(resource_id: int, window: float) -> float:
+    if window <= 0:
+        return 0.0
+    return (resource_id * KNUTH_MULTIPLIER % HASH_SPACE) / HASH_SPACE * window
@@ -39,14 +39,38 @@ class ValueOutOfRangeError(ApplicationError):
     detail = "Value out of integer range"
 
 
+class InvalidCursorError(ApplicationError):
+    detail = "Invalid pagination cursor"
+
+
+class InvalidImportPayloadError(ApplicationError):
+    detail = "Import payload must be a JSON array or NDJSON lines"
+
+
+class ImportTooLargeError(ApplicationError):
+    detail = "Too many resources in a single import"
+
+
 class ResourceUnavailableError(ApplicationError):
     detail = "Resource is unavailable"
 
 
+class ProbeThrottledError(ApplicationError):
+    detail = "Host rate limit exceeded"
+
+
+class VerificationNotQueuedError(ApplicationError):
+    detail = "Resource verification could not be queued"
+
+
 class ResourceNotFoundError(ObjectNotFoundError):
     detail = "Resource not found"
 
 
+class SLANotFoundError(ObjectNotFoundError):
+    detail = "SLA summary is not calculated yet"
+
+
 class ResourceAlreadyExistsError(ObjectAlreadyExistsError):
     detail = "Resource already exists"
 
@@ -79,3 +103,28 @@ class ResourceNotFoundHTTPError(ApplicationHTTPError):
 class ResourceAlreadyExistsHTTPError(ApplicationHTTPError):
     detail = "Resource already exists"
     status = status.HTTP_409_CONFLICT
+
+
+class InvalidCursorHTTPError(ApplicationHTTPError):
+    detail = "Invalid pagination cursor"
+    status = status.HTTP_422_UNPROCESSABLE_CONTENT
+
+
+class SLANotFoundHTTPError(ApplicationHTTPError):
+    detail = "SLA summary is not calculated yet"
+    status = status.HTTP_404_NOT_FOUND
+
+
+class InvalidImportPayloadHTTPError(ApplicationHTTPError):
+    detail = "Import payload must be a JSON array or NDJSON lines"
+    status = status.HTTP_422_UNPROCESSABLE_CONTENT
+
+
+class VerificationNotQueuedHTTPError(ApplicationHTTPError):
+    detail = "Resource verification could not be queued"
+    status = status.HTTP_503_SERVICE_UNAVAILABLE
+
+
+class ImportTooLargeHTTPError(ApplicationHTTPError):
+    detail = "Too many resources in a single import"
+    status = status.HTTP_413_CONTENT_TOO_LARGE
@@ -0,0 +1,67 @@
+import csv
+import io
+from typing import Callable
+
+import orjson
+
+from src.schemas.enums import ExportFormat
+from src.schemas.resoures import ResourceStatusDTO
+
+STATUS_EXPORT_FIELDS = (
+    "resource_status_id",
+    "resource_id",
+    "status_code",
+    "response_time",
+    "dns_time",
+    "connect_time",
+    "ttfb",
+    "repeat_count",
+    "created_at",
+    "last_seen_at",
+)
+
+EXPORT_MEDIA_TYPES: dict[ExportFormat, str] = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv",
+}
+
+
+def serialize_ndjson(statuses: list[ResourceStatusDTO]) -> bytes:
+    return b"".join(
+        orjson.dumps({field: getattr(st, field) for field in STATUS_EXPORT_FIELDS}) + b"\n"
+        for st in statuses
+    )
+
+
+def serialize_csv(statuses: list[ResourceStatusDTO]) -> bytes:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerows(
+        (
+            st.resource_status_id,
+            st.resource_id,
+            st.status_code,
+            st.response_time,
+            st.dns_time,
+            st.connect_time,
+            st.ttfb,
+            st.repeat_count,
+            st.created_at.isoformat(),
+            st.last_seen_at.isoformat() if st.last_seen_at else "",
+        )
+        for st in statuses
+    )
+    return buffer.getvalue().encode()
+
+
+def get_export_header(export_format: ExportFormat) -> bytes:
+    if export_format == ExportFormat.CSV:
+        return (",".join(STATUS_EXPORT_FIELDS) + "\r\n").encode()
+    return b""
+
+
+def get_serializer(export_format: ExportFormat) -> Callable[[list[ResourceStatusDTO]], bytes]:
+    return {
+        ExportFormat.NDJSON: serialize_ndjson,
+        ExportFormat.CSV: serialize_csv,
+    }[export_format]
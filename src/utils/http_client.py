@@ -0,0 +1,105 @@
+import time
+from dataclasses import dataclass
+from types import SimpleNamespace
+from typing import Any, Callable
+
+import aiohttp
+
+from src.config import ProbeClientConfig, settings
+
+
+@dataclass
+class ProbeTimings:
+    dns_time: float | None = None
+    connect_time: float | None = None
+    ttfb: float | None = None
+    overhead: float = 0.0
+    request_start: float | None = None
+    dns_start: float = 0.0
+    connect_start: float = 0.0
+    dns_before_connect: float = 0.0
+
+
+def _traced(handler: Callable[[ProbeTimings, float], None]):
+    async def callback(session: aiohttp.ClientSession, ctx: SimpleNamespace, params: Any) -> None:
+        timings = ctx.trace_request_ctx
+        if not isinstance(timings, ProbeTimings):
+            return
+        now = time.perf_counter()
+        handler(timings, now)
+        timings.overhead += time.perf_counter() - now
+
+    return callback
+
+
+def _on_request_start(timings: ProbeTimings, now: float) -> None:
+    if timings.request_start is None:
+        timings.request_start = now
+
+
+def _on_request_end(timings: ProbeTimings, now: float) -> None:
+    if timings.request_start is not None:
+        timings.ttfb = now - timings.request_start
+
+
+def _on_dns_start(timings: ProbeTimings, now: float) -> None:
+    timings.dns_start = now
+
+
+def _on_dns_end(timings: ProbeTimings, now: float) -> None:
+    timings.dns_time = (timings.dns_time or 0.0) + now - timings.dns_start
+
+
+def _on_dns_cache_hit(timings: ProbeTimings, now: float) -> None:
+    timings.dns_time = timings.dns_time or 0.0
+
+
+def _on_connection_start(timings: ProbeTimings, now: float) -> None:
+    timings.connect_start = now
+    timings.dns_before_connect = timings.dns_time or 0.0
+
+
+def _on_connection_end(timings: ProbeTimings, now: float) -> None:
+    # Host resolution happens inside connection creation, so it is subtracted
+    # to keep connect_time to the TCP and TLS handshakes.
+    dns_during_connect = (timings.dns_time or 0.0) - timings.dns_before_connect
+    elapsed = now - timings.connect_start - dns_during_connect
+    timings.connect_time = (timings.connect_time or 0.0) + elapsed
+
+
+def _on_connection_reuse(timings: ProbeTimings, now: float) -> None:
+    timings.connect_time = timings.connect_time or 0.0
+
+
+def create_trace_config() -> aiohttp.TraceConfig:
+    trace_config = aiohttp.TraceConfig()
+    trace_config.on_request_start.append(_traced(_on_request_start))
+    trace_config.on_request_end.append(_traced(_on_request_end))
+    trace_config.on_dns_resolvehost_start.append(_traced(_on_dns_start))
+    trace_config.on_dns_resolvehost_end.append(_traced(_on_dns_end))
+    trace_config.on_dns_cache_hit.append(_traced(_on_dns_cache_hit))
+    trace_config.on_connection_create_start.append(_traced(_on_connection_start))
+    trace_config.on_connection_create_end.append(_traced(_on_connection_end))
+    trace_config.on_connection_reuseconn.append(_traced(_on_connection_reuse))
+    return trace_config
+
+
+def create_probe_client(config: ProbeClientConfig | None = None) -> aiohttp.ClientSession:
+    config = config or settings.probe_client
+    connector = aiohttp.TCPConnector(
+        limit=config.LIMIT,
+        limit_per_host=config.LIMIT_PER_HOST,
+        ttl_dns_cache=config.TTL_DNS_CACHE,
+        keepalive_timeout=config.KEEPALIVE_TIMEOUT,
+    )
+    timeout = aiohttp.ClientTimeout(
+        total=config.TOTAL_TIMEOUT,
+        sock_connect=config.CONNECT_TIMEOUT,
+        sock_read=config.SOCK_READ_TIMEOUT,
+    )
+    trace_configs = [create_trace_config()] if config.TRACE_TIMINGS else None
+    return aiohttp.ClientSession(
+        connector=connector,
+        timeout=timeout,
+        trace_configs=trace_configs,
+    )
@@ -0,0 +1,165 @@
+import os
+from pathlib import Path
+
+# Multiprocess mode is chosen when prometheus_client is first imported,
+# so the directory has to exist before that.
+MULTIPROC_DIR = os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+if MULTIPROC_DIR:
+    os.makedirs(MULTIPROC_DIR, exist_ok=True)
+
+from prometheus_client import (  # noqa: E402
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+)
+from prometheus_client.multiprocess import MultiProcessCollector  # noqa: E402
+
+# Every process group (API, taskiq workers, scheduler) writes into its own
+# subdirectory of a shared root, because pids from different containers collide.
+MULTIPROC_ROOT = os.environ.get("PROMETHEUS_MULTIPROC_ROOT", MULTIPROC_DIR)
+
+HTTP_REQUEST_SECONDS = Histogram(
+    "http_request_seconds",
+    "API request latency",
+    labelnames=("method", "route", "status"),
+)
+PROBE_SECONDS = Histogram(
+    "probe_seconds",
+    "Resource probe latency",
+    labelnames=("state", "outcome"),
+    buckets=(0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 30),
+)
+CHECK_CYCLE_SECONDS = Histogram(
+    "check_cycle_seconds",
+    "Time spent claiming and dispatching due resources",
+    buckets=(0.01, 0.05, 0.1, 0.5, 1, 5, 10, 30, 60),
+)
+CHECK_BATCH_SECONDS = Histogram(
+    "check_batch_seconds",
+    "Time spent probing and saving a batch of resources",
+    buckets=(0.1, 0.5, 1, 2.5, 5, 10, 20, 30, 60),
+)
+TASKS_SENT = Counter(
+    "taskiq_tasks_sent",
+    "Number of enqueued taskiq tasks",
+    labelnames=("task",),
+)
+TASKS_EXECUTED = Counter(
+    "taskiq_tasks_executed",
+    "Number of executed taskiq tasks",
+    labelnames=("task", "outcome"),
+)
+TASK_EXECUTION_SECONDS = Histogram(
+    "taskiq_task_execution_seconds",
+    "Taskiq task execution time",
+    labelnames=("task",),
+    buckets=(0.01, 0.05, 0.1, 0.5, 1, 2.5, 5, 10, 30, 60, 120),
+)
+DB_POOL_CHECKOUT_SECONDS = Histogram(
+    "db_pool_checkout_seconds",
+    "Time spent waiting for a connection from the database pool",
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5, 30),
+)
+DB_QUERY_SECONDS = Histogram(
+    "db_query_seconds",
+    "Database statement execution time",
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5),
+)
+STATUS_ROWS_WRITTEN = Counter(
+    "status_rows_written",
+    "Number of resource statuses written to the database",
+    labelnames=("path",),
+)
+STATUS_RUNS_EXTENDED = Counter(
+    "status_runs_extended",
+    "Number of resource checks folded into an existing run instead of a new row",
+)
+
+STATUS_BUFFER_FLUSH_SIZE = Histogram(
+    "status_buffer_flush_size",
+    "Number of statuses written by a single status buffer flush",
+    buckets=(1, 10, 50, 100, 250, 500, 1000, 2500, 5000, 10000),
+)
+STATUS_BUFFER_FLUSH_SECONDS = Histogram(
+    "status_buffer_flush_seconds",
+    "Time spent writing a status buffer flush to the database",
+)
+STATUS_BUFFER_FLUSH_ERRORS = Counter(
+    "status_buffer_flush_errors",
+    "Number of status buffer flushes that failed",
+)
+STATUS_BUFFER_DROPPED = Counter(
+    "status_buffer_dropped",
+    "Number of buffered statuses dropped because the buffer was full",
+)
+CHECK_DISPATCH_OFFSET_SECONDS = Histogram(
+    "check_dispatch_offset_seconds",
+    "Offset of dispatched resource checks within the dispatch window",
+    buckets=(0, 5, 10, 15, 20, 25, 30, 35, 40, 45, 50, 55, 60),
+)
+PROBE_TRACE_OVERHEAD_SECONDS = Histogram(
+    "probe_trace_overhead_seconds",
+    "Time spent in request tracing callbacks per probe",
+    buckets=(0.00001, 0.00005, 0.0001, 0.0005, 0.001, 0.005),
+)
+RATE_LIMIT_DECISIONS = Counter(
+    "rate_limit_decisions",
+    "Per-host rate limiter decisions for resource probes",
+    labelnames=("decision",),
+)
+RATE_LIMIT_WAIT_SECONDS = Histogram(
+    "rate_limit_wait_seconds",
+    "Time probes waited for a per-host rate limiter token",
+    buckets=(0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+)
+CACHE_HITS = Counter(
+    "cache_hits",
+    "Number of cache lookups served from Redis",
+    labelnames=("namespace",),
+)
+CACHE_MISSES = Counter(
+    "cache_misses",
+    "Number of cache lookups that fell through to the database",
+    labelnames=("namespace",),
+)
+CACHE_ERRORS = Counter(
+    "cache_errors",
+    "Number of cache operations that failed because Redis was unavailable",
+    labelnames=("namespace",),
+)
+STATUS_FEED_SUBSCRIBERS = Gauge(
+    "status_feed_subscribers",
+    "Number of clients connected to the live status feed",
+    multiprocess_mode="livesum",
+)
+STATUS_FEED_DROPPED_SUBSCRIBERS = Counter(
+    "status_feed_dropped_subscribers",
+    "Number of live status feed clients disconnected for falling behind",
+)
+STATUS_FEED_ERRORS = Counter(
+    "status_feed_errors",
+    "Number of live status feed operations that failed because Redis was unavailable",
+    labelnames=("operation",),
+)
+
+
+class _MultiDirCollector:
+    def __init__(self, root: str) -> None:
+        self.root = Path(root)
+
+    def collect(self):
+        files = [str(path) for path in self.root.glob("**/*.db")]
+        return MultiProcessCollector.merge(files, accumulate=True)
+
+
+def render_metrics() -> tuple[bytes, str]:
+    if not MULTIPROC_ROOT:
+        return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
+
+    registry = CollectorRegistry()
+    registry.register(_MultiDirCollector(MULTIPROC_ROOT))  # type: ignore[arg-type]
+    return generate_latest(registry), CONTENT_TYPE_LATEST
@@ -0,0 +1,69 @@
+from datetime import datetime, timedelta, timezone
+from typing import Iterator, Literal
+
+PartitionInterval = Literal["hourly", "daily"]
+
+_STEPS: dict[str, timedelta] = {
+    "hourly": timedelta(hours=1),
+    "daily": timedelta(days=1),
+}
+_FORMATS: dict[str, str] = {
+    "hourly": "%Y%m%d%H",
+    "daily": "%Y%m%d",
+}
+
+
+def get_partition_step(interval: PartitionInterval) -> timedelta:
+    return _STEPS[interval]
+
+
+def get_partition_start(moment: datetime, interval: PartitionInterval) -> datetime:
+    moment = moment.astimezone(timezone.utc)
+    start = moment.replace(minute=0, second=0, microsecond=0)
+    if interval == "daily":
+        start = start.replace(hour=0)
+    return start
+
+
+def get_partition_name(table: str, start: datetime, interval: PartitionInterval) -> str:
+    return f"{table}_p{start.strftime(_FORMATS[interval])}"
+
+
+def parse_partition_name(table: str, name: str) -> tuple[datetime, datetime] | None:
+    prefix = f"{table}_p"
+    if not name.startswith(prefix):
+        return None
+
+    suffix = name.removeprefix(prefix)
+    for interval, fmt in _FORMATS.items():
+        try:
+            start = datetime.strptime(suffix, fmt).replace(tzinfo=timezone.utc)
+        except ValueError:
+            continue
+        if len(suffix) == len(start.strftime(fmt)):
+            return start, start + _STEPS[interval]
+    return None
+
+
+def iter_partition_ranges(
+    start: datetime,
+    end: datetime,
+    interval: PartitionInterval,
+) -> Iterator[tuple[datetime, datetime]]:
+    step = get_partition_step(interval)
+    current = get_partition_start(start, interval)
+    while current < end:
+        yield current, current + step
+        current += step
+
+
+def get_partition_ddl(
+    table: str,
+    name: str,
+    start: datetime,
+    end: datetime,
+) -> str:
+    return (
+        f'CREATE TABLE IF NOT EXISTS "{name}" PARTITION OF "{table}" '
+        f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+    )
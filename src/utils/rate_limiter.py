@@ -0,0 +1,95 @@
+import asyncio
+from urllib.parse import urlsplit
+
+from redis.commands.core import AsyncScript
+from redis.exceptions import RedisError
+
+from src.config import RateLimitConfig
+from src.utils.logconfig import get_logger
+from src.utils.metrics import RATE_LIMIT_DECISIONS, RATE_LIMIT_WAIT_SECONDS
+from src.utils.redis import get_redis
+
+logger = get_logger("rate_limiter")
+
+# Returns the number of seconds to wait for the reserved token,
+# or -1 when the token would not be available within max_wait.
+TOKEN_BUCKET_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local max_wait = tonumber(ARGV[3])
+local time = redis.call('TIME')
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(bucket[1]) or burst
+local ts = tonumber(bucket[2]) or now
+tokens = math.min(burst, tokens + (now - ts) * rate)
+
+local wait = 0
+if tokens < 1 then
+    wait = (1 - tokens) / rate
+    if wait > max_wait then
+        return '-1'
+    end
+end
+
+redis.call('HSET', KEYS[1], 'tokens', tokens - 1, 'ts', now)
+redis.call('EXPIRE', KEYS[1], math.ceil((burst + max_wait * rate) / rate) + 1)
+return tostring(wait)
+"""
+
+
+class HostRateLimiter:
+    def __init__(self, config: RateLimitConfig, enabled: bool = True) -> None:
+        self.config = config
+        self.enabled = enabled and config.ENABLED
+        self._script: AsyncScript | None = None
+
+    def _get_rate(self, host: str) -> float:
+        return self.config.HOST_RATES.get(host, self.config.DEFAULT_RATE)
+
+    @staticmethod
+    def _get_host(url: str) -> str:
+        return urlsplit(url).hostname or url
+
+    def get_retry_after(self, url: str) -> float:
+        # Time the host bucket needs to refill a single token.
+        return 1 / self._get_rate(self._get_host(url))
+
+    def _get_script(self) -> AsyncScript:
+        # The script is registered again only when the shared client was recreated.
+        redis = get_redis()
+        if self._script is None or self._script.registered_client is not redis:
+            self._script = redis.register_script(TOKEN_BUCKET_SCRIPT)
+        return self._script
+
+    async def acquire(self, url: str) -> bool:
+        if not self.enabled:
+            return True
+
+        host = self._get_host(url)
+        max_wait = self.config.MAX_WAIT if self.config.MODE == "wait" else 0
+        script = self._get_script()
+        try:
+            wait = float(
+                await script(
+                    keys=[f"{self.config.NAMESPACE}:{host}"],
+                    args=[self._get_rate(host), self.config.DEFAULT_BURST, max_wait],
+                )
+            )
+        except RedisError as exc:
+            RATE_LIMIT_DECISIONS.labels("error").inc()
+            logger.warning("Cannot reach rate limiter for %s. Detail: %s", host, str(exc))
+            return True
+
+        if wait < 0:
+            RATE_LIMIT_DECISIONS.labels("skipped").inc()
+            return False
+        if wait > 0:
+            RATE_LIMIT_DECISIONS.labels("waited").inc()
+            RATE_LIMIT_WAIT_SECONDS.observe(wait)
+            await asyncio.sleep(wait)
+            return True
+
+        RATE_LIMIT_DECISIONS.labels("allowed").inc()
+        return True
@@ -0,0 +1,46 @@
+from typing import Awaitable, Callable
+
+from redis.exceptions import RedisError
+
+from src.utils.logconfig import get_logger
+from src.utils.metrics import CACHE_ERRORS, CACHE_HITS, CACHE_MISSES
+from src.utils.redis import get_redis
+
+logger = get_logger("redis_cache")
+
+
+class RedisCache:
+    def __init__(self, namespace: str, ttl: int, enabled: bool = True) -> None:
+        self.namespace = namespace
+        self.ttl = ttl
+        self.enabled = enabled
+
+    def _key(self, name: str) -> str:
+        return f"{self.namespace}:{name}"
+
+    async def get_or_set(self, name: str, factory: Callable[[], Awaitable[bytes]]) -> bytes:
+        # Names carry the version of what they cache, so entries are never
+        # invalidated and old ones simply expire.
+        if not self.enabled:
+            return await factory()
+
+        redis = get_redis()
+        try:
+            payload = await redis.get(self._key(name))
+        except RedisError as exc:
+            CACHE_ERRORS.labels(self.namespace).inc()
+            logger.warning("Cannot read %s from cache. Detail: %s", name, str(exc))
+            return await factory()
+
+        if payload is not None:
+            CACHE_HITS.labels(self.namespace).inc()
+            return payload
+
+        CACHE_MISSES.labels(self.namespace).inc()
+        payload = await factory()
+        try:
+            await redis.set(self._key(name), payload, ex=self.ttl)
+        except RedisError as exc:
+            CACHE_ERRORS.labels(self.namespace).inc()
+            logger.warning("Cannot write %s to cache. Detail: %s", name, str(exc))
+        return payload
@@ -0,0 +1,290 @@
+import json
+import os
+from datetime import date, datetime, time, timedelta, timezone
+from pathlib import Path
+from typing import Iterator, Sequence
+
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+from pyarrow import fs
+
+from src.config import StatusArchiveConfig
+from src.schemas.resoures import ResourceStatusDTO
+
+TIMESTAMP = pa.timestamp("us", tz="UTC")
+INDEX_NAME = "index.json"
+COMPACTED_NAME = "day.parquet"
+
+STATUS_ARCHIVE_SCHEMA = pa.schema(
+    [
+        ("resource_status_id", pa.int64()),
+        ("resource_id", pa.int32()),
+        ("status_code", pa.int32()),
+        ("response_time", pa.float64()),
+        ("response_time_min", pa.float64()),
+        ("response_time_max", pa.float64()),
+        ("latency_bucket", pa.int16()),
+        ("repeat_count", pa.int32()),
+        ("dns_time", pa.float64()),
+        ("connect_time", pa.float64()),
+        ("ttfb", pa.float64()),
+        ("created_at", TIMESTAMP),
+        ("updated_at", TIMESTAMP),
+        ("last_seen_at", TIMESTAMP),
+    ]
+)
+
+
+def iter_archive_days(
+    since: datetime,
+    until: datetime,
+) -> Iterator[tuple[date, datetime, datetime]]:
+    # Yields (day, start, end] slices of the archived range split at UTC midnight.
+    start = since.astimezone(timezone.utc)
+    until = until.astimezone(timezone.utc)
+    while start < until:
+        day = start.date()
+        end = min(datetime.combine(day + timedelta(days=1), time(), tzinfo=timezone.utc), until)
+        yield day, start, end
+        start = end
+
+
+def read_index(day_dir: Path) -> dict[str, dict[int, tuple[datetime, datetime]]]:
+    # Maps every file of the day to the created_at range of each resource in it.
+    try:
+        raw = json.loads((day_dir / INDEX_NAME).read_text())
+    except FileNotFoundError:
+        return {}
+    return {
+        name: {
+            int(resource_id): (datetime.fromisoformat(low), datetime.fromisoformat(high))
+            for resource_id, (low, high) in ranges.items()
+        }
+        for name, ranges in raw.items()
+    }
+
+
+def write_index(day_dir: Path, index: dict[str, dict[int, tuple[datetime, datetime]]]) -> None:
+    raw = {
+        name: {
+            str(resource_id): [low.isoformat(), high.isoformat()]
+            for resource_id, (low, high) in ranges.items()
+        }
+        for name, ranges in index.items()
+    }
+    tmp_path = day_dir / f"{INDEX_NAME}.tmp"
+    tmp_path.write_text(json.dumps(raw))
+    os.replace(tmp_path, day_dir / INDEX_NAME)
+
+
+class StatusArchiveWriter:
+    def __init__(self, path: Path, config: StatusArchiveConfig) -> None:
+        self.path = path
+        self.config = config
+        self.rows = 0
+        self.ranges: dict[int, tuple[datetime, datetime]] = {}
+        self._tmp_path = path.with_suffix(".tmp")
+        self._writer: pq.ParquetWriter | None = None
+
+    def write(self, statuses: Sequence[ResourceStatusDTO]) -> None:
+        if not statuses:
+            return
+        if self._writer is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._writer = pq.ParquetWriter(
+                self._tmp_path,
+                STATUS_ARCHIVE_SCHEMA,
+                compression=self.config.COMPRESSION,
+            )
+
+        table = pa.Table.from_pylist(
+            [st.model_dump() for st in statuses],
+            schema=STATUS_ARCHIVE_SCHEMA,
+        )
+        self._writer.write_table(table, row_group_size=self.config.ROW_GROUP_SIZE)
+        self.rows += len(statuses)
+        for st in statuses:
+            low, high = self.ranges.get(st.resource_id, (st.created_at, st.created_at))
+            self.ranges[st.resource_id] = (min(low, st.created_at), max(high, st.created_at))
+
+    def close(self) -> int:
+        if self._writer is None:
+            return 0
+        self._writer.close()
+        # A file only shows up under its final name once it is complete, and a
+        # rerun of the same slice replaces it. Readers only open files listed in
+        # the index, so it is updated last.
+        os.replace(self._tmp_path, self.path)
+        index = read_index(self.path.parent)
+        index[self.path.name] = self.ranges
+        write_index(self.path.parent, index)
+        return self.rows
+
+    def abort(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+        self._tmp_path.unlink(missing_ok=True)
+
+
+class StatusArchive:
+    def __init__(self, config: StatusArchiveConfig) -> None:
+        self.config = config
+        self._filesystem = fs.LocalFileSystem(use_mmap=True)
+
+    def open_writer(self, day: date, start: datetime) -> StatusArchiveWriter:
+        path = self.config.DIRECTORY / day.isoformat() / f"{start:%H%M%S%f}.parquet"
+        return StatusArchiveWriter(path=path, config=self.config)
+
+    def read_page(
+        self,
+        resource_id: int,
+        limit: int,
+        date_from: datetime | None = None,
+        date_to: datetime | None = None,
+        after: tuple[datetime, int] | None = None,
+    ) -> list[ResourceStatusDTO]:
+        upper = date_to
+        if after is not None:
+            upper = min(upper, after[0]) if upper else after[0]
+
+        expression = self._get_filter(resource_id, date_from, date_to, after)
+        rows: list[dict] = []
+        for day in self._get_days(date_from, upper):
+            try:
+                table = self._read_day(day, resource_id, expression, date_from, upper)
+            except FileNotFoundError:
+                # The day was compacted between reading its index and its files.
+                table = self._read_day(day, resource_id, expression, date_from, upper)
+            if table is None:
+                continue
+            table = table.sort_by(
+                [("created_at", "descending"), ("resource_status_id", "descending")]
+            )
+            rows.extend(table.slice(0, limit - len(rows)).to_pylist())
+            if len(rows) >= limit:
+                break
+        return [ResourceStatusDTO.model_validate(row) for row in rows]
+
+    def compact_day(self, day: date) -> int:
+        # Retention writes a file per run, so a closed day is merged into a single
+        # file sorted like the parts are, and reads of it open one file only.
+        day_dir = self.config.DIRECTORY / day.isoformat()
+        index = read_index(day_dir)
+        if len(index) < 2:
+            return 0
+
+        files = sorted(str(day_dir / name) for name in index)
+        table = (
+            ds.dataset(
+                files,
+                schema=STATUS_ARCHIVE_SCHEMA,
+                format="parquet",
+                filesystem=self._filesystem,
+            )
+            .to_table()
+            .sort_by([("resource_id", "ascending"), ("created_at", "ascending")])
+        )
+        path = day_dir / COMPACTED_NAME
+        tmp_path = path.with_suffix(".tmp")
+        pq.write_table(
+            table,
+            tmp_path,
+            row_group_size=self.config.ROW_GROUP_SIZE,
+            compression=self.config.COMPRESSION,
+        )
+        os.replace(tmp_path, path)
+
+        ranges: dict[int, tuple[datetime, datetime]] = {}
+        for file_ranges in index.values():
+            for resource_id, (low, high) in file_ranges.items():
+                known_low, known_high = ranges.get(resource_id, (low, high))
+                ranges[resource_id] = (min(known_low, low), max(known_high, high))
+        # Parts stay readable until the index points at the merged file only.
+        write_index(day_dir, {COMPACTED_NAME: ranges})
+        for name in index:
+            if name != COMPACTED_NAME:
+                (day_dir / name).unlink(missing_ok=True)
+        return len(index)
+
+    def _read_day(
+        self,
+        day: str,
+        resource_id: int,
+        expression: ds.Expression,
+        date_from: datetime | None = None,
+        date_to: datetime | None = None,
+    ) -> pa.Table | None:
+        files = self._get_files(day, resource_id, date_from, date_to)
+        if not files:
+            return None
+        # Files are sorted by resource_id, so row group statistics let the
+        # scan skip everything but the row groups holding this resource.
+        dataset = ds.dataset(
+            files,
+            schema=STATUS_ARCHIVE_SCHEMA,
+            format="parquet",
+            filesystem=self._filesystem,
+        )
+        return dataset.to_table(filter=expression)
+
+    def _get_files(
+        self,
+        day: str,
+        resource_id: int,
+        date_from: datetime | None = None,
+        date_to: datetime | None = None,
+    ) -> list[str]:
+        # Files whose index entry cannot hold the resource in range are never opened.
+        day_dir = self.config.DIRECTORY / day
+        files = []
+        for name, ranges in read_index(day_dir).items():
+            if resource_id not in ranges:
+                continue
+            low, high = ranges[resource_id]
+            if date_from is not None and high < date_from:
+                continue
+            if date_to is not None and low > date_to:
+                continue
+            files.append(str(day_dir / name))
+        return sorted(files)
+
+    def _get_days(self, date_from: datetime | None, date_to: datetime | None) -> list[str]:
+        if not self.config.DIRECTORY.is_dir():
+            return []
+
+        # A status created exactly at midnight is archived with the previous day.
+        first = last = None
+        if date_from is not None:
+            first = (date_from - timedelta(days=1)).astimezone(timezone.utc).date()
+        if date_to is not None:
+            last = date_to.astimezone(timezone.utc).date()
+        days = []
+        for path in self.config.DIRECTORY.iterdir():
+            try:
+                day = date.fromisoformat(path.name)
+            except ValueError:
+                continue
+            if (first is None or day >= first) and (last is None or day <= last):
+                days.append(path.name)
+        return sorted(days, reverse=True)
+
+    @staticmethod
+    def _get_filter(
+        resource_id: int,
+        date_from: datetime | None = None,
+        date_to: datetime | None = None,
+        after: tuple[datetime, int] | None = None,
+    ) -> ds.Expression:
+        created_at = ds.field("created_at")
+        expression = ds.field("resource_id") == resource_id
+        if date_from is not None:
+            expression &= created_at >= pa.scalar(date_from, type=TIMESTAMP)
+        if date_to is not None:
+            expression &= created_at < pa.scalar(date_to, type=TIMESTAMP)
+        if after is not None:
+            after_at = pa.scalar(after[0], type=TIMESTAMP)
+            expression &= (created_at < after_at) | (
+                (created_at == after_at) & (ds.field("resource_status_id") < after[1])
+            )
+        return expression
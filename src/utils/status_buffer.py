@@ -0,0 +1,106 @@
+import asyncio
+import time
+from contextlib import suppress
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from src.schemas.resoures import ResourceStatusAddDTO
+from src.utils.db_tools import DBManager
+from src.utils.logconfig import get_logger
+from src.utils.metrics import (
+    STATUS_BUFFER_DROPPED,
+    STATUS_BUFFER_FLUSH_ERRORS,
+    STATUS_BUFFER_FLUSH_SECONDS,
+    STATUS_BUFFER_FLUSH_SIZE,
+    STATUS_ROWS_WRITTEN,
+    STATUS_RUNS_EXTENDED,
+)
+
+logger = get_logger("status_buffer")
+
+
+class StatusWriteBuffer:
+    def __init__(
+        self,
+        session_factory: async_sessionmaker,
+        max_size: int,
+        flush_interval: float,
+        max_pending: int | None = None,
+        max_run_seconds: int | None = None,
+    ) -> None:
+        self.session_factory = session_factory
+        self.max_size = max_size
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending or max_size * 10
+        # Consecutive identical results are folded into runs when set.
+        self.max_run_seconds = max_run_seconds
+        self._items: list[ResourceStatusAddDTO] = []
+        self._lock = asyncio.Lock()
+        self._flusher: asyncio.Task | None = None
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    async def start(self) -> None:
+        if self._flusher is None:
+            self._flusher = asyncio.create_task(self._flush_periodically())
+
+    async def stop(self) -> None:
+        if self._flusher is not None:
+            self._flusher.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._flusher
+            self._flusher = None
+        await self.flush()
+
+    async def put(self, item: ResourceStatusAddDTO) -> None:
+        self._items.append(item)
+        # Puts keep coming while a slow flush holds the lock.
+        self._drop_overflow()
+        if len(self._items) >= self.max_size:
+            await self.flush()
+
+    async def flush(self) -> int:
+        async with self._lock:
+            if not self._items:
+                return 0
+
+            items, self._items = self._items, []
+            start = time.perf_counter()
+            written = len(items)
+            try:
+                async with DBManager(session_factory=self.session_factory) as db:
+                    if self.max_run_seconds is None:
+                        await db.statuses.add_bulk(items, returning=False)
+                    else:
+                        written = await db.statuses.add_runs(items, self.max_run_seconds)
+                    await db.commit()
+            except Exception:
+                STATUS_BUFFER_FLUSH_ERRORS.inc()
+                logger.exception("Cannot flush %s buffered statuses", len(items))
+                self._requeue(items)
+                return 0
+
+            elapsed = time.perf_counter() - start
+            STATUS_BUFFER_FLUSH_SIZE.observe(len(items))
+            STATUS_ROWS_WRITTEN.labels("buffer").inc(written)
+            STATUS_RUNS_EXTENDED.inc(len(items) - written)
+            STATUS_BUFFER_FLUSH_SECONDS.observe(elapsed)
+            logger.debug("Flushed %s statuses in %.4f sec", len(items), elapsed)
+            return len(items)
+
+    def _requeue(self, items: list[ResourceStatusAddDTO]) -> None:
+        self._items = items + self._items
+        self._drop_overflow()
+
+    def _drop_overflow(self) -> None:
+        overflow = len(self._items) - self.max_pending
+        if overflow > 0:
+            logger.warning("Status buffer is full. Dropping %s oldest statuses", overflow)
+            STATUS_BUFFER_DROPPED.inc(overflow)
+            del self._items[:overflow]
+
+    async def _flush_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
@@ -0,0 +1,123 @@
+import asyncio
+from contextlib import suppress
+from typing import AsyncIterator, Sequence
+
+import orjson
+from redis.exceptions import RedisError
+
+from src.config import StatusFeedConfig
+from src.schemas.resoures import ResourceStatusEventDTO
+from src.utils.logconfig import get_logger
+from src.utils.metrics import (
+    STATUS_FEED_DROPPED_SUBSCRIBERS,
+    STATUS_FEED_ERRORS,
+    STATUS_FEED_SUBSCRIBERS,
+)
+from src.utils.redis import get_redis
+
+logger = get_logger("status_feed")
+
+HEARTBEAT = b": ping\n\n"
+
+
+class StatusFeedPublisher:
+    def __init__(self, channel: str, enabled: bool = True) -> None:
+        self.channel = channel
+        self.enabled = enabled
+
+    async def publish(self, events: Sequence[ResourceStatusEventDTO]) -> None:
+        if not self.enabled or not events:
+            return
+
+        # A whole batch goes out as one message to keep pub/sub traffic per check cycle low.
+        payload = orjson.dumps([event.model_dump(mode="json") for event in events])
+        try:
+            await get_redis().publish(self.channel, payload)
+        except RedisError as exc:
+            STATUS_FEED_ERRORS.labels("publish").inc()
+            logger.warning("Cannot publish %s status events. Detail: %s", len(events), str(exc))
+
+
+class StatusFeedHub:
+    def __init__(self, config: StatusFeedConfig) -> None:
+        self.config = config
+        self._subscribers: set[asyncio.Queue[bytes | None]] = set()
+        self._listener: asyncio.Task | None = None
+
+    def __len__(self) -> int:
+        return len(self._subscribers)
+
+    def subscribe(self) -> asyncio.Queue[bytes | None]:
+        # A worker opens its single Redis subscription only once a client shows up.
+        if self._listener is None or self._listener.done():
+            self._listener = asyncio.create_task(self._listen())
+
+        queue: asyncio.Queue[bytes | None] = asyncio.Queue(maxsize=self.config.QUEUE_SIZE)
+        self._subscribers.add(queue)
+        STATUS_FEED_SUBSCRIBERS.inc()
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue[bytes | None]) -> None:
+        if queue in self._subscribers:
+            self._subscribers.discard(queue)
+            STATUS_FEED_SUBSCRIBERS.dec()
+
+    def broadcast(self, payload: bytes) -> None:
+        for queue in list(self._subscribers):
+            try:
+                queue.put_nowait(payload)
+            except asyncio.QueueFull:
+                self._drop(queue)
+
+    def _drop(self, queue: asyncio.Queue[bytes | None]) -> None:
+        # A slow client is disconnected instead of buffering for it without bound.
+        # EventSource reconnects by itself and the page reloads the current states.
+        self.unsubscribe(queue)
+        STATUS_FEED_DROPPED_SUBSCRIBERS.inc()
+        with suppress(asyncio.QueueEmpty):
+            queue.get_nowait()
+        queue.put_nowait(None)
+
+    async def iter_events(self, queue: asyncio.Queue[bytes | None]) -> AsyncIterator[bytes]:
+        try:
+            yield f"retry: {self.config.RETRY_MS}\n\n".encode()
+            while True:
+                try:
+                    payload = await asyncio.wait_for(
+                        queue.get(), timeout=self.config.HEARTBEAT_INTERVAL
+                    )
+                except asyncio.TimeoutError:
+                    yield HEARTBEAT
+                    continue
+                if payload is None:
+                    return
+                yield b"event: statuses\ndata: " + payload + b"\n\n"
+        finally:
+            self.unsubscribe(queue)
+
+    async def stop(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._listener
+            self._listener = None
+
+        for queue in list(self._subscribers):
+            self.unsubscribe(queue)
+            with suppress(asyncio.QueueFull):
+                queue.put_nowait(None)
+
+    async def _listen(self) -> None:
+        while True:
+            pubsub = get_redis().pubsub(ignore_subscribe_messages=True)
+            try:
+                await pubsub.subscribe(self.config.CHANNEL)
+                async for message in pubsub.listen():
+                    self.broadcast(message["data"])
+            except RedisError as exc:
+                STATUS_FEED_ERRORS.labels("subscribe").inc()
+                logger.warning("Status feed subscription lost. Detail: %s", str(exc))
+            finally:
+                with suppress(RedisError):
+                    await pubsub.aclose()
+            await asyncio.sleep(self.config.RECONNECT_DELAY)
@@ -0,0 +1,67 @@
+from bisect import bisect_left
+from typing import Sequence
+
+from fastapi import status
+from sqlalchemy import ColumnElement, or_
+
+from src.schemas.resoures import ResourceStatusDTO
+
+TOLERATED_STATUS_CODES: tuple[int, ...] = (status.HTTP_403_FORBIDDEN,)
+
+# Non-standard code recorded when a probe fails with any other client error.
+PROBE_CLIENT_ERROR = 596
+# Non-standard codes recorded when a probe hits one of the client timeouts.
+PROBE_TOTAL_TIMEOUT = 597
+PROBE_READ_TIMEOUT = 598
+PROBE_CONNECT_TIMEOUT = 599
+PROBE_TIMEOUT_STATUS_CODES: tuple[int, ...] = (
+    status.HTTP_408_REQUEST_TIMEOUT,
+    PROBE_TOTAL_TIMEOUT,
+    PROBE_READ_TIMEOUT,
+    PROBE_CONNECT_TIMEOUT,
+)
+
+
+def is_valid_status(status_code: int) -> bool:
+    anti_bot_protection = status_code in TOLERATED_STATUS_CODES
+    success_status = status_code in range(status.HTTP_200_OK, status.HTTP_300_MULTIPLE_CHOICES)
+    return success_status or anti_bot_protection
+
+
+def get_probe_outcome(status_code: int) -> str:
+    if status_code in PROBE_TIMEOUT_STATUS_CODES:
+        return "timeout"
+    return "success" if is_valid_status(status_code) else "failure"
+
+
+def get_latency_bucket(response_time: float, buckets: Sequence[float]) -> int:
+    return bisect_left(buckets, response_time)
+
+
+def expand_runs(statuses: Sequence[ResourceStatusDTO]) -> list[ResourceStatusDTO]:
+    # Checks folded into a run are spread evenly between its first and last check,
+    # newest first like the pages they come from.
+    expanded = []
+    for st in statuses:
+        if st.repeat_count <= 1 or st.last_seen_at is None:
+            expanded.append(st)
+            continue
+        step = (st.last_seen_at - st.created_at) / (st.repeat_count - 1)
+        expanded.extend(
+            st.model_copy(
+                update={
+                    "created_at": st.created_at + step * n,
+                    "repeat_count": 1,
+                    "last_seen_at": None,
+                }
+            )
+            for n in reversed(range(st.repeat_count))
+        )
+    return expanded
+
+
+def valid_status_clause(status_code: ColumnElement[int]) -> ColumnElement[bool]:
+    return or_(
+        status_code.between(status.HTTP_200_OK, status.HTTP_300_MULTIPLE_CHOICES - 1),
+        status_code.in_(TOLERATED_STATUS_CODES),
+    )
@@ -0,0 +1,27 @@
+import time
+from typing import Generic, Hashable, TypeVar
+
+ValueType = TypeVar("ValueType")
+
+
+class TTLCache(Generic[ValueType]):
+    def __init__(self, ttl: float) -> None:
+        self.ttl = ttl
+        self._items: dict[Hashable, tuple[float, ValueType]] = {}
+
+    def get(self, key: Hashable) -> ValueType | None:
+        item = self._items.get(key)
+        if item is None:
+            return None
+
+        expires_at, value = item
+        if expires_at < time.monotonic():
+            del self._items[key]
+            return None
+        return value
+
+    def set(self, key: Hashable, value: ValueType) -> None:
+        self._items[key] = (time.monotonic() + self.ttl, value)
+
+    def clear(self) -> None:
+        self._items.clear()
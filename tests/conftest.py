@@ -8,7 +8,12 @@ import aiohttp
 import pytest
 from httpx import ASGITransport, AsyncClient
 
-from src.api.v1.dependencies.db import get_db, get_db_with_null_pool
+from src.api.v1.dependencies.db import (
+    get_db,
+    get_db_with_null_pool,
+    get_session_factory,
+    get_session_factory_null_pool,
+)
 from src.config import settings
 from src.db import engine_null_pool
 from src.main import app
@@ -19,6 +24,12 @@ from src.tasks.dependencies import get_client
 from src.utils.db_tools import DBHealthChecker, DBManager
 
 app.dependency_overrides[get_db] = get_db_with_null_pool
+app.dependency_overrides[get_session_factory] = get_session_factory_null_pool
+
+
+@pytest.fixture(autouse=True)
+def dispatch_immediately(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings.taskiq, "DISPATCH_WINDOW_SECONDS", 0)
 
 
 @pytest.fixture()
@@ -91,6 +102,7 @@ def _create_mock_client(status: int, raise_error: bool = False):
     mock_response = AsyncMock()
     mock_response.status = status
     mock_response.raise_for_status = lambda: None
+    mock_response.content.read = AsyncMock(return_value=b"")
 
     if raise_error:
         mock_response.raise_for_status.side_effect = aiohttp.ClientResponseError(
@@ -105,6 +117,7 @@ def _create_mock_client(status: int, raise_error: bool = False):
 
     mock_client = AsyncMock(spec=aiohttp.ClientSession)
     mock_client.get.return_value = mock_cm
+    mock_client.request.return_value = mock_cm
 
     return mock_client
 
@@ -0,0 +1,181 @@
+# ruff: noqa: F401 F811
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+from httpx import AsyncClient
+
+from src.config import settings
+from src.schemas.resoures import ResourceDTO, ResourceStatusAddDTO, ResourceStatusDTO
+from src.services.resources import ResourceStatusesService, status_archive
+from src.utils.db_tools import DBManager
+from tests.integration.test_api.test_creating_resource import create_resource
+
+
+@pytest.fixture
+def archive_dir(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Path:
+    monkeypatch.setattr(settings.status_archive, "ENABLED", True)
+    monkeypatch.setattr(settings.status_archive, "DIRECTORY", tmp_path)
+    return tmp_path
+
+
+async def _seed_expired_statuses(
+    db: DBManager,
+    resource: ResourceDTO,
+    count: int,
+) -> list[ResourceStatusDTO]:
+    expired_at = datetime.now(timezone.utc) - timedelta(
+        hours=settings.taskiq.UNRELEVANT_STATUS_HOURS + 1
+    )
+    statuses = []
+    for idx in range(count):
+        statuses.append(
+            await db.statuses.add(
+                ResourceStatusAddDTO(
+                    resource_id=resource.resource_id,
+                    response_time=1.0,
+                    status_code=200,
+                ),
+                created_at=expired_at - timedelta(minutes=idx),
+            )
+        )
+    await db.commit()
+    return statuses
+
+
+async def test_retention_archives_expired_statuses(
+    recreate_tables: None,
+    archive_dir: Path,
+    create_resource: ResourceDTO,
+    db: DBManager,
+) -> None:
+    await _seed_expired_statuses(db, create_resource, 3)
+    relevant = await db.statuses.add(
+        ResourceStatusAddDTO(
+            resource_id=create_resource.resource_id,
+            response_time=1.0,
+            status_code=200,
+        )
+    )
+    await db.commit()
+
+    report = await ResourceStatusesService(db).delete_unrelevant_statuses()
+
+    assert report.archived == 3
+    assert list(archive_dir.glob("*/*.parquet"))
+    statuses = await db.statuses.get_all_filtered(resource_id=create_resource.resource_id)
+    assert [st.id for st in statuses] == [relevant.id]
+
+    report = await ResourceStatusesService(db).delete_unrelevant_statuses()
+    assert report.archived == 0
+
+
+async def test_statuses_pages_continue_from_archive(
+    ac: AsyncClient,
+    recreate_tables: None,
+    archive_dir: Path,
+    create_resource: ResourceDTO,
+    db: DBManager,
+) -> None:
+    expired = await _seed_expired_statuses(db, create_resource, 3)
+    relevant = await db.statuses.add(
+        ResourceStatusAddDTO(
+            resource_id=create_resource.resource_id,
+            response_time=1.0,
+            status_code=200,
+        )
+    )
+    await db.commit()
+    await ResourceStatusesService(db).delete_unrelevant_statuses()
+    url = f"/resources/{create_resource.resource_id}/statuses"
+
+    resp = await ac.get(url, params={"limit": 2})
+    assert resp.status_code == 200
+    data = resp.json()
+    assert [st["resource_status_id"] for st in data["data"]] == [relevant.id, expired[0].id]
+
+    resp = await ac.get(url, params={"limit": 2, "cursor": data["next_cursor"]})
+    assert resp.status_code == 200
+    data = resp.json()
+    assert [st["resource_status_id"] for st in data["data"]] == [expired[1].id, expired[2].id]
+    assert data["next_cursor"] is None
+
+    date_to = datetime.now(timezone.utc) - timedelta(hours=settings.taskiq.UNRELEVANT_STATUS_HOURS)
+    resp = await ac.get(url, params={"to": date_to.isoformat()})
+    assert resp.status_code == 200
+    assert len(resp.json()["data"]) == 3
+
+
+async def test_archive_index_skips_files_without_resource(
+    recreate_tables: None,
+    archive_dir: Path,
+    create_resource: ResourceDTO,
+    db: DBManager,
+) -> None:
+    expired = await _seed_expired_statuses(db, create_resource, 3)
+    await ResourceStatusesService(db).delete_unrelevant_statuses()
+    day = expired[0].created_at.astimezone(timezone.utc).date().isoformat()
+
+    assert status_archive._get_files(day, create_resource.resource_id)
+    assert not status_archive._get_files(day, create_resource.resource_id + 1)
+    assert not status_archive._get_files(
+        day, create_resource.resource_id, date_from=expired[0].created_at + timedelta(seconds=1)
+    )
+
+
+async def test_statuses_above_archive_watermark_skip_archive(
+    ac: AsyncClient,
+    recreate_tables: None,
+    archive_dir: Path,
+    create_resource: ResourceDTO,
+    db: DBManager,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    await _seed_expired_statuses(db, create_resource, 1)
+    await ResourceStatusesService(db).delete_unrelevant_statuses()
+
+    def read_page(**kwargs) -> list[ResourceStatusDTO]:
+        raise AssertionError("archive must not be read")
+
+    monkeypatch.setattr(status_archive, "read_page", read_page)
+    date_from = datetime.now(timezone.utc) - timedelta(hours=1)
+    resp = await ac.get(
+        f"/resources/{create_resource.resource_id}/statuses",
+        params={"from": date_from.isoformat()},
+    )
+    assert resp.status_code == 200
+    assert resp.json()["data"] == []
+
+
+async def test_closed_archive_day_is_compacted(
+    recreate_tables: None,
+    archive_dir: Path,
+    create_resource: ResourceDTO,
+    db: DBManager,
+) -> None:
+    midnight = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+    day_start = midnight - timedelta(days=1)
+    statuses = []
+    for hour in (1, 2, 3):
+        statuses.append(
+            await db.statuses.add(
+                ResourceStatusAddDTO(
+                    resource_id=create_resource.resource_id,
+                    response_time=1.0,
+                    status_code=200,
+                ),
+                created_at=day_start + timedelta(hours=hour),
+            )
+        )
+    await db.commit()
+    service = ResourceStatusesService(db)
+    day_dir = archive_dir / day_start.date().isoformat()
+
+    await service.archive_expired_statuses(threshold=day_start + timedelta(hours=1, minutes=30))
+    await service.archive_expired_statuses(threshold=day_start + timedelta(hours=2, minutes=30))
+    assert len(list(day_dir.glob("*.parquet"))) == 2
+
+    await service.archive_expired_statuses(threshold=midnight + timedelta(minutes=1))
+    assert [path.name for path in day_dir.glob("*.parquet")] == ["day.parquet"]
+    archived = status_archive.read_page(resource_id=create_resource.resource_id, limit=10)
+    assert [st.id for st in archived] == [st.id for st in reversed(statuses)]
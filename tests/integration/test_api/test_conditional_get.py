@@ -0,0 +1,88 @@
+# ruff: noqa: F401 F811
+from httpx import AsyncClient
+from sqlalchemy import func, update
+
+from src.models.resoures import Resource
+from src.schemas.enums import ResourceState
+from src.schemas.resoures import ResourceDTO, ResourceStatusAddDTO, ResourceUpdateDTO
+from src.utils.db_tools import DBManager
+from tests.integration.test_api.test_creating_resource import create_resource
+
+
+async def test_resources_not_modified(
+    ac: AsyncClient,
+    recreate_tables: None,
+    create_resource: ResourceDTO,
+    db: DBManager,
+) -> None:
+    resp = await ac.get("/resources/")
+    assert resp.status_code == 200
+    etag = resp.headers["ETag"]
+
+    resp = await ac.get("/resources/", headers={"If-None-Match": etag})
+    assert resp.status_code == 304
+    assert resp.headers["ETag"] == etag
+    assert not resp.content
+
+    await db.session.execute(
+        update(Resource).values(next_check_at=func.now(), version=Resource.version)
+    )
+    await db.commit()
+    claimed = await db.resources.claim_due(limit=10, min_interval=60, max_interval=600, backoff=2)
+    await db.commit()
+    assert claimed
+
+    resp = await ac.get("/resources/", headers={"If-None-Match": etag})
+    assert resp.status_code == 304
+
+    await db.resources.edit(
+        ResourceUpdateDTO(state=ResourceState.DOWN),
+        resource_id=create_resource.resource_id,
+    )
+    await db.commit()
+
+    resp = await ac.get("/resources/", headers={"If-None-Match": etag})
+    assert resp.status_code == 200
+    assert resp.headers["ETag"] != etag
+    assert resp.json()["data"][0]["state"] == ResourceState.DOWN.value
+
+
+async def test_single_resource_not_modified(
+    ac: AsyncClient,
+    recreate_tables: None,
+    create_resource: ResourceDTO,
+) -> None:
+    resource_id = create_resource.resource_id
+    resp = await ac.get(f"/resources/{resource_id}")
+    assert resp.status_code == 200
+    etag = resp.headers["ETag"]
+
+    resp = await ac.get(f"/resources/{resource_id}", headers={"If-None-Match": f"W/{etag}"})
+    assert resp.status_code == 304
+
+    resp = await ac.get(f"/resources/{resource_id + 1}", headers={"If-None-Match": etag})
+    assert resp.status_code == 404
+
+
+async def test_statuses_not_modified(
+    ac: AsyncClient,
+    recreate_tables: None,
+    create_resource: ResourceDTO,
+    db: DBManager,
+) -> None:
+    resource_id = create_resource.resource_id
+    resp = await ac.get(f"/resources/{resource_id}/statuses")
+    assert resp.status_code == 200
+    etag = resp.headers["ETag"]
+
+    resp = await ac.get(f"/resources/{resource_id}/statuses", headers={"If-None-Match": etag})
+    assert resp.status_code == 304
+
+    await db.statuses.add(
+        ResourceStatusAddDTO(resource_id=resource_id, response_time=0.5, status_code=200)
+    )
+    await db.commit()
+
+    resp = await ac.get(f"/resources/{resource_id}/statuses", headers={"If-None-Match": etag})
+    assert resp.status_code == 200
+    assert len(resp.json()["data"]) == 1
@@ -0,0 +1,107 @@
+# ruff: noqa: F401 F811
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import update
+from taskiq.exceptions import SendTaskError
+
+from src.models.resoures import Resource
+from src.schemas.enums import ResourceState
+from src.schemas.resoures import ResourceAddDTO, ResourceDTO
+from src.tasks.broker import broker
+from src.tasks.dependencies import get_client
+from src.tasks.schedule import recover_pending_resources
+from src.tasks.worker import verify_resource
+from src.utils.db_tools import DBManager
+from src.utils.exceptions import VerificationNotQueuedHTTPError
+
+
+async def test_create_resource_async(
+    ac: AsyncClient,
+    recreate_tables: None,
+    init_taskiq: None,
+) -> None:
+    resp = await ac.post("/resources/?mode=async", json={"url": "https://example.com"})
+    assert resp.status_code == 202
+    resource = ResourceDTO.model_validate(resp.json()["data"])
+    assert resource.state == ResourceState.PENDING
+    assert resp.headers["Location"].endswith(f"/resources/{resource.resource_id}/verification")
+
+    # The in-memory broker runs the verification before the response is returned
+    resp = await ac.get(f"/resources/{resource.resource_id}/verification", params={"wait": 1})
+    assert resp.status_code == 200
+    assert resp.json()["data"]["state"] == ResourceState.UP.value
+
+
+async def test_create_resource_async_rejected(
+    ac: AsyncClient,
+    recreate_tables: None,
+    init_taskiq: None,
+    mock_aiohttp_server_error: AsyncMock,
+    db: DBManager,
+) -> None:
+    async def mock_get_client():
+        yield mock_aiohttp_server_error
+
+    broker.dependency_overrides[get_client] = mock_get_client
+    resp = await ac.post("/resources/?mode=async", json={"url": "https://example.com"})
+    assert resp.status_code == 202
+    resource_id = resp.json()["data"]["resource_id"]
+
+    resp = await ac.get(f"/resources/{resource_id}/verification")
+    assert resp.status_code == 200
+    assert resp.json()["data"]["state"] == ResourceState.REJECTED.value
+
+    # Rejected resources are not scheduled for checks and may be submitted again
+    assert await db.resources.claim_due(limit=10, min_interval=60, max_interval=60, backoff=1) == []
+    resp = await ac.post("/resources/?mode=async", json={"url": "https://example.com"})
+    assert resp.status_code == 202
+    assert resp.json()["data"]["resource_id"] != resource_id
+
+
+async def test_create_resource_async_not_queued(
+    monkeypatch: pytest.MonkeyPatch,
+    ac: AsyncClient,
+    recreate_tables: None,
+    db: DBManager,
+) -> None:
+    monkeypatch.setattr(verify_resource, "kiq", AsyncMock(side_effect=SendTaskError()))
+    resp = await ac.post("/resources/?mode=async", json={"url": "https://example.com"})
+    assert resp.status_code == 503
+    assert resp.json()["detail"] == VerificationNotQueuedHTTPError.detail
+    assert await db.resources.get_all() == []
+
+
+async def test_stuck_pending_resources_are_recovered(
+    recreate_tables: None,
+    init_taskiq: None,
+    db: DBManager,
+) -> None:
+    now = datetime.now(timezone.utc)
+    created_at = {
+        "https://stale.example.com": now - timedelta(minutes=10),
+        "https://hopeless.example.com": now - timedelta(minutes=40),
+        "https://fresh.example.com": now,
+    }
+    for url, created in created_at.items():
+        _, resource = await db.resources.get_one_or_add(
+            data=ResourceAddDTO(url=url),
+            state=ResourceState.PENDING,
+        )
+        await db.session.execute(
+            update(Resource)
+            .filter_by(resource_id=resource.resource_id)
+            .values(created_at=created)
+        )
+    await db.commit()
+
+    await recover_pending_resources.kiq()  # type: ignore[call-arg]
+
+    states = {resource.url: resource.state for resource in await db.resources.get_all()}
+    assert states == {
+        "https://stale.example.com": ResourceState.UP,
+        "https://hopeless.example.com": ResourceState.REJECTED,
+        "https://fresh.example.com": ResourceState.PENDING,
+    }
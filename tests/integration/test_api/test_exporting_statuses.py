@@ -0,0 +1,62 @@
+# ruff: noqa: F401 F811
+import csv
+import io
+
+import orjson
+from httpx import AsyncClient
+
+from src.schemas.resoures import ResourceDTO
+from src.utils.db_tools import DBManager
+from src.utils.exceptions import ResourceNotFoundHTTPError
+from tests.integration.test_api.test_creating_resource import create_resource
+from tests.integration.test_api.test_paginating_statuses import _seed_statuses
+
+
+async def test_export_statuses_ndjson(
+    ac: AsyncClient,
+    recreate_tables: None,
+    create_resource: ResourceDTO,
+    db: DBManager,
+) -> None:
+    await _seed_statuses(db, create_resource, 5)
+
+    resp = await ac.get(
+        f"/resources/{create_resource.resource_id}/statuses/export",
+        params={"format": "ndjson"},
+    )
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("application/x-ndjson")
+
+    rows = [orjson.loads(line) for line in resp.content.splitlines()]
+    assert len(rows) == 5
+    assert all(row["resource_id"] == create_resource.resource_id for row in rows)
+    assert [row["created_at"] for row in rows] == sorted(row["created_at"] for row in rows)
+
+
+async def test_export_statuses_csv(
+    ac: AsyncClient,
+    recreate_tables: None,
+    create_resource: ResourceDTO,
+    db: DBManager,
+) -> None:
+    await _seed_statuses(db, create_resource, 3)
+
+    resp = await ac.get(
+        f"/resources/{create_resource.resource_id}/statuses/export",
+        params={"format": "csv"},
+    )
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/csv")
+
+    rows = list(csv.DictReader(io.StringIO(resp.text)))
+    assert len(rows) == 3
+    assert {row["status_code"] for row in rows} == {"200"}
+
+
+async def test_export_statuses_unknown_resource(
+    ac: AsyncClient,
+    recreate_tables: None,
+) -> None:
+    resp = await ac.get("/resources/100/statuses/export")
+    assert resp.status_code == 404
+    assert resp.json()["detail"] == ResourceNotFoundHTTPError.detail
@@ -2,11 +2,14 @@
 from unittest.mock import AsyncMock
 
 from httpx import AsyncClient
+from sqlalchemy import func, update
 
+from src.models.resoures import Resource
 from src.schemas.resoures import ResourceDTO, ResourceStatusDTO
 from src.tasks.broker import broker
 from src.tasks.dependencies import get_client
 from src.tasks.schedule import check_resources
+from src.utils.db_tools import DBManager
 from src.utils.exceptions import ResourceNotFoundHTTPError, ValueOutOfRangeHTTPError
 from tests.integration.test_api.test_creating_resource import create_resource
 
@@ -17,6 +20,7 @@ async def test_get_statuses(
     init_taskiq: None,
     mock_aiohttp_timeout: AsyncMock,
     create_resource: ResourceDTO,
+    db: DBManager,
 ) -> None:
     await check_resources.kiq()  # type: ignore[call-arg]
     resource_id = create_resource.resource_id
@@ -37,6 +41,8 @@ async def test_get_statuses(
         yield mock_aiohttp_timeout
 
     broker.dependency_overrides[get_client] = mock_get_client
+    await db.session.execute(update(Resource).values(next_check_at=func.now()))
+    await db.commit()
     await check_resources.kiq()  # type: ignore[call-arg]
 
     resp = await ac.get(f"/resources/{resource_id}/statuses")
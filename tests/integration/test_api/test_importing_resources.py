@@ -0,0 +1,66 @@
+# ruff: noqa: F401 F811
+from httpx import AsyncClient
+
+from src.schemas.enums import ImportOutcome
+from src.schemas.resoures import ResourceDTO
+from src.utils.db_tools import DBManager
+from src.utils.exceptions import InvalidImportPayloadHTTPError
+from tests.integration.test_api.test_creating_resource import create_resource
+
+
+async def test_import_resources_json(
+    ac_mocked: AsyncClient,
+    recreate_tables: None,
+    create_resource: ResourceDTO,
+    db: DBManager,
+) -> None:
+    resp = await ac_mocked.post(
+        "/resources/bulk",
+        json=[
+            {"url": "https://example1.com"},
+            "https://example2.com",
+            {"url": "https://example1.com"},
+            {"url": create_resource.url},
+            {"url": "not a url"},
+        ],
+    )
+    assert resp.status_code == 200
+
+    outcomes = [item["outcome"] for item in resp.json()["data"]]
+    assert outcomes == [
+        ImportOutcome.CREATED.value,
+        ImportOutcome.CREATED.value,
+        ImportOutcome.DUPLICATE.value,
+        ImportOutcome.EXISTS.value,
+        ImportOutcome.INVALID.value,
+    ]
+
+    resources = await db.resources.get_all()
+    assert len(resources) == 3
+
+
+async def test_import_resources_ndjson(
+    ac_mocked: AsyncClient,
+    recreate_tables: None,
+    db: DBManager,
+) -> None:
+    content = b'{"url": "https://example1.com"}\n\n{"url": "https://example2.com"}'
+    resp = await ac_mocked.post(
+        "/resources/bulk",
+        content=content,
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+    assert resp.status_code == 200
+    assert all(item["outcome"] == ImportOutcome.CREATED.value for item in resp.json()["data"])
+
+    resources = await db.resources.get_all()
+    assert len(resources) == 2
+
+
+async def test_import_resources_invalid_payload(
+    ac_mocked: AsyncClient,
+    recreate_tables: None,
+) -> None:
+    resp = await ac_mocked.post("/resources/bulk", json={"url": "https://example.com"})
+    assert resp.status_code == 422
+    assert resp.json()["detail"] == InvalidImportPayloadHTTPError.detail
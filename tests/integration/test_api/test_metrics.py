@@ -0,0 +1,13 @@
+from httpx import AsyncClient
+
+from src.config import settings
+
+
+async def test_metrics_endpoint(ac: AsyncClient) -> None:
+    await ac.get("/resources/")
+
+    host = f"http://{settings.uvicorn.UVICORN_HOST}:{settings.uvicorn.UVICORN_PORT}"
+    resp = await ac.get(f"{host}/metrics")
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/plain")
+    assert 'http_request_seconds_count{method="GET",route="/api/v1/resources/"' in resp.text
@@ -0,0 +1,130 @@
+# ruff: noqa: F401 F811
+from datetime import datetime, timedelta, timezone
+
+from httpx import AsyncClient
+
+from src.schemas.resoures import ResourceDTO, ResourceStatusAddDTO, ResourceStatusDTO
+from src.utils.db_tools import DBManager
+from src.utils.exceptions import InvalidCursorHTTPError
+from tests.integration.test_api.test_creating_resource import create_resource
+
+
+async def _seed_statuses(db: DBManager, resource: ResourceDTO, count: int) -> datetime:
+    now = datetime.now(timezone.utc)
+    for idx in range(count):
+        await db.statuses.add(
+            ResourceStatusAddDTO(
+                resource_id=resource.resource_id,
+                response_time=1.0,
+                status_code=200,
+            ),
+            created_at=now - timedelta(minutes=idx),
+        )
+    await db.commit()
+    return now
+
+
+async def test_statuses_keyset_pagination(
+    ac: AsyncClient,
+    recreate_tables: None,
+    create_resource: ResourceDTO,
+    db: DBManager,
+) -> None:
+    await _seed_statuses(db, create_resource, 5)
+    url = f"/resources/{create_resource.resource_id}/statuses"
+
+    seen = []
+    cursor = None
+    for expected_size in (2, 2, 1):
+        params = {"limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        resp = await ac.get(url, params=params)
+        assert resp.status_code == 200
+
+        data = resp.json()
+        page = [ResourceStatusDTO.model_validate(st) for st in data["data"]]
+        assert len(page) == expected_size
+        seen.extend(page)
+        cursor = data["next_cursor"]
+
+    assert cursor is None
+    assert len({st.id for st in seen}) == 5
+    assert [st.created_at for st in seen] == sorted(
+        [st.created_at for st in seen],
+        reverse=True,
+    )
+
+
+async def test_statuses_time_range(
+    ac: AsyncClient,
+    recreate_tables: None,
+    create_resource: ResourceDTO,
+    db: DBManager,
+) -> None:
+    now = await _seed_statuses(db, create_resource, 5)
+
+    resp = await ac.get(
+        f"/resources/{create_resource.resource_id}/statuses",
+        params={
+            "from": (now - timedelta(minutes=2, seconds=30)).isoformat(),
+            "to": now.isoformat(),
+        },
+    )
+    assert resp.status_code == 200
+
+    data = resp.json()
+    assert len(data["data"]) == 2
+    assert data["next_cursor"] is None
+
+
+async def test_statuses_invalid_cursor(
+    ac: AsyncClient,
+    recreate_tables: None,
+    create_resource: ResourceDTO,
+) -> None:
+    resp = await ac.get(
+        f"/resources/{create_resource.resource_id}/statuses",
+        params={"cursor": "not-a-cursor"},
+    )
+    assert resp.status_code == InvalidCursorHTTPError.status
+
+    data = resp.json()
+    assert data["detail"] == InvalidCursorHTTPError.detail
+
+
+async def test_statuses_expand_runs(
+    ac: AsyncClient,
+    recreate_tables: None,
+    create_resource: ResourceDTO,
+    db: DBManager,
+) -> None:
+    now = datetime.now(timezone.utc)
+    await db.statuses.add(
+        ResourceStatusAddDTO(
+            resource_id=create_resource.resource_id,
+            response_time=1.0,
+            status_code=200,
+        ),
+        created_at=now - timedelta(minutes=2),
+        repeat_count=3,
+        last_seen_at=now,
+    )
+    await db.commit()
+    url = f"/resources/{create_resource.resource_id}/statuses"
+
+    resp = await ac.get(url)
+    assert resp.status_code == 200
+    data = resp.json()["data"]
+    assert len(data) == 1
+    assert data[0]["repeat_count"] == 3
+
+    resp = await ac.get(url, params={"expand": True})
+    assert resp.status_code == 200
+    page = [ResourceStatusDTO.model_validate(st) for st in resp.json()["data"]]
+    assert [st.repeat_count for st in page] == [1, 1, 1]
+    assert [st.created_at for st in page] == [
+        now,
+        now - timedelta(minutes=1),
+        now - timedelta(minutes=2),
+    ]
@@ -0,0 +1,100 @@
+# ruff: noqa: F401 F811
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import func, update
+
+from src.config import settings
+from src.models.resoures import ResourceStatus
+from src.schemas.enums import RollupResolution
+from src.schemas.resoures import ResourceDTO, ResourceStatusAddDTO
+from src.schemas.rollups import ResourceStatusRollupDTO
+from src.tasks.schedule import refresh_status_rollups
+from src.utils.db_tools import DBManager
+from tests.integration.test_api.test_creating_resource import create_resource
+
+
+async def test_taskiq_refreshes_rollups(
+    ac: AsyncClient,
+    recreate_tables: None,
+    init_taskiq: None,
+    create_resource: ResourceDTO,
+    db: DBManager,
+):
+    created_at = datetime.now(timezone.utc) - timedelta(minutes=5)
+    for status_code, response_time in ((200, 0.1), (200, 0.3), (500, 0.5), (403, 0.7)):
+        await db.statuses.add(
+            ResourceStatusAddDTO(
+                resource_id=create_resource.resource_id,
+                response_time=response_time,
+                status_code=status_code,
+            ),
+            created_at=created_at,
+        )
+    await db.commit()
+
+    await refresh_status_rollups.kiq()  # type: ignore[call-arg]
+    await db.watermarks.delete_all()
+    await db.commit()
+    await refresh_status_rollups.kiq()  # type: ignore[call-arg]
+
+    resp = await ac.get(
+        f"/resources/{create_resource.resource_id}/rollups",
+        params={"resolution": RollupResolution.MINUTE.value},
+    )
+    assert resp.status_code == 200
+
+    data = resp.json()
+    assert len(data["data"]) == 1
+
+    rollup = ResourceStatusRollupDTO.model_validate(data["data"][0])
+    assert rollup.count == 4
+    assert rollup.failure_count == 1
+    assert rollup.response_time_min == 0.1
+    assert rollup.response_time_max == 0.7
+    assert rollup.bucket_start <= created_at
+
+
+async def test_taskiq_rollups_follow_growing_runs(
+    monkeypatch: pytest.MonkeyPatch,
+    ac: AsyncClient,
+    recreate_tables: None,
+    init_taskiq: None,
+    create_resource: ResourceDTO,
+    db: DBManager,
+):
+    monkeypatch.setattr(settings.rollups, "LAG_SECONDS", 0)
+    created_at = datetime.now(timezone.utc) - timedelta(minutes=5)
+    status = await db.statuses.add(
+        ResourceStatusAddDTO(
+            resource_id=create_resource.resource_id,
+            response_time=0.1,
+            status_code=200,
+        ),
+        created_at=created_at,
+    )
+    await db.session.execute(
+        update(ResourceStatus)
+        .filter_by(resource_status_id=status.id)
+        .values(repeat_count=3, last_seen_at=created_at + timedelta(minutes=2))
+    )
+    await db.commit()
+    await refresh_status_rollups.kiq()  # type: ignore[call-arg]
+
+    # The run grows after the refresh, which moves its interpolated samples.
+    await db.session.execute(
+        update(ResourceStatus)
+        .filter_by(resource_status_id=status.id)
+        .values(repeat_count=6, last_seen_at=func.now())
+    )
+    await db.commit()
+    await refresh_status_rollups.kiq()  # type: ignore[call-arg]
+
+    for resolution in RollupResolution:
+        resp = await ac.get(
+            f"/resources/{create_resource.resource_id}/rollups",
+            params={"resolution": resolution.value},
+        )
+        assert resp.status_code == 200
+        assert sum(rollup["count"] for rollup in resp.json()["data"]) == 6
@@ -0,0 +1,63 @@
+# ruff: noqa: F401 F811
+from datetime import datetime, timedelta, timezone
+
+from httpx import AsyncClient
+
+from src.schemas.enums import SLAWindow
+from src.schemas.resoures import ResourceDTO, ResourceStatusAddDTO
+from src.schemas.sla import ResourceSLADTO
+from src.services.sla import sla_cache
+from src.tasks.schedule import refresh_sla, refresh_status_rollups
+from src.utils.db_tools import DBManager
+from tests.integration.test_api.test_creating_resource import create_resource
+
+
+async def test_taskiq_refreshes_sla(
+    ac: AsyncClient,
+    recreate_tables: None,
+    init_taskiq: None,
+    create_resource: ResourceDTO,
+    db: DBManager,
+):
+    sla_cache.clear()
+    resp = await ac.get(f"/resources/{create_resource.resource_id}/sla")
+    assert resp.status_code == 404
+
+    created_at = datetime.now(timezone.utc) - timedelta(hours=2)
+    for status_code in (200, 200, 200, 500):
+        await db.statuses.add(
+            ResourceStatusAddDTO(
+                resource_id=create_resource.resource_id,
+                response_time=0.5,
+                status_code=status_code,
+            ),
+            created_at=created_at,
+        )
+    await db.commit()
+
+    await refresh_status_rollups.kiq()  # type: ignore[call-arg]
+    await refresh_sla.kiq()  # type: ignore[call-arg]
+
+    resp = await ac.get(
+        f"/resources/{create_resource.resource_id}/sla",
+        params={"window": SLAWindow.WEEK.value},
+    )
+    assert resp.status_code == 200
+
+    sla = ResourceSLADTO.model_validate(resp.json()["data"])
+    assert sla.window == SLAWindow.WEEK
+    assert sla.checks == 4
+    assert sla.uptime_percent == 75
+    assert sla.incident_count == 1
+
+    resp = await ac.get("/resources/sla", params={"window": SLAWindow.WEEK.value})
+    assert resp.status_code == 200
+    assert len(resp.json()["data"]) == 1
+
+
+async def test_sla_for_missing_resource(
+    ac: AsyncClient,
+    recreate_tables: None,
+):
+    resp = await ac.get("/resources/100/sla")
+    assert resp.status_code == 404
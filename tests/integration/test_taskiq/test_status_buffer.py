@@ -0,0 +1,83 @@
+# ruff: noqa: F401 F811
+from src.db import sessionmaker_null_pool
+from src.schemas.resoures import ResourceDTO, ResourceStatusAddDTO
+from src.utils.db_tools import DBManager
+from src.utils.status_buffer import StatusWriteBuffer
+from tests.integration.test_api.test_creating_resource import create_resource
+
+
+def _make_status(resource: ResourceDTO) -> ResourceStatusAddDTO:
+    return ResourceStatusAddDTO(
+        resource_id=resource.resource_id,
+        response_time=1.0,
+        status_code=200,
+    )
+
+
+async def test_buffer_flushes_on_size_threshold(
+    recreate_tables: None,
+    create_resource: ResourceDTO,
+    db: DBManager,
+):
+    buffer = StatusWriteBuffer(
+        session_factory=sessionmaker_null_pool,
+        max_size=2,
+        flush_interval=60,
+    )
+
+    await buffer.put(_make_status(create_resource))
+    assert len(buffer) == 1
+    statuses = await db.statuses.get_all()
+    assert len(statuses) == 0
+
+    await buffer.put(_make_status(create_resource))
+    assert len(buffer) == 0
+    statuses = await db.statuses.get_all()
+    assert len(statuses) == 2
+
+
+async def test_buffer_flushes_on_stop(
+    recreate_tables: None,
+    create_resource: ResourceDTO,
+    db: DBManager,
+):
+    buffer = StatusWriteBuffer(
+        session_factory=sessionmaker_null_pool,
+        max_size=100,
+        flush_interval=60,
+    )
+    await buffer.start()
+
+    await buffer.put(_make_status(create_resource))
+    await buffer.stop()
+
+    assert len(buffer) == 0
+    statuses = await db.statuses.get_all_filtered(resource_id=create_resource.resource_id)
+    assert len(statuses) == 1
+
+
+async def test_buffer_folds_identical_statuses_into_runs(
+    recreate_tables: None,
+    create_resource: ResourceDTO,
+    db: DBManager,
+):
+    buffer = StatusWriteBuffer(
+        session_factory=sessionmaker_null_pool,
+        max_size=100,
+        flush_interval=60,
+        max_run_seconds=3600,
+    )
+
+    for _ in range(3):
+        await buffer.put(_make_status(create_resource))
+    await buffer.put(
+        ResourceStatusAddDTO(
+            resource_id=create_resource.resource_id,
+            response_time=1.0,
+            status_code=500,
+        )
+    )
+    assert await buffer.flush() == 4
+
+    statuses = await db.statuses.get_all_filtered(resource_id=create_resource.resource_id)
+    assert sorted((st.status_code, st.repeat_count) for st in statuses) == [(200, 3), (500, 1)]
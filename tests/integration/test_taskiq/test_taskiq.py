@@ -1,18 +1,26 @@
 # ruff: noqa: F401 F811
+import math
 from datetime import datetime, timedelta, timezone
 from unittest.mock import AsyncMock
 
 import pytest
+from sqlalchemy import select
 
 from schemas.base import TimingDTO
 from src.config import settings
+from src.models.resoures import Resource
 from src.schemas.enums import ResourceState
-from src.schemas.resoures import ResourceDTO, ResourceStatusAddDTO
+from src.schemas.resoures import ResourceCheckDTO, ResourceDTO, ResourceStatusAddDTO
 from src.tasks.broker import broker
 from src.tasks.dependencies import get_client
-from src.tasks.schedule import check_resources, delete_unrelevant_statuses
-from src.tasks.worker import check_single_resource
+from src.tasks.schedule import (
+    check_resources,
+    delete_unrelevant_statuses,
+    maintain_status_partitions,
+)
+from src.tasks.worker import check_resource_batch, check_single_resource
 from src.utils.db_tools import DBManager
+from src.utils.partitions import get_partition_name, get_partition_start, get_partition_step
 from tests.integration.test_api.test_creating_resource import create_resource, create_resource_bulk
 
 
@@ -143,3 +151,135 @@ async def test_taskiq_deletes_unrelevant_statuses(
 
     status = await db.statuses.get_one_or_none(resource_id=create_resource.resource_id)
     assert status is None
+
+
+async def test_taskiq_check_resource_batch(
+    recreate_tables: None,
+    init_taskiq: None,
+    mock_aiohttp_timeout: AsyncMock,
+    create_resource_bulk: list[ResourceDTO],
+    db: DBManager,
+):
+    async def mock_get_client():
+        yield mock_aiohttp_timeout
+
+    broker.dependency_overrides[get_client] = mock_get_client
+    await check_resource_batch.kiq(  # type: ignore[call-arg]
+        batch=[
+            ResourceCheckDTO(
+                resource_id=resource.resource_id,
+                url=str(resource.url),
+                state=resource.state,
+            )
+            for resource in create_resource_bulk
+        ],
+    )
+
+    resources = await db.resources.get_all()
+    assert len(resources) == len(create_resource_bulk)
+    assert all([res.state == ResourceState.DOWN for res in resources])
+
+    statuses = await db.statuses.get_all_filtered(status_code=408)
+    assert len(statuses) == len(create_resource_bulk)
+
+
+async def test_taskiq_maintains_status_partitions(
+    recreate_tables: None,
+    init_taskiq: None,
+    db: DBManager,
+):
+    interval = settings.status_partitions.INTERVAL
+    step = get_partition_step(interval)
+    now = datetime.now(timezone.utc)
+    expired_start = get_partition_start(
+        now - timedelta(hours=settings.taskiq.UNRELEVANT_STATUS_HOURS) - step * 2,
+        interval,
+    )
+    expired_name = get_partition_name("resource_status", expired_start, interval)
+    await db.statuses.create_partition(
+        name=expired_name,
+        start=expired_start,
+        end=expired_start + step,
+    )
+    await db.commit()
+
+    await maintain_status_partitions.kiq()  # type: ignore[call-arg]
+
+    partitions = await db.statuses.get_partitions()
+    assert "resource_status_default" in partitions
+    assert expired_name not in partitions
+    assert get_partition_name("resource_status", get_partition_start(now, interval), interval) in (
+        partitions
+    )
+    future_start = get_partition_start(now + step * settings.status_partitions.PREMAKE, interval)
+    assert get_partition_name("resource_status", future_start, interval) in partitions
+
+
+async def test_taskiq_keeps_relevant_statuses(
+    recreate_tables: None,
+    init_taskiq: None,
+    create_resource: ResourceDTO,
+    db: DBManager,
+):
+    passed_datetime = datetime.now(timezone.utc) - timedelta(
+        hours=settings.taskiq.UNRELEVANT_STATUS_HOURS + 1
+    )
+    obj = ResourceStatusAddDTO(
+        resource_id=create_resource.resource_id, status_code=200, response_time=1
+    )
+
+    unrelevant_status = await db.statuses.add(obj, created_at=passed_datetime)
+    relevant_status = await db.statuses.add(obj)
+    await db.commit()
+
+    await delete_unrelevant_statuses.kiq()  # type: ignore[call-arg]
+
+    statuses = await db.statuses.get_all_filtered(resource_id=create_resource.resource_id)
+    assert [st.id for st in statuses] == [relevant_status.id]
+    assert unrelevant_status.id != relevant_status.id
+
+
+async def test_taskiq_checks_only_due_resources(
+    recreate_tables: None,
+    init_taskiq: None,
+    create_resource_bulk: list[ResourceDTO],
+    db: DBManager,
+):
+    await check_resources.kiq()  # type: ignore[call-arg]
+    statuses = await db.statuses.get_all()
+    assert len(statuses) == len(create_resource_bulk)
+
+    resources = (await db.session.execute(select(Resource))).scalars().all()
+    min_interval = settings.taskiq.CHECK_INTERVAL_MIN
+    expected_interval = min(
+        settings.taskiq.CHECK_INTERVAL_MAX,
+        math.ceil(min_interval * settings.taskiq.CHECK_INTERVAL_BACKOFF),
+    )
+    assert all(res.check_interval == expected_interval for res in resources)
+    assert all(res.next_check_at > datetime.now(timezone.utc) for res in resources)
+
+    await check_resources.kiq()  # type: ignore[call-arg]
+    statuses = await db.statuses.get_all()
+    assert len(statuses) == len(create_resource_bulk)
+
+
+async def test_taskiq_schedules_delayed_batches(
+    monkeypatch: pytest.MonkeyPatch,
+    recreate_tables: None,
+    init_taskiq: None,
+    create_resource_bulk: list[ResourceDTO],
+    db: DBManager,
+):
+    source = AsyncMock()
+    monkeypatch.setattr("src.services.resources.dispatch_source", source)
+    monkeypatch.setattr(settings.taskiq, "DISPATCH_WINDOW_SECONDS", 60)
+    monkeypatch.setattr(settings.taskiq, "CHECK_BATCH_SIZE", 1)
+    started = datetime.now(timezone.utc)
+
+    await check_resources.kiq()  # type: ignore[call-arg]
+
+    scheduled = [call.args[0] for call in source.add_schedule.await_args_list]
+    statuses = await db.statuses.get_all()
+    assert len(scheduled) + len(statuses) == len(create_resource_bulk)
+    assert scheduled
+    assert all(started < task.time <= started + timedelta(seconds=60) for task in scheduled)
@@ -0,0 +1,36 @@
+import pytest
+
+from src.utils.bulk_import import is_ndjson, parse_json_items, read_ndjson_items
+from src.utils.exceptions import ImportTooLargeError, InvalidImportPayloadError
+
+
+async def _chunks(*chunks: bytes):
+    for chunk in chunks:
+        yield chunk
+
+
+async def test_ndjson_lines_split_across_chunks():
+    items = await read_ndjson_items(
+        _chunks(b'{"url": "https://a.com"}\n{"url": "ht', b'tps://b.com"}\n\n"https://c.com"'),
+        max_items=10,
+    )
+    assert items == [{"url": "https://a.com"}, {"url": "https://b.com"}, "https://c.com"]
+
+
+async def test_ndjson_rejects_too_many_items():
+    with pytest.raises(ImportTooLargeError):
+        await read_ndjson_items(_chunks(b'"a"\n"b"\n"c"\n'), max_items=2)
+
+
+def test_json_items_must_be_a_list():
+    assert parse_json_items(b'["https://a.com"]', max_items=1) == ["https://a.com"]
+    with pytest.raises(InvalidImportPayloadError):
+        parse_json_items(b'{"url": "https://a.com"}', max_items=1)
+    with pytest.raises(ImportTooLargeError):
+        parse_json_items(b'["a", "b"]', max_items=1)
+
+
+def test_is_ndjson():
+    assert is_ndjson("application/x-ndjson; charset=utf-8")
+    assert not is_ndjson("application/json")
+    assert not is_ndjson(None)
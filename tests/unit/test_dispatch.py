@@ -0,0 +1,19 @@
+from src.utils.dispatch import get_phase_offset
+
+
+def test_phase_offset_is_stable_and_within_window():
+    offsets = [get_phase_offset(resource_id, 60) for resource_id in range(1, 1001)]
+    assert offsets == [get_phase_offset(resource_id, 60) for resource_id in range(1, 1001)]
+    assert all(0 <= offset < 60 for offset in offsets)
+
+
+def test_phase_offsets_are_spread_across_window():
+    offsets = [get_phase_offset(resource_id, 60) for resource_id in range(1, 1201)]
+    per_slot = [0] * 6
+    for offset in offsets:
+        per_slot[int(offset // 10)] += 1
+    assert max(per_slot) - min(per_slot) < 100
+
+
+def test_zero_window_dispatches_immediately():
+    assert get_phase_offset(42, 0) == 0
@@ -0,0 +1,34 @@
+from types import SimpleNamespace
+
+from src.utils.http_client import ProbeTimings, create_trace_config
+
+
+async def _fire(signal, ctx: SimpleNamespace) -> None:
+    for callback in signal:
+        await callback(None, ctx, None)
+
+
+async def test_trace_config_records_phase_timings():
+    trace_config = create_trace_config()
+    timings = ProbeTimings()
+    ctx = SimpleNamespace(trace_request_ctx=timings)
+
+    await _fire(trace_config.on_request_start, ctx)
+    await _fire(trace_config.on_connection_create_start, ctx)
+    await _fire(trace_config.on_dns_resolvehost_start, ctx)
+    await _fire(trace_config.on_dns_resolvehost_end, ctx)
+    await _fire(trace_config.on_connection_create_end, ctx)
+    await _fire(trace_config.on_request_end, ctx)
+
+    assert timings.dns_time is not None and timings.dns_time >= 0
+    assert timings.connect_time is not None and timings.connect_time >= 0
+    assert timings.ttfb is not None
+    assert timings.ttfb >= timings.dns_time + timings.connect_time
+    assert timings.overhead > 0
+
+
+async def test_trace_config_ignores_untraced_requests():
+    trace_config = create_trace_config()
+    ctx = SimpleNamespace(trace_request_ctx=None)
+    await _fire(trace_config.on_request_start, ctx)
+    await _fire(trace_config.on_request_end, ctx)
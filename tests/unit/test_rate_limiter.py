@@ -0,0 +1,44 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.config import RateLimitConfig
+from src.utils import rate_limiter
+from src.utils.rate_limiter import HostRateLimiter
+
+
+def _patch_script(monkeypatch: pytest.MonkeyPatch, result: bytes) -> AsyncMock:
+    script = AsyncMock(return_value=result)
+    redis = MagicMock()
+    redis.register_script.return_value = script
+    script.registered_client = redis
+    monkeypatch.setattr(rate_limiter, "get_redis", lambda: redis)
+    return script
+
+
+async def test_limiter_uses_host_rate(monkeypatch: pytest.MonkeyPatch):
+    script = _patch_script(monkeypatch, b"0")
+    limiter = HostRateLimiter(RateLimitConfig(HOST_RATES={"api.example.com": 0.5}))
+
+    assert await limiter.acquire("https://api.example.com/health")
+    kwargs = script.await_args.kwargs
+    assert kwargs["keys"] == ["ratelimit:api.example.com"]
+    assert kwargs["args"][0] == 0.5
+
+
+async def test_limiter_skips_when_bucket_is_empty(monkeypatch: pytest.MonkeyPatch):
+    script = _patch_script(monkeypatch, b"-1")
+    limiter = HostRateLimiter(RateLimitConfig(MODE="skip"))
+
+    assert not await limiter.acquire("https://example.com")
+    assert script.await_args.kwargs["args"][2] == 0
+
+
+async def test_limiter_registers_script_once(monkeypatch: pytest.MonkeyPatch):
+    script = _patch_script(monkeypatch, b"0")
+    limiter = HostRateLimiter(RateLimitConfig())
+
+    assert await limiter.acquire("https://example.com")
+    assert await limiter.acquire("https://example.org")
+    assert script.await_count == 2
+    rate_limiter.get_redis().register_script.assert_called_once()
@@ -0,0 +1,48 @@
+from unittest.mock import AsyncMock
+
+import pytest
+from redis.exceptions import ConnectionError
+
+from src.utils import redis_cache
+from src.utils.redis_cache import RedisCache
+
+
+class FakeRedis:
+    def __init__(self) -> None:
+        self.data: dict[str, bytes | int] = {}
+
+    async def get(self, key: str):
+        return self.data.get(key)
+
+    async def set(self, key: str, value: bytes, ex: int | None = None):
+        self.data[key] = value
+
+
+@pytest.fixture()
+def fake_redis(monkeypatch: pytest.MonkeyPatch) -> FakeRedis:
+    fake = FakeRedis()
+    monkeypatch.setattr(redis_cache, "get_redis", lambda: fake)
+    return fake
+
+
+async def test_cache_serves_payload_per_versioned_name(fake_redis: FakeRedis):
+    cache = RedisCache(namespace="test", ttl=60)
+    factory = AsyncMock(side_effect=[b"first", b"second"])
+
+    assert await cache.get_or_set("key:v1", factory) == b"first"
+    assert await cache.get_or_set("key:v1", factory) == b"first"
+    assert factory.await_count == 1
+
+    assert await cache.get_or_set("key:v2", factory) == b"second"
+    assert factory.await_count == 2
+
+
+async def test_cache_falls_back_when_redis_is_down(monkeypatch: pytest.MonkeyPatch):
+    broken = AsyncMock()
+    broken.get.side_effect = ConnectionError()
+    monkeypatch.setattr(redis_cache, "get_redis", lambda: broken)
+
+    cache = RedisCache(namespace="test", ttl=60)
+    factory = AsyncMock(return_value=b"payload")
+    assert await cache.get_or_set("key", factory) == b"payload"
+    factory.assert_awaited_once()
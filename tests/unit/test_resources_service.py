@@ -1,12 +1,25 @@
 # ruff: noqa: F401 F811
+import asyncio
+from datetime import datetime, timedelta, timezone
 from unittest.mock import AsyncMock
 
+import aiohttp
 import pytest
+from sqlalchemy import select
 
-from src.schemas.resoures import ResourceDTO
-from src.services.resources import ResourceService
+from src.models.resoures import Resource
+
+from src.schemas.enums import ImportOutcome, ProbeMethod, ResourceState
+from src.schemas.resoures import ResourceCheckDTO, ResourceDTO
+from src.services.resources import ResourceService, host_rate_limiter
 from src.utils.db_tools import DBManager
-from tests.integration.test_api.test_creating_resource import create_resource
+from src.utils.statuses import (
+    PROBE_CLIENT_ERROR,
+    PROBE_CONNECT_TIMEOUT,
+    PROBE_READ_TIMEOUT,
+    PROBE_TOTAL_TIMEOUT,
+)
+from tests.integration.test_api.test_creating_resource import create_resource, create_resource_bulk
 
 
 async def test_raises_key_error_witout_supplied_state(
@@ -22,3 +35,198 @@ async def test_raises_key_error_witout_supplied_state(
             url=str(create_resource.url),
             client=mock_aiohttp_success,
         )
+
+
+async def test_transition_and_status_written_together(
+    recreate_tables: None,
+    db: DBManager,
+    create_resource: ResourceDTO,
+    mock_aiohttp_server_error: AsyncMock,
+):
+    service = ResourceService(db)
+    await service.make_request_to_resource(
+        resource_id=create_resource.resource_id,
+        url=str(create_resource.url),
+        client=mock_aiohttp_server_error,
+        state=ResourceState.UP,
+    )
+
+    resource = await db.resources.get_one(resource_id=create_resource.resource_id)
+    assert resource.state == ResourceState.DOWN
+    statuses = await db.statuses.get_all()
+    assert len(statuses) == 1
+
+
+async def test_stale_transition_is_skipped(
+    recreate_tables: None,
+    db: DBManager,
+    create_resource: ResourceDTO,
+    mock_aiohttp_success: AsyncMock,
+):
+    service = ResourceService(db)
+    await service.make_request_to_resource(
+        resource_id=create_resource.resource_id,
+        url=str(create_resource.url),
+        client=mock_aiohttp_success,
+        state=ResourceState.DOWN,
+    )
+
+    resource = await db.resources.get_one(resource_id=create_resource.resource_id)
+    assert resource.state == ResourceState.UP
+    statuses = await db.statuses.get_all()
+    assert len(statuses) == 1
+
+
+@pytest.mark.parametrize(
+    "error, status_code",
+    [
+        (aiohttp.ConnectionTimeoutError(), PROBE_CONNECT_TIMEOUT),
+        (aiohttp.SocketTimeoutError(), PROBE_READ_TIMEOUT),
+        (asyncio.TimeoutError(), PROBE_TOTAL_TIMEOUT),
+    ],
+)
+async def test_probe_records_timeouts_separately(
+    db: DBManager,
+    error: Exception,
+    status_code: int,
+):
+    client = AsyncMock(spec=aiohttp.ClientSession)
+    client.request.side_effect = error
+
+    response = await ResourceService(db).probe_resource(
+        url="https://example.com",
+        resource_id=1,
+        client=client,
+    )
+    assert response.status_code == status_code
+
+
+async def test_probe_falls_back_to_get_when_head_is_not_allowed(db: DBManager):
+    def make_response(status_code: int) -> AsyncMock:
+        response = AsyncMock()
+        response.status = status_code
+        response.raise_for_status = lambda: None
+        response.content.read = AsyncMock(return_value=b"")
+        cm = AsyncMock()
+        cm.__aenter__.return_value = response
+        return cm
+
+    client = AsyncMock(spec=aiohttp.ClientSession)
+    client.request.side_effect = [make_response(405), make_response(200)]
+
+    response = await ResourceService(db).probe_resource(
+        url="https://example.com",
+        resource_id=1,
+        client=client,
+        method=ProbeMethod.HEAD,
+    )
+    assert response.status_code == 200
+    methods = [call.kwargs["method"] for call in client.request.call_args_list]
+    assert methods == ["HEAD", "GET"]
+
+
+async def test_batch_isolates_client_errors(
+    recreate_tables: None,
+    db: DBManager,
+    create_resource_bulk: list[ResourceDTO],
+    mock_aiohttp_success: AsyncMock,
+):
+    broken_url = str(create_resource_bulk[0].url)
+    success = mock_aiohttp_success.request.return_value
+
+    def request(*args, **kwargs):
+        if kwargs["url"] == broken_url:
+            raise aiohttp.ServerDisconnectedError()
+        return success
+
+    client = AsyncMock(spec=aiohttp.ClientSession)
+    client.request.side_effect = request
+
+    responses = await ResourceService(db).check_resource_batch(
+        batch=[
+            ResourceCheckDTO(
+                resource_id=resource.resource_id,
+                url=str(resource.url),
+                state=resource.state,
+            )
+            for resource in create_resource_bulk
+        ],
+        client=client,
+    )
+
+    codes = {response.resource_id: response.status_code for response in responses}
+    assert codes[create_resource_bulk[0].resource_id] == PROBE_CLIENT_ERROR
+    assert [codes[resource.resource_id] for resource in create_resource_bulk[1:]] == [200, 200]
+    statuses = await db.statuses.get_all()
+    assert len(statuses) == len(create_resource_bulk)
+
+
+async def test_import_reports_client_errors_as_unavailable(
+    recreate_tables: None,
+    db: DBManager,
+    mock_aiohttp_success: AsyncMock,
+):
+    broken_url = "https://broken.example.com"
+    success = mock_aiohttp_success.request.return_value
+
+    def request(*args, **kwargs):
+        if kwargs["url"] == broken_url:
+            raise aiohttp.ServerDisconnectedError()
+        return success
+
+    client = AsyncMock(spec=aiohttp.ClientSession)
+    client.request.side_effect = request
+
+    results = await ResourceService(db).import_resources(
+        items=[broken_url, "https://example.com"],
+        client=client,
+    )
+
+    assert [(result.outcome, result.status_code) for result in results] == [
+        (ImportOutcome.UNAVAILABLE, PROBE_CLIENT_ERROR),
+        (ImportOutcome.CREATED, 200),
+    ]
+    resources = await db.resources.get_all()
+    assert [resource.url for resource in resources] == ["https://example.com"]
+
+
+async def test_batch_reschedules_throttled_checks(
+    monkeypatch: pytest.MonkeyPatch,
+    recreate_tables: None,
+    db: DBManager,
+    create_resource_bulk: list[ResourceDTO],
+    mock_aiohttp_success: AsyncMock,
+):
+    throttled_url = str(create_resource_bulk[0].url)
+    monkeypatch.setattr(
+        host_rate_limiter,
+        "acquire",
+        AsyncMock(side_effect=lambda url: url != throttled_url),
+    )
+    claimed = await db.resources.claim_due(
+        limit=10, min_interval=900, max_interval=900, backoff=15
+    )
+    await db.commit()
+    assert len(claimed) == len(create_resource_bulk)
+
+    responses = await ResourceService(db).check_resource_batch(
+        batch=[
+            ResourceCheckDTO(
+                resource_id=resource.resource_id,
+                url=str(resource.url),
+                state=resource.state,
+            )
+            for resource in create_resource_bulk
+        ],
+        client=mock_aiohttp_success,
+    )
+
+    assert len(responses) == len(create_resource_bulk) - 1
+    next_checks = dict(
+        (await db.session.execute(select(Resource.resource_id, Resource.next_check_at))).all()
+    )
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=60)
+    assert next_checks[create_resource_bulk[0].resource_id] < retry_at
+    assert all(
+        next_checks[resource.resource_id] > retry_at for resource in create_resource_bulk[1:]
+    )
@@ -0,0 +1,27 @@
+from unittest.mock import MagicMock
+
+from src.schemas.resoures import ResourceStatusAddDTO
+from src.utils.status_buffer import StatusWriteBuffer
+
+
+def _make_status(resource_id: int) -> ResourceStatusAddDTO:
+    return ResourceStatusAddDTO(
+        resource_id=resource_id,
+        response_time=1.0,
+        status_code=200,
+    )
+
+
+async def test_buffer_drops_oldest_statuses_over_max_pending():
+    buffer = StatusWriteBuffer(
+        session_factory=MagicMock(),
+        max_size=100,
+        flush_interval=60,
+        max_pending=3,
+    )
+
+    for resource_id in range(5):
+        await buffer.put(_make_status(resource_id))
+
+    assert len(buffer) == 3
+    assert [item.resource_id for item in buffer._items] == [2, 3, 4]
@@ -0,0 +1,55 @@
+import asyncio
+
+import pytest
+
+from src.config import StatusFeedConfig
+from src.utils.status_feed import HEARTBEAT, StatusFeedHub
+
+
+@pytest.fixture()
+async def hub(monkeypatch: pytest.MonkeyPatch):
+    async def listen_forever() -> None:
+        await asyncio.Event().wait()
+
+    hub = StatusFeedHub(config=StatusFeedConfig(QUEUE_SIZE=2, HEARTBEAT_INTERVAL=0.05))
+    monkeypatch.setattr(hub, "_listen", listen_forever)
+    yield hub
+    await hub.stop()
+
+
+async def test_hub_fans_out_to_every_subscriber(hub: StatusFeedHub):
+    first = hub.subscribe()
+    second = hub.subscribe()
+
+    hub.broadcast(b'[{"resource_id":1}]')
+
+    assert first.get_nowait() == b'[{"resource_id":1}]'
+    assert second.get_nowait() == b'[{"resource_id":1}]'
+
+
+async def test_hub_drops_slow_subscriber(hub: StatusFeedHub):
+    slow = hub.subscribe()
+    fast = hub.subscribe()
+
+    for idx in range(2):
+        hub.broadcast(str(idx).encode())
+        fast.get_nowait()
+    hub.broadcast(b"2")
+
+    assert len(hub) == 1
+    events = [chunk async for chunk in hub.iter_events(slow)]
+    assert events[-1] == b"event: statuses\ndata: 1\n\n"
+    assert fast.get_nowait() == b"2"
+
+
+async def test_iter_events_sends_heartbeat(hub: StatusFeedHub):
+    queue = hub.subscribe()
+    events = hub.iter_events(queue)
+
+    assert (await anext(events)).startswith(b"retry:")
+    assert await anext(events) == HEARTBEAT
+
+    hub.broadcast(b"[]")
+    assert await anext(events) == b"event: statuses\ndata: []\n\n"
+    await events.aclose()
+    assert len(hub) == 0